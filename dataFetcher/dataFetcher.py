@@ -4,14 +4,24 @@ Automated data pipeline: Kaggle → S3 (or local directory)
 """
 
 import os
-import shutil
+import sys
+import hashlib
 import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from boto3.s3.transfer import TransferConfig
+from boto3.exceptions import S3UploadFailedError
 from botocore.exceptions import ClientError
 
+from downloadCache import DownloadCache, KaggleSource, LocalDirectorySource
+from streamingUpload import COMPRESSION_SUFFIXES, compressor, stream_upload
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'pipelineMetrics'))
+from stageMetrics import StageMetrics  # noqa: E402
+
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
@@ -26,16 +36,29 @@ class DataFetcher:
         "DescriptionDataCoSupplyChain.csv",
         "tokenized_access_logs.csv"
     ]
+    CHECKSUM_METADATA_KEY = "sha256"
+    HASH_BLOCK_SIZE = 8 * 1024 * 1024
+    DELETE_BATCH_SIZE = 1000  # DeleteObjects limit
+    DELETE_WORKERS = 8
+    STREAM_BLOCK_SIZE = 1024 * 1024
+    STREAM_MAX_BLOCKS = 16  # Source data buffered ahead of the uploader per file
     
-    def __init__(self, bucket_name=None, local_cache="cache"):
+    def __init__(self, bucket_name=None, local_cache="cache", s3_client=None,
+                 multipart_chunksize_mb=16, max_concurrency=8, max_workers=3, source=None):
         self.bucket_name = bucket_name or self.BUCKET_NAME
         self.local_cache = Path(local_cache).resolve()
-        self.local_cache.mkdir(parents=True, exist_ok=True)
-        self.s3_client = boto3.client('s3')
-    
-    def _validate_kaggle_token(self):
-        if not os.environ.get('KAGGLE_API_TOKEN'):
-            raise EnvironmentError("KAGGLE_API_TOKEN environment variable not set")
+        self.cache = DownloadCache(self.local_cache)
+        self.source = source or KaggleSource(self.DATASET_NAME)
+        self.s3_client = s3_client or boto3.client('s3')
+        self.max_workers = max_workers
+        chunksize = multipart_chunksize_mb * 1024 * 1024
+        self.transfer_config = TransferConfig(
+            multipart_threshold=chunksize,
+            multipart_chunksize=chunksize,
+            max_concurrency=max_concurrency
+        )
+        # Per-stage time and bytes (download, copy, clean, upload) since the last run()
+        self.metrics = StageMetrics('dataFetcher')
     
     def _ensure_bucket(self):
         try:
@@ -49,87 +72,293 @@ class DataFetcher:
                 self.s3_client.create_bucket(Bucket=self.bucket_name, **config)
     
     def download_dataset(self):
-        """Download dataset from Kaggle to local cache"""
-        self._validate_kaggle_token()
+        """Fetch the dataset from the source into the local cache.
         
-        try:
-            import kagglehub
-        except ImportError:
-            raise ImportError("kagglehub not installed: pip install kagglehub")
+        Files whose size and mtime match the cache manifest are not read
+        again; changed files are stored by content hash and exposed in the
+        cache directory by hardlink. Returns {filename: status}.
+        """
+        with self.metrics.stage('download') as stage:
+            source_dir = self.source.fetch()
+            
+            result = {}
+            for filename in self.REQUIRED_FILES:
+                src = Path(source_dir) / filename
+                if not src.exists():
+                    result[filename] = 'missing'
+                    continue
+                result[filename] = self.cache.add(src)
+                self.cache.export(filename, self.local_cache / filename)
+                if result[filename] != 'unchanged':
+                    stage.add(bytes=self.cache.entry(filename)['size'])
+            self.cache.prune()
+            stage.files = [{'file': filename, 'status': status} for filename, status in result.items()]
         
-        cache_path = kagglehub.dataset_download(self.DATASET_NAME)
+        return result
+    
+    def _stream_digests(self, stream):
+        """Return (sha256, md5) hex digests of a binary stream in one pass"""
+        sha256 = hashlib.sha256()
+        md5 = hashlib.md5()
+        for block in iter(lambda: stream.read(self.HASH_BLOCK_SIZE), b''):
+            sha256.update(block)
+            md5.update(block)
+        return sha256.hexdigest(), md5.hexdigest()
+    
+    def _file_digests(self, path):
+        """Return (sha256, md5) hex digests of a local file in one pass"""
+        with open(path, 'rb') as f:
+            return self._stream_digests(f)
+    
+    def _is_unchanged(self, s3_key, sha256, md5):
+        """Check whether the object at s3_key already holds this content"""
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
         
-        for filename in self.REQUIRED_FILES:
-            src = Path(cache_path) / filename
-            dst = self.local_cache / filename
-            if src.exists():
-                shutil.copy2(src, dst)
+        stored = head.get('Metadata', {}).get(self.CHECKSUM_METADATA_KEY)
+        if stored:
+            return stored == sha256
+        # Objects uploaded without checksum metadata: a single-part ETag is the MD5
+        etag = head.get('ETag', '').strip('"')
+        return '-' not in etag and etag == md5
+    
+    def _upload_file(self, local_path, s3_key, skip_unchanged):
+        """Upload one file; returns 'uploaded' or 'skipped'"""
+        sha256, md5 = self._file_digests(local_path)
+        if skip_unchanged and self._is_unchanged(s3_key, sha256, md5):
+            return 'skipped'
         
-        return True
+        self.s3_client.upload_file(
+            str(local_path),
+            self.bucket_name,
+            s3_key,
+            ExtraArgs={
+                'ServerSideEncryption': 'AES256',
+                'Metadata': {self.CHECKSUM_METADATA_KEY: sha256}
+            },
+            Config=self.transfer_config
+        )
+        return 'uploaded'
     
-    def upload_to_s3(self, prefix="raw"):
-        """Upload files to S3"""
-        self._ensure_bucket()
+    def _upload_files(self, files, skip_unchanged):
+        """Upload {s3_key: local_path} concurrently"""
+        with self.metrics.stage('upload') as stage:
+            self._ensure_bucket()
+            
+            result = {'uploaded': [], 'skipped': [], 'failed': {}}
+            stage.files = []
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    s3_key: executor.submit(self._upload_file, local_path, s3_key, skip_unchanged)
+                    for s3_key, local_path in files.items()
+                }
+                for s3_key, future in futures.items():
+                    try:
+                        status = future.result()
+                    except (ClientError, S3UploadFailedError) as e:
+                        result['failed'][s3_key] = str(e)
+                        stage.files.append({'key': s3_key, 'status': 'failed', 'error': str(e)})
+                        continue
+                    result[status].append(s3_key)
+                    size = files[s3_key].stat().st_size
+                    if status == 'uploaded':
+                        stage.add(bytes=size)
+                    stage.files.append({'key': s3_key, 'status': status, 'bytes': size})
+            stage.extra.update({key: len(result[key]) for key in ('uploaded', 'skipped', 'failed')})
         
-        uploaded = []
+        return result
+    
+    def upload_to_s3(self, prefix="raw", skip_unchanged=True):
+        """Upload files to S3 concurrently, skipping objects whose content is unchanged"""
+        files = {}
         for filename in self.REQUIRED_FILES:
             local_path = self.local_cache / filename
-            if not local_path.exists():
-                continue
-            
-            s3_key = f"{prefix}/{filename}"
+            if local_path.exists():
+                files[f"{prefix}/{filename}"] = local_path
+        
+        return self._upload_files(files, skip_unchanged)
+    
+    def _stream_file(self, filename, s3_key, compression, skip_unchanged):
+        """Stream one source file to s3_key; returns ('uploaded' or 'skipped', bytes sent)"""
+        stream = self.source.open(filename)
+        metadata = {}
+        # Seekable sources (files on disk) are hashed first so unchanged objects
+        # can be skipped; the checksum is always of the uncompressed content
+        if stream.seekable():
+            sha256, md5 = self._stream_digests(stream)
+            stream.seek(0)
+            if skip_unchanged and self._is_unchanged(s3_key, sha256, None if compression else md5):
+                stream.close()
+                return 'skipped', 0
+            metadata[self.CHECKSUM_METADATA_KEY] = sha256
+        
+        sent = stream_upload(
+            self.s3_client,
+            stream,
+            self.bucket_name,
+            s3_key,
+            {'ServerSideEncryption': 'AES256', 'Metadata': metadata},
+            self.transfer_config,
+            compression=compression,
+            block_size=self.STREAM_BLOCK_SIZE,
+            max_blocks=self.STREAM_MAX_BLOCKS
+        )
+        return 'uploaded', sent
+    
+    def stream_to_s3(self, prefix="raw", compression=None, skip_unchanged=True):
+        """Stream files from the source straight into S3 multipart uploads.
+        
+        No copy is staged in the local cache. Each file is read, optionally
+        compressed (gzip or zstd, adding .gz/.zst to the key) and uploaded
+        concurrently, with bounded buffers in between.
+        """
+        compressor(compression)  # Fail fast on an unknown codec or missing zstandard
+        with self.metrics.stage('upload', mode='stream', compression=compression) as stage:
+            self._ensure_bucket()
+            suffix = COMPRESSION_SUFFIXES[compression]
             
-            try:
-                self.s3_client.upload_file(
-                    str(local_path),
-                    self.bucket_name,
-                    s3_key,
-                    ExtraArgs={'ServerSideEncryption': 'AES256'}
-                )
-                uploaded.append(s3_key)
-            except ClientError:
-                continue
-        
-        return uploaded
-    
-    def clean_s3_prefix(self, prefix):
-        """Remove all objects under S3 prefix"""
+            result = {'uploaded': [], 'skipped': [], 'failed': {}, 'bytes': 0}
+            stage.files = []
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    f"{prefix}/{filename}{suffix}": executor.submit(
+                        self._stream_file, filename, f"{prefix}/{filename}{suffix}", compression, skip_unchanged
+                    )
+                    for filename in self.REQUIRED_FILES
+                }
+                for s3_key, future in futures.items():
+                    try:
+                        status, sent = future.result()
+                        result[status].append(s3_key)
+                        result['bytes'] += sent
+                        stage.files.append({'key': s3_key, 'status': status, 'bytes': sent})
+                    except (ClientError, S3UploadFailedError, OSError) as e:
+                        result['failed'][s3_key] = str(e)
+                        stage.files.append({'key': s3_key, 'status': 'failed', 'error': str(e)})
+            stage.add(bytes=result['bytes'])
+            stage.extra.update({key: len(result[key]) for key in ('uploaded', 'skipped', 'failed')})
+        
+        return result
+    
+    def upload_directory(self, local_dir, prefix="processed", skip_unchanged=True):
+        """Mirror every file under local_dir to prefix/, keeping relative paths.
+        
+        Used for partitioned preparation output (e.g. DataCoSupplyChainDataset/
+        orderYear=2018/orderMonth=1/...), where only the partitions whose
+        content changed get re-uploaded.
+        """
+        local_dir = Path(local_dir)
+        files = {
+            f"{prefix.rstrip('/')}/{path.relative_to(local_dir).as_posix()}": path
+            for path in sorted(local_dir.rglob('*'))
+            if path.is_file() and not path.name.startswith('.')
+        }
+        return self._upload_files(files, skip_unchanged)
+    
+    def _delete_batch(self, keys):
+        """Delete up to 1000 keys; returns (deleted count, {key: error})"""
         try:
-            response = self.s3_client.list_objects_v2(
+            response = self.s3_client.delete_objects(
                 Bucket=self.bucket_name,
-                Prefix=prefix
+                Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
             )
+        except ClientError as e:
+            return 0, {key: str(e) for key in keys}
+        
+        errors = {
+            error['Key']: f"{error.get('Code')}: {error.get('Message')}"
+            for error in response.get('Errors', [])
+        }
+        return len(keys) - len(errors), errors
+    
+    def clean_s3_prefix(self, prefix, dry_run=False):
+        """Remove all objects under S3 prefix.
+        
+        Pages through the full listing and deletes in batches of 1000 keys,
+        several batches at a time. With dry_run, only counts what would be
+        removed.
+        """
+        with self.metrics.stage('clean', prefix=prefix, dry_run=dry_run) as stage:
+            result = self._clean_s3_prefix(prefix, dry_run)
+            # Bytes counts what was (or would be) reclaimed
+            stage.add(bytes=result['bytes'])
+            stage.extra.update({'objects': result['objects'], 'deleted': result['deleted'],
+                                'failed': len(result['errors'])})
+        return result
+    
+    def _clean_s3_prefix(self, prefix, dry_run):
+        result = {'objects': 0, 'bytes': 0, 'deleted': 0, 'errors': {}, 'dry_run': dry_run}
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        
+        with ThreadPoolExecutor(max_workers=self.DELETE_WORKERS) as executor:
+            futures = []
+            batch = []
+            try:
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                    for obj in page.get('Contents', []):
+                        result['objects'] += 1
+                        result['bytes'] += obj.get('Size', 0)
+                        if dry_run:
+                            continue
+                        batch.append(obj['Key'])
+                        if len(batch) == self.DELETE_BATCH_SIZE:
+                            futures.append(executor.submit(self._delete_batch, batch))
+                            batch = []
+            except ClientError as e:
+                # Nothing to clean in a bucket that does not exist yet
+                if e.response['Error']['Code'] != 'NoSuchBucket':
+                    raise
+            
+            if batch:
+                futures.append(executor.submit(self._delete_batch, batch))
             
-            if 'Contents' in response:
-                objects = [{'Key': obj['Key']} for obj in response['Contents']]
-                self.s3_client.delete_objects(
-                    Bucket=self.bucket_name,
-                    Delete={'Objects': objects}
-                )
-        except ClientError:
-            pass
+            for future in futures:
+                deleted, errors = future.result()
+                result['deleted'] += deleted
+                result['errors'].update(errors)
+        
+        return result
     
     def save_to_local(self, local_path):
-        """Copy files to local directory"""
-        destination = Path(local_path).resolve()
-        destination.mkdir(parents=True, exist_ok=True)
-        
-        saved = []
-        for filename in self.REQUIRED_FILES:
-            src = self.local_cache / filename
-            dst = destination / filename
-            if src.exists():
-                shutil.copy2(src, dst)
+        """Link cached files into a local directory (hardlink, reflink or copy)"""
+        with self.metrics.stage('copy') as stage:
+            destination = Path(local_path).resolve()
+            destination.mkdir(parents=True, exist_ok=True)
+            
+            saved = []
+            stage.files = []
+            for filename in self.REQUIRED_FILES:
+                entry = self.cache.entry(filename)
+                if entry is None:
+                    continue
+                dst = destination / filename
+                method = self.cache.export(filename, dst)
                 saved.append(str(dst))
+                # Bytes written: hardlinks and reflinks share the cached blocks
+                if method == 'copy':
+                    stage.add(bytes=entry['size'])
+                stage.files.append({'file': filename, 'method': method, 'bytes': entry['size']})
         
         return saved
     
-    def run(self, clean_existing=True, local_path=None):
-        """Execute complete pipeline"""
-        logger.info(f"Fetching: {self.DATASET_NAME}")
+    def run(self, clean_existing=False, local_path=None, stream=False, compression=None):
+        """Execute complete pipeline (stage metrics in self.metrics)"""
+        self.metrics = StageMetrics('dataFetcher')
+        logger.info(f"Fetching: {self.DATASET_NAME} from {self.source}")
         
-        self.download_dataset()
-        logger.info("Downloaded")
+        if stream and not local_path:
+            return self._run_streaming(clean_existing, compression)
+        
+        downloaded = self.download_dataset()
+        unchanged = sum(status == 'unchanged' for status in downloaded.values())
+        logger.info(f"Downloaded ({len(downloaded) - unchanged} updated, {unchanged} unchanged)")
+        for filename, status in downloaded.items():
+            if status == 'missing':
+                logger.info(f"Missing from source: {filename}")
         
         if local_path:
             # Save to local directory
@@ -137,13 +366,40 @@ class DataFetcher:
             logger.info(f"Saved to: {local_path} ({len(saved)} files)")
             return saved
         else:
-            # Upload to S3 (default behavior)
+            # Upload to S3 (default behavior); --clean wipes the prefix and
+            # re-uploads everything instead of skipping unchanged objects
             if clean_existing:
-                self.clean_s3_prefix("raw")
+                cleaned = self.clean_s3_prefix("raw")
+                logger.info(f"Cleaned: s3://{self.bucket_name}/raw/ ({cleaned['deleted']} objects)")
+                for s3_key, error in cleaned['errors'].items():
+                    logger.info(f"Failed to delete: {s3_key} ({error})")
             
-            uploaded = self.upload_to_s3(prefix="raw")
-            logger.info(f"Uploaded: s3://{self.bucket_name}/raw/ ({len(uploaded)} files)")
-            return uploaded
+            result = self.upload_to_s3(prefix="raw", skip_unchanged=not clean_existing)
+            logger.info(
+                f"Uploaded: s3://{self.bucket_name}/raw/ "
+                f"({len(result['uploaded'])} uploaded, {len(result['skipped'])} unchanged)"
+            )
+            for s3_key, error in result['failed'].items():
+                logger.info(f"Failed: {s3_key} ({error})")
+            return result
+    
+    def _run_streaming(self, clean_existing, compression):
+        """Source → S3 without the local cache"""
+        if clean_existing:
+            cleaned = self.clean_s3_prefix("raw")
+            logger.info(f"Cleaned: s3://{self.bucket_name}/raw/ ({cleaned['deleted']} objects)")
+            for s3_key, error in cleaned['errors'].items():
+                logger.info(f"Failed to delete: {s3_key} ({error})")
+        
+        result = self.stream_to_s3(prefix="raw", compression=compression, skip_unchanged=not clean_existing)
+        logger.info(
+            f"Streamed: s3://{self.bucket_name}/raw/ "
+            f"({len(result['uploaded'])} uploaded, {len(result['skipped'])} unchanged, "
+            f"{result['bytes'] / 1e6:,.1f} MB sent)"
+        )
+        for s3_key, error in result['failed'].items():
+            logger.info(f"Failed: {s3_key} ({error})")
+        return result
 
 
 def main():
@@ -152,9 +408,15 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python dataFetcher.py                    # Upload to S3 (default)
+  python dataFetcher.py                    # Upload changed files to S3 (default)
+  python dataFetcher.py --clean            # Wipe raw/ and re-upload everything
   python dataFetcher.py --local-path .     # Save to current directory
   python dataFetcher.py -p localData       # Save to localData folder
+  python dataFetcher.py --source-dir ~/Downloads/dataco -p localData   # Offline, from a manual download
+  python dataFetcher.py --stream --compress gzip   # Source → S3 as .csv.gz, no local copy
+  python dataFetcher.py --purge processed/ --dry-run   # Count what a purge would delete
+  python dataFetcher.py --upload-dir localData/processed   # Sync partitioned output to processed/
+  python dataFetcher.py --metrics-json metrics/fetch.json --metrics-openmetrics metrics/fetch.prom
         """
     )
     parser.add_argument(
@@ -163,14 +425,141 @@ Examples:
         default=None,
         help='Save files to local directory instead of S3 (default: None, uploads to S3)'
     )
+    parser.add_argument(
+        '--source-dir',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help='Read the dataset files from DIR instead of downloading from Kaggle'
+    )
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help='Delete everything under raw/ before uploading (default: skip unchanged objects)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream files from the source straight into S3 (no local cache copy)'
+    )
+    parser.add_argument(
+        '--compress',
+        choices=['gzip', 'zstd'],
+        default=None,
+        help='With --stream: compress on the fly and add .gz/.zst to the object keys'
+    )
+    parser.add_argument(
+        '--chunk-size-mb',
+        type=int,
+        default=16,
+        help='Multipart upload part size in MB (default: 16)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Concurrent part uploads per file (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--purge',
+        type=str,
+        default=None,
+        metavar='PREFIX',
+        help='Only delete every object under PREFIX (no download/upload)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='With --purge: report object count and bytes without deleting'
+    )
+    parser.add_argument(
+        '--upload-dir',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help='Only upload every file under DIR to --prefix, skipping unchanged objects'
+    )
+    parser.add_argument(
+        '--prefix',
+        type=str,
+        default='processed',
+        help='S3 prefix for --upload-dir (default: processed)'
+    )
+    parser.add_argument(
+        '--metrics-json',
+        type=str,
+        default=os.getenv('FETCH_METRICS_JSON'),
+        metavar='PATH',
+        help='Write per-stage time, bytes and file results as JSON (- for stdout)'
+    )
+    parser.add_argument(
+        '--metrics-openmetrics',
+        type=str,
+        default=os.getenv('FETCH_METRICS_OPENMETRICS'),
+        metavar='PATH',
+        help='Also write the stage metrics as an OpenMetrics text file'
+    )
     
     args = parser.parse_args()
+    if args.compress and not args.stream:
+        parser.error('--compress requires --stream')
+    
+    fetcher = DataFetcher(
+        multipart_chunksize_mb=args.chunk_size_mb,
+        max_concurrency=args.concurrency,
+        source=LocalDirectorySource(args.source_dir) if args.source_dir else None
+    )
     
-    fetcher = DataFetcher()
-    fetcher.run(local_path=args.local_path)
-    return 0
+    error = None
+    try:
+        return _run_command(fetcher, args)
+    except Exception as e:
+        error = e
+        logger.info(f"Failed in {fetcher.metrics.failed_stage() or 'setup'}: {type(e).__name__}: {e}")
+        return 1
+    finally:
+        fetcher.metrics.write(args.metrics_json, args.metrics_openmetrics, error=error)
+        for stage in fetcher.metrics.to_dict()['stages']:
+            rate = f", {stage['bytes_per_second'] / 1e6:,.1f} MB/s" if stage.get('bytes') else ''
+            logger.info(f"   ⏱  {stage['stage']}: {stage['seconds']:.2f}s"
+                        f" ({stage.get('bytes', 0) / 1e6:,.1f} MB{rate})")
+
+
+def _run_command(fetcher, args):
+    """Run the operation selected on the command line; returns the exit code"""
+    if args.purge:
+        result = fetcher.clean_s3_prefix(args.purge, dry_run=args.dry_run)
+        action = "Would delete" if args.dry_run else "Deleted"
+        count = result['objects'] if args.dry_run else result['deleted']
+        logger.info(
+            f"{action}: s3://{fetcher.bucket_name}/{args.purge} "
+            f"({count:,} objects, {result['bytes'] / 1e6:,.1f} MB)"
+        )
+        for s3_key, error in result['errors'].items():
+            logger.info(f"Failed to delete: {s3_key} ({error})")
+        return 1 if result['errors'] else 0
+    
+    if args.upload_dir:
+        result = fetcher.upload_directory(args.upload_dir, prefix=args.prefix)
+        logger.info(
+            f"Synced {args.upload_dir} → s3://{fetcher.bucket_name}/{args.prefix}/ "
+            f"({len(result['uploaded'])} uploaded, {len(result['skipped'])} unchanged)"
+        )
+        for s3_key, error in result['failed'].items():
+            logger.info(f"Failed: {s3_key} ({error})")
+        return 1 if result['failed'] else 0
+    
+    result = fetcher.run(
+        clean_existing=args.clean,
+        local_path=args.local_path,
+        stream=args.stream,
+        compression=args.compress
+    )
+    if args.local_path:
+        return 0
+    return 1 if result['failed'] else 0
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
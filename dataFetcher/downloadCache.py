@@ -0,0 +1,229 @@
+"""
+Download Cache
+Content-addressed local cache for the raw dataset files. Each file is stored
+once under .objects/<sha256> and exposed by hardlink (or reflink), so repeat
+runs neither re-copy unchanged files nor keep several byte copies around.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request for a copy-on-write clone (Linux: btrfs, XFS with reflink=1)
+FICLONE = 0x40049409
+
+
+class KaggleSource:
+    """Kaggle dataset via kagglehub (which keeps its own versioned download cache)"""
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self._path = None
+
+    def fetch(self):
+        """Return the directory holding the dataset files"""
+        if not os.environ.get('KAGGLE_API_TOKEN'):
+            raise EnvironmentError("KAGGLE_API_TOKEN environment variable not set")
+
+        try:
+            import kagglehub
+        except ImportError:
+            raise ImportError("kagglehub not installed: pip install kagglehub")
+
+        self._path = Path(kagglehub.dataset_download(self.dataset))
+        return self._path
+
+    def open(self, name):
+        """Binary stream of one dataset file"""
+        return open((self._path or self.fetch()) / name, 'rb')
+
+    def __str__(self):
+        return f"kaggle:{self.dataset}"
+
+
+class LocalDirectorySource:
+    """Files already on disk (a manual download, a mounted share, or test fixtures)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def fetch(self):
+        if not self.path.is_dir():
+            raise FileNotFoundError(f"Source directory not found: {self.path}")
+        return self.path
+
+    def open(self, name):
+        return open(self.fetch() / name, 'rb')
+
+    def __str__(self):
+        return str(self.path)
+
+
+def _reflink(src, dst):
+    """Copy-on-write clone of src to dst; False where the filesystem cannot"""
+    if fcntl is None:
+        return False
+    with open(src, 'rb') as source, open(dst, 'wb') as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+            return True
+        except OSError:
+            pass
+    os.unlink(dst)
+    return False
+
+
+def place(src, dst):
+    """Make dst hold src's content without a byte copy where possible.
+
+    Tries a hardlink, then a reflink, then falls back to a full copy; returns
+    which one was used. dst is replaced atomically.
+    """
+    dst = Path(dst)
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+
+    try:
+        os.link(src, tmp)
+        method = 'hardlink'
+    except OSError:
+        if _reflink(src, tmp):
+            method = 'reflink'
+        else:
+            shutil.copy2(src, tmp)
+            method = 'copy'
+
+    os.replace(tmp, dst)
+    return method
+
+
+class DownloadCache:
+    """Content-addressed store + manifest under root.
+
+    The manifest records size, mtime and SHA-256 of the source file each
+    entry came from. A source file whose size and mtime match is skipped
+    without being read; one that changed is hashed, and only copied in if
+    that content is not stored yet. Interrupted copies resume from the
+    partial file's length (the source is keyed by size and mtime, so a
+    changed source starts over).
+    """
+
+    MANIFEST = '.manifest.json'
+    OBJECTS = '.objects'
+    BLOCK_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects = self.root / self.OBJECTS
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.root / self.MANIFEST
+        self._lock = threading.Lock()
+        self._entries = self._read_manifest()
+
+    def _read_manifest(self):
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('files', {})
+
+    def _write_manifest(self):
+        tmp = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'files': self._entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    def entry(self, name):
+        """Manifest entry ({'size', 'mtime_ns', 'sha256'}) or None"""
+        return self._entries.get(name)
+
+    def object_path(self, sha256):
+        return self.objects / sha256
+
+    def _copy_resumable(self, src, partial, size):
+        """Append the bytes of src that partial does not have yet"""
+        offset = partial.stat().st_size if partial.exists() else 0
+        if offset > size:
+            partial.unlink()
+            offset = 0
+        with open(src, 'rb') as source, open(partial, 'ab') as target:
+            source.seek(offset)
+            shutil.copyfileobj(source, target, self.BLOCK_SIZE)
+
+    def _hash(self, path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(self.BLOCK_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _store(self, src, stat):
+        """Add src to the object store; returns (sha256, 'stored' or 'deduplicated')"""
+        partial = self.objects / f"{src.name}.{stat.st_size}-{stat.st_mtime_ns}.partial"
+        if partial.exists() or _reflink(src, partial) is False:
+            self._copy_resumable(src, partial, stat.st_size)
+
+        sha256 = self._hash(partial)
+        target = self.object_path(sha256)
+        if target.exists():
+            partial.unlink()
+            return sha256, 'deduplicated'
+
+        # Objects are shared by hardlink with every exposed copy: keep them read-only
+        os.chmod(partial, 0o444)
+        os.replace(partial, target)
+        return sha256, 'stored'
+
+    def add(self, src, name=None):
+        """Bring src into the cache under name; returns 'unchanged', 'stored' or 'deduplicated'"""
+        src = Path(src)
+        name = name or src.name
+        stat = src.stat()
+
+        known = self.entry(name)
+        if (known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns
+                and self.object_path(known['sha256']).exists()):
+            return 'unchanged'
+
+        sha256, status = self._store(src, stat)
+        with self._lock:
+            self._entries[name] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': sha256,
+            }
+            self._write_manifest()
+        return status
+
+    def export(self, name, destination):
+        """Expose cached name at destination; returns 'unchanged' or the place() method"""
+        known = self.entry(name)
+        if known is None:
+            raise KeyError(f"{name} is not in the cache")
+
+        source = self.object_path(known['sha256'])
+        destination = Path(destination)
+        if destination.exists() and os.path.samefile(source, destination):
+            return 'unchanged'
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        return place(source, destination)
+
+    def prune(self):
+        """Delete objects and leftover partial copies no manifest entry points to"""
+        referenced = {entry['sha256'] for entry in self._entries.values()}
+        removed = 0
+        for path in self.objects.iterdir():
+            if path.name not in referenced:
+                # Unlink needs write access to the directory only; the mode is
+                # left alone because exported hardlinks share the inode
+                path.unlink()
+                removed += 1
+        return removed
@@ -0,0 +1,149 @@
+"""
+Streaming Upload
+Pipe a source file into an S3 multipart upload without a local staging copy.
+A producer thread reads (and optionally compresses) the source into a
+bounded queue while boto3 uploads parts from the other end, so fetch,
+compression and upload overlap.
+"""
+
+import zlib
+import queue
+import threading
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Compressed objects keep the .csv name with the codec's suffix, which
+# Snowflake COPY (COMPRESSION = AUTO) recognises
+COMPRESSION_SUFFIXES = {
+    None: '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+
+class _Passthrough:
+    def compress(self, data):
+        return data
+
+    def flush(self):
+        return b''
+
+
+def compressor(compression):
+    """Streaming compressor with compress(bytes)/flush() for None, 'gzip' or 'zstd'"""
+    if compression is None:
+        return _Passthrough()
+    if compression == 'gzip':
+        return zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError("zstandard not installed: pip install zstandard")
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+class QueueReader:
+    """Read-only, non-seekable file object over a bounded queue of byte blocks.
+
+    boto3 expects read(n) to return exactly n bytes until the end of the
+    stream (a short read would become an undersized multipart part), so
+    read() keeps pulling blocks until the request is filled.
+    """
+
+    _END = object()
+
+    def __init__(self, max_blocks):
+        self._queue = queue.Queue(maxsize=max_blocks)
+        self._buffer = bytearray()
+        self._finished = False
+        self.closed = threading.Event()
+        self.bytes_read = 0
+
+    # Producer side
+
+    def put(self, block):
+        """Queue a block; returns False once the reader has been closed"""
+        while not self.closed.is_set():
+            try:
+                self._queue.put(block, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def finish(self, error=None):
+        self.put(error if error is not None else self._END)
+
+    # Consumer side
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def _pull(self):
+        item = self._queue.get()
+        if item is self._END:
+            self._finished = True
+        elif isinstance(item, BaseException):
+            self._finished = True
+            raise item
+        else:
+            self._buffer += item
+
+    def read(self, size=-1):
+        while not self._finished and (size < 0 or len(self._buffer) < size):
+            self._pull()
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.bytes_read += len(data)
+        return data
+
+    def close(self):
+        self.closed.set()
+
+
+def produce(stream, reader, codec, block_size):
+    """Read stream block by block, compress, and feed reader (run in a thread)"""
+    try:
+        for block in iter(lambda: stream.read(block_size), b''):
+            compressed = codec.compress(block)
+            if compressed and not reader.put(compressed):
+                return
+        tail = codec.flush()
+        if tail:
+            reader.put(tail)
+        reader.finish()
+    except Exception as e:
+        reader.finish(e)
+    finally:
+        stream.close()
+
+
+def stream_upload(s3_client, stream, bucket, key, extra_args, transfer_config,
+                  compression=None, block_size=1024 * 1024, max_blocks=16):
+    """Upload stream to s3://bucket/key, compressing on the fly.
+
+    Memory is bounded by max_blocks * block_size of queued source data plus
+    the parts boto3 holds in flight (TransferConfig). Returns bytes uploaded.
+    """
+    reader = QueueReader(max_blocks)
+    producer = threading.Thread(
+        target=produce,
+        args=(stream, reader, compressor(compression), block_size),
+        daemon=True
+    )
+    producer.start()
+    try:
+        s3_client.upload_fileobj(reader, bucket, key, ExtraArgs=extra_args, Config=transfer_config)
+    finally:
+        reader.close()
+        producer.join()
+    return reader.bytes_read
@@ -0,0 +1,536 @@
+"""
+Synthetic Data Generator
+Seeded, multi-process generator of DataCoSupplyChainDataset.csv and
+tokenized_access_logs.csv at any scale, for load and performance testing of
+every pipeline stage offline. Value distributions are learned from a source
+copy of the two files, and the clickstream browses the same product catalog
+the orders buy from, so URL product ids resolve against the generated orders.
+"""
+
+import io
+import os
+import re
+import csv
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+from urllib.parse import quote
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'dataFetcher'))
+from streamingUpload import COMPRESSION_SUFFIXES, compressor, stream_upload  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+ORDERS_FILE = 'DataCoSupplyChainDataset.csv'
+CLICKSTREAM_FILE = 'tokenized_access_logs.csv'
+FULL_DATASET_DIR = Path('localData')
+REFERENCE_DIR = Path(__file__).resolve().parent.parent / 'rawData (reference only)'
+
+# Row counts of the real dataset: --scale 1 reproduces its size
+REFERENCE_ROWS = {ORDERS_FILE: 180_519, CLICKSTREAM_FILE: 469_977}
+DATE_FORMAT = '%m/%d/%Y %H:%M'
+MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Clickstream visits: events per session (geometric mean) and the minutes
+# between two events of a session, kept under the 30-minute sessionization
+# timeout so a generated session stays one session downstream
+SESSION_EVENTS_MEAN = 4.0
+EVENT_GAP_MINUTES = (0, 10)
+SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'KB': 1024, 'M': 1024 ** 2, 'MB': 1024 ** 2,
+              'G': 1024 ** 3, 'GB': 1024 ** 3, 'T': 1024 ** 4, 'TB': 1024 ** 4}
+
+# Joint groups sampled as one weighted tuple, so combinations that never
+# occur together in the source never occur in the output
+PRODUCT_COLUMNS = ['Product Card Id', 'Product Category Id', 'Category Id', 'Category Name',
+                   'Department Id', 'Department Name', 'Product Name', 'Product Image',
+                   'Product Price', 'Product Description', 'Product Status']
+FULFILMENT_COLUMNS = ['Type', 'Order Status', 'Shipping Mode', 'Days for shipment (scheduled)',
+                      'Days for shipping (real)', 'Delivery Status', 'Late_delivery_risk']
+ORDER_GEOGRAPHY_COLUMNS = ['Market', 'Order Region', 'Order Country', 'Order State', 'Order City',
+                           'Order Zipcode']
+CUSTOMER_LOCATION_COLUMNS = ['Customer City', 'Customer Country', 'Customer State', 'Customer Zipcode',
+                             'Latitude', 'Longitude']
+CUSTOMER_POOLS = ['Customer Fname', 'Customer Lname', 'Customer Street', 'Customer Segment',
+                  'Customer Email', 'Customer Password']
+ITEM_POOLS = ['Order Item Discount Rate', 'Order Item Profit Ratio']
+
+
+def parse_size(text):
+    """'50GB', '1.5G', '800MB' or a plain byte count → bytes"""
+    match = re.fullmatch(r'\s*([0-9.]+)\s*([A-Za-z]*)\s*', str(text))
+    unit = match.group(2).upper() if match else None
+    if not match or unit not in SIZE_UNITS:
+        raise ValueError(f"Invalid size: {text} (e.g. 500MB, 50GB)")
+    return int(float(match.group(1)) * SIZE_UNITS[unit])
+
+
+def _float_text(values):
+    """Source formatting of the float columns: the float32 value to 10 significant digits"""
+    codes, uniques = pd.factorize(np.asarray(values, dtype=np.float32).astype(np.float64))
+    text = np.array([f'{value:.10g}' for value in uniques], dtype=object)
+    for index, value in enumerate(text):
+        if '.' not in value and 'e' not in value and value not in ('nan', 'inf', '-inf'):
+            text[index] = value + '.0'
+    return text[codes]
+
+
+def _int_text(values):
+    codes, uniques = pd.factorize(np.asarray(values, dtype=np.int64))
+    return np.array([str(value) for value in uniques], dtype=object)[codes]
+
+
+def _date_text(minutes):
+    """Minutes since the epoch → 'M/D/YYYY H:MM' (no zero padding), formatting each distinct minute once"""
+    codes, uniques = pd.factorize(np.asarray(minutes, dtype=np.int64))
+    stamps = pd.to_datetime(uniques, unit='m')
+    text = np.array([f'{t.month}/{t.day}/{t.year} {t.hour}:{t.minute:02d}' for t in stamps], dtype=object)
+    return text[codes]
+
+
+def _mix(keys, salt):
+    """SplitMix64 of (key, salt): a stateless uniform draw in [0, 1) per key.
+
+    Attributes of an entity (a customer, a visitor ip) are a function of
+    its id, so every shard that references it emits the same values.
+    """
+    with np.errstate(over='ignore'):
+        z = np.asarray(keys, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15) + np.uint64(salt)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+class Weighted:
+    """Distinct source values (or tuples) and their frequencies; draws by inverse CDF"""
+
+    def __init__(self, values, counts):
+        self.values = values
+        counts = np.asarray(counts, dtype=np.float64)
+        self.cdf = np.cumsum(counts) / counts.sum()
+
+    @classmethod
+    def of(cls, frame, columns):
+        counts = frame.groupby(columns, sort=True, dropna=False).size()
+        values = counts.index.to_frame(index=False).reset_index(drop=True)
+        return cls(values, counts.to_numpy())
+
+    def pick(self, uniform):
+        """Row indexes into values for uniform draws in [0, 1)"""
+        return np.minimum(np.searchsorted(self.cdf, uniform, side='right'), len(self.cdf) - 1)
+
+    def draw(self, rng, size):
+        return self.pick(rng.random(size))
+
+
+class Profile:
+    """Everything the shards need, learned once from the source files.
+
+    The product catalog is the source's distinct Product Card Ids; orders
+    draw (product, quantity) pairs with their source frequency, and the
+    clickstream draws products by their source click counts (order counts
+    when the log mentions none of them).
+    """
+
+    def __init__(self, orders, log):
+        self.orders_header = list(orders.columns)
+        self.clickstream_header = list(log.columns)
+
+        products = orders.drop_duplicates('Product Card Id')[PRODUCT_COLUMNS].reset_index(drop=True)
+        self.products = products
+        product_index = {card_id: index for index, card_id in enumerate(products['Product Card Id'])}
+        items = pd.DataFrame({
+            'product': orders['Product Card Id'].map(product_index),
+            'quantity': orders['Order Item Quantity'].astype(int),
+        })
+        self.items = Weighted.of(items, ['product', 'quantity'])
+        self.prices = products['Product Price'].astype(float).to_numpy()
+
+        self.fulfilment = Weighted.of(orders, FULFILMENT_COLUMNS)
+        self.order_geography = Weighted.of(orders, ORDER_GEOGRAPHY_COLUMNS)
+        self.customer_location = Weighted.of(orders, CUSTOMER_LOCATION_COLUMNS)
+        self.customer_pools = {column: Weighted.of(orders, [column]) for column in CUSTOMER_POOLS}
+        self.item_pools = {column: Weighted.of(orders, [column]) for column in ITEM_POOLS}
+        items_per_order = orders.groupby('Order Id').size()
+        self.items_per_order = Weighted(items_per_order.value_counts().sort_index().index.to_numpy(),
+                                        items_per_order.value_counts().sort_index().to_numpy())
+        self.customers_per_row = orders['Customer Id'].nunique() / len(orders)
+        order_minutes = self._minutes(orders['order date (DateOrders)'])
+        self.order_minutes = (int(order_minutes.min()), int(order_minutes.max()))
+
+        names = products['Product Name'].str.lower().str.strip()
+        clicks = log['Product'].str.lower().str.strip().value_counts()
+        click_counts = names.map(clicks).fillna(0).to_numpy()
+        if not click_counts.sum():
+            click_counts = np.bincount(items['product'], minlength=len(products))
+        self.clicks = Weighted(np.arange(len(products)), click_counts)
+        self.cart_share = float(log['url'].str.lower().str.endswith('/add_to_cart').mean()) if len(log) else 0.3
+        log_minutes = self._minutes(log['Date'])
+        days = log_minutes // 1440
+        self.log_days = (int(days.min()), int(days.max()))
+        self.hours = Weighted(np.arange(24), np.bincount(log['Hour'].astype(int), minlength=24) + 1e-9)
+        self.ips_per_event = log['ip'].nunique() / len(log)
+
+        # Per-product clickstream text: the log lowercases category and
+        # department (department with its trailing space) and percent-encodes
+        # spaces in the URL but keeps '/', '&' and apostrophes
+        safe = "/&'()!*,:;=+$@"
+        self.click_category = products['Category Name'].str.lower().str.strip().to_numpy(dtype=object)
+        self.click_department = (products['Department Name'].str.lower().str.strip() + ' ').to_numpy(dtype=object)
+        self.click_urls = np.array([
+            f"/department/{quote(department.strip(), safe=safe)}/category/{quote(category, safe=safe)}"
+            f"/product/{quote(name.strip(), safe=safe)}"
+            for department, category, name in zip(self.click_department, self.click_category, products['Product Name'])
+        ], dtype=object)
+
+    @staticmethod
+    def _minutes(text):
+        stamps = pd.to_datetime(text.str.strip(), format=DATE_FORMAT)
+        return stamps.astype('datetime64[s]').astype(np.int64).to_numpy() // 60
+
+    @classmethod
+    def from_sources(cls, orders_path, clickstream_path):
+        orders = pd.read_csv(orders_path, dtype=str, keep_default_na=False, encoding='utf-8')
+        log = pd.read_csv(clickstream_path, dtype=str, keep_default_na=False, encoding='utf-8')
+        if orders.empty or log.empty:
+            raise ValueError(f"Empty source: {orders_path if orders.empty else clickstream_path}")
+        return cls(orders, log)
+
+
+def _shard_rng(seed, stream, shard):
+    """Generator for one shard: depends only on (seed, file, shard), never on the worker"""
+    return np.random.default_rng(np.random.SeedSequence([seed, stream, shard]))
+
+
+def orders_shard(profile, seed, shard, rows, shard_rows, n_customers):
+    """CSV text (no header) of order rows shard*shard_rows … +rows"""
+    rng = _shard_rng(seed, 0, shard)
+    first_row = shard * shard_rows
+
+    # Orders until the shard is full; the last order is cut at the boundary
+    counts = profile.items_per_order.values[profile.items_per_order.draw(rng, rows)]
+    ends = np.cumsum(counts)
+    n_orders = int(np.searchsorted(ends, rows) + 1)
+    order_of_row = np.repeat(np.arange(n_orders), counts[:n_orders])[:rows]
+
+    # Order-level fields
+    customer = rng.integers(1, n_customers + 1, n_orders)[order_of_row]
+    fulfilment = profile.fulfilment.values.iloc[profile.fulfilment.draw(rng, n_orders)[order_of_row]]
+    geography = profile.order_geography.values.iloc[profile.order_geography.draw(rng, n_orders)[order_of_row]]
+    start, end = profile.order_minutes
+    order_minutes = rng.integers(start, end + 1, n_orders)[order_of_row]
+    real_days = fulfilment['Days for shipping (real)'].astype(int).to_numpy()
+
+    # Item-level fields
+    item = profile.items.draw(rng, rows)
+    product = profile.items.values['product'].to_numpy()[item]
+    quantity = profile.items.values['quantity'].to_numpy()[item]
+    discount_rate_text = profile.item_pools['Order Item Discount Rate'].values.iloc[
+        profile.item_pools['Order Item Discount Rate'].draw(rng, rows), 0].to_numpy()
+    profit_ratio_text = profile.item_pools['Order Item Profit Ratio'].values.iloc[
+        profile.item_pools['Order Item Profit Ratio'].draw(rng, rows), 0].to_numpy()
+    price = profile.prices[product].astype(np.float32).astype(np.float64)
+    sales = price * quantity
+    discount = np.round(sales * discount_rate_text.astype(np.float64), 2)
+    total = sales - discount
+    profit = np.round(total * profit_ratio_text.astype(np.float64), 2)
+
+    # Customer attributes are a function of the customer id
+    location = profile.customer_location.values.iloc[
+        profile.customer_location.pick(_mix(customer, 1))].reset_index(drop=True)
+    columns = {column: location[column].to_numpy() for column in CUSTOMER_LOCATION_COLUMNS}
+    for salt, (column, pool) in enumerate(profile.customer_pools.items(), start=2):
+        columns[column] = pool.values.iloc[pool.pick(_mix(customer, salt)), 0].to_numpy()
+
+    products = profile.products.iloc[product].reset_index(drop=True)
+    for column in PRODUCT_COLUMNS:
+        columns[column] = products[column].to_numpy()
+    for column in FULFILMENT_COLUMNS:
+        columns[column] = fulfilment[column].to_numpy()
+    for column in ORDER_GEOGRAPHY_COLUMNS:
+        columns[column] = geography[column].to_numpy()
+
+    customer_text = _int_text(customer)
+    order_ids = _int_text(first_row + order_of_row + 1)
+    total_text = _float_text(total)
+    profit_text = _float_text(profit)
+    columns.update({
+        'Customer Id': customer_text,
+        'Order Customer Id': customer_text,
+        'Order Id': order_ids,
+        'Order Item Id': _int_text(np.arange(first_row + 1, first_row + rows + 1)),
+        'Order Item Cardprod Id': columns['Product Card Id'],
+        'Order Item Product Price': columns['Product Price'],
+        'Order Item Quantity': _int_text(quantity),
+        'Order Item Discount': _float_text(discount),
+        'Order Item Discount Rate': discount_rate_text,
+        'Order Item Profit Ratio': profit_ratio_text,
+        'Sales': _float_text(sales),
+        'Order Item Total': total_text,
+        'Sales per customer': total_text,
+        'Benefit per order': profit_text,
+        'Order Profit Per Order': profit_text,
+        'order date (DateOrders)': _date_text(order_minutes),
+        'shipping date (DateOrders)': _date_text(order_minutes + real_days * 1440),
+    })
+    return _to_csv(columns, profile.orders_header)
+
+
+def clickstream_shard(profile, seed, shard, rows, n_ips):
+    """CSV text (no header) of one clickstream shard: whole visits of one ip each"""
+    rng = _shard_rng(seed, 1, shard)
+
+    lengths = rng.geometric(1 / SESSION_EVENTS_MEAN, rows)
+    n_sessions = int(np.searchsorted(np.cumsum(lengths), rows) + 1)
+    session_of_event = np.repeat(np.arange(n_sessions), lengths[:n_sessions])[:rows]
+
+    first_day, last_day = profile.log_days
+    session_start = (rng.integers(first_day, last_day + 1, n_sessions) * 1440
+                     + profile.hours.draw(rng, n_sessions) * 60
+                     + rng.integers(0, 60, n_sessions))
+    gaps = rng.integers(EVENT_GAP_MINUTES[0], EVENT_GAP_MINUTES[1] + 1, rows)
+    is_first = np.ones(rows, dtype=bool)
+    is_first[1:] = session_of_event[1:] != session_of_event[:-1]
+    gaps[is_first] = 0
+    # Running sum of gaps, restarted at every session's first event
+    elapsed = np.cumsum(gaps)
+    elapsed -= np.maximum.accumulate(np.where(is_first, elapsed, 0))
+    minutes = session_start[session_of_event] + elapsed
+
+    ip_index = rng.integers(0, n_ips, n_sessions)[session_of_event]
+    octets = [(_mix(ip_index, 100 + octet) * 254 + 1).astype(np.int64) for octet in range(4)]
+    ip_codes, ip_uniques = pd.factorize(octets[0] * 2 ** 24 + octets[1] * 2 ** 16 + octets[2] * 2 ** 8 + octets[3])
+    ip_text = np.array([f'{v >> 24}.{(v >> 16) & 255}.{(v >> 8) & 255}.{v & 255}' for v in ip_uniques],
+                       dtype=object)[ip_codes]
+
+    product = profile.clicks.draw(rng, rows)
+    cart = rng.random(rows) < profile.cart_share
+    urls = profile.click_urls[product]
+    urls = np.where(cart, urls + '/add_to_cart', urls)
+
+    stamps = pd.to_datetime(minutes, unit='m')
+    columns = {
+        'Product': profile.products['Product Name'].to_numpy()[product],
+        'Category': profile.click_category[product],
+        'Date': _date_text(minutes),
+        'Month': np.array(MONTH_NAMES, dtype=object)[stamps.month.to_numpy() - 1],
+        'Hour': _int_text(stamps.hour.to_numpy()),
+        'Department': profile.click_department[product],
+        'ip': ip_text,
+        'url': urls,
+    }
+    return _to_csv(columns, profile.clickstream_header)
+
+
+def _to_csv(columns, header):
+    missing = set(header) - set(columns)
+    if missing:
+        raise ValueError(f"Generator has no values for columns: {sorted(missing)}")
+    out = io.StringIO()
+    csv.writer(out, lineterminator='\n').writerows(zip(*(columns[column] for column in header)))
+    return out.getvalue().encode('utf-8')
+
+
+# Worker state: the profile is sent once per process, not once per shard
+_PROFILE = None
+
+
+def _init_worker(profile):
+    global _PROFILE
+    _PROFILE = profile
+
+
+def _run_shard(task):
+    kind, args = task
+    if kind == ORDERS_FILE:
+        return orders_shard(_PROFILE, *args)
+    return clickstream_shard(_PROFILE, *args)
+
+
+class _ShardStream:
+    """Read-only stream over an iterator of byte blocks (for stream_upload)"""
+
+    def __init__(self, blocks):
+        self._blocks = iter(blocks)
+        self._buffer = b''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            block = next(self._blocks, None)
+            if block is None:
+                break
+            self._buffer += block
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self):
+        pass
+
+
+class DataGenerator:
+    """Generate both raw files at a target size to a directory or an S3 prefix"""
+
+    BUCKET_NAME = "dataco-supply-chain-analytics"
+
+    def __init__(self, source_dir=None, seed=42, workers=None, shard_rows=100_000):
+        self.source_dir = Path(source_dir) if source_dir else self._default_source()
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_rows = shard_rows
+        self.profile = Profile.from_sources(self.source_dir / ORDERS_FILE, self.source_dir / CLICKSTREAM_FILE)
+
+    @staticmethod
+    def _default_source():
+        if (FULL_DATASET_DIR / ORDERS_FILE).exists() and (FULL_DATASET_DIR / CLICKSTREAM_FILE).exists():
+            return FULL_DATASET_DIR
+        return REFERENCE_DIR
+
+    def plan(self, scale=1.0, size=None):
+        """{file: rows} for a scale of the real dataset or a total byte size"""
+        rows = {name: max(1, int(count * scale)) for name, count in REFERENCE_ROWS.items()}
+        if size is not None:
+            # Bytes per row measured on a small shard of each file
+            sample = 2_000
+            bytes_per_row = {
+                ORDERS_FILE: len(orders_shard(self.profile, self.seed, 0, sample, sample, 1_000)) / sample,
+                CLICKSTREAM_FILE: len(clickstream_shard(self.profile, self.seed, 0, sample, 100)) / sample,
+            }
+            unit_bytes = sum(REFERENCE_ROWS[name] * bytes_per_row[name] for name in REFERENCE_ROWS)
+            rows = {name: max(1, int(REFERENCE_ROWS[name] * size / unit_bytes)) for name in REFERENCE_ROWS}
+        return rows
+
+    def _tasks(self, name, rows):
+        shards = -(-rows // self.shard_rows)
+        for shard in range(shards):
+            shard_size = min(self.shard_rows, rows - shard * self.shard_rows)
+            if name == ORDERS_FILE:
+                n_customers = max(1, int(rows * self.profile.customers_per_row))
+                yield name, (self.seed, shard, shard_size, self.shard_rows, n_customers)
+            else:
+                n_ips = max(1, int(rows * self.profile.ips_per_event))
+                yield name, (self.seed, shard, shard_size, n_ips)
+
+    def _blocks(self, executor, name, rows):
+        """Header, then the shards' CSV text in shard order, at most 2 shards per worker in flight"""
+        header = self.profile.orders_header if name == ORDERS_FILE else self.profile.clickstream_header
+        out = io.StringIO()
+        csv.writer(out, lineterminator='\n').writerow(header)
+        yield out.getvalue().encode('utf-8')
+
+        pending = []
+        for task in self._tasks(name, rows):
+            pending.append(executor.submit(_run_shard, task))
+            if len(pending) >= 2 * self.workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+    def run(self, rows, output_dir=None, bucket=None, prefix='raw/', endpoint_url=None, compression=None):
+        """Write each {file: rows} entry; returns {file: {'rows', 'bytes', 'seconds', 'location'}}"""
+        s3_client = None
+        if bucket:
+            compressor(compression)  # Fail fast on an unknown codec or missing zstandard
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+            s3_client = boto3.client('s3', endpoint_url=endpoint_url)
+            transfer_config = TransferConfig(multipart_chunksize=16 * 1024 * 1024, max_concurrency=4)
+        else:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Source profile: {self.source_dir} ({len(self.profile.products):,} products)")
+        results = {}
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.profile,)) as executor:
+            for name, count in rows.items():
+                start = time.perf_counter()
+                blocks = self._blocks(executor, name, count)
+                if s3_client is not None:
+                    key = f"{prefix}{name}{COMPRESSION_SUFFIXES[compression]}"
+                    written = stream_upload(s3_client, _ShardStream(blocks), bucket, key,
+                                            {'ContentType': 'text/csv'}, transfer_config, compression)
+                    location = f"s3://{bucket}/{key}"
+                else:
+                    path = output_dir / name
+                    temp_path = path.with_suffix('.csv.tmp')
+                    written = 0
+                    with open(temp_path, 'wb') as f:
+                        for block in blocks:
+                            f.write(block)
+                            written += len(block)
+                    os.replace(temp_path, path)
+                    location = str(path)
+                seconds = time.perf_counter() - start
+                results[name] = {'rows': count, 'bytes': written, 'seconds': round(seconds, 3),
+                                 'location': location}
+                logger.info(f"{name}: {count:,} rows, {written / 1024 ** 2:,.1f} MB in {seconds:.1f}s "
+                            f"({written / 1024 ** 2 / max(seconds, 1e-6):,.1f} MB/s) → {location}")
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic DataCo orders and clickstream files at any scale',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dataGenerator.py                                  # 1x real size → localData/synthetic/
+  python dataGenerator.py --size 1GB -o /tmp/dataco        # Both files together ≈ 1 GB
+  python dataGenerator.py --scale 100 --workers 16         # 100x the real row counts on 16 cores
+  python dataGenerator.py --orders-rows 5000000 --clickstream-rows 0   # Orders file only
+  python dataGenerator.py --size 50GB --bucket test-bucket --endpoint-url http://localhost:9000   # Local S3 stand-in
+  python dataGenerator.py --source-dir "../rawData (reference only)" --seed 7   # Profile from the samples
+        """
+    )
+    parser.add_argument('-o', '--output-dir', default='localData/synthetic',
+                        help='Directory for the generated files (default: localData/synthetic)')
+    parser.add_argument('--source-dir', default=None, metavar='DIR',
+                        help='Directory with the two source files to learn distributions from '
+                             '(default: localData if present, else the reference samples)')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiple of the real row counts (default: 1 = 180,519 orders, 469,977 events)')
+    parser.add_argument('--size', default=None,
+                        help='Target total size of both files, e.g. 1GB or 50GB (overrides --scale)')
+    parser.add_argument('--orders-rows', type=int, default=None, help='Exact orders row count (0 to skip the file)')
+    parser.add_argument('--clickstream-rows', type=int, default=None,
+                        help='Exact clickstream row count (0 to skip the file)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Random seed; the same seed gives byte-identical files for any --workers (default: 42)')
+    parser.add_argument('--workers', type=int, default=None, help='Generator processes (default: CPU count)')
+    parser.add_argument('--shard-rows', type=int, default=100_000,
+                        help='Rows per shard, the unit of work and of determinism (default: 100000)')
+    parser.add_argument('--bucket', default=None,
+                        help='Stream into this S3 bucket instead of --output-dir')
+    parser.add_argument('--prefix', default='raw/', help='S3 key prefix (default: raw/)')
+    parser.add_argument('--endpoint-url', default=os.getenv('S3_ENDPOINT_URL'),
+                        help='S3-compatible endpoint, e.g. MinIO or moto_server (env: S3_ENDPOINT_URL)')
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], default=None,
+                        help='With --bucket: compress on the fly and add .gz/.zst to the keys')
+
+    args = parser.parse_args()
+
+    try:
+        generator = DataGenerator(args.source_dir, args.seed, args.workers, args.shard_rows)
+        rows = generator.plan(args.scale, parse_size(args.size) if args.size else None)
+        if args.orders_rows is not None:
+            rows[ORDERS_FILE] = args.orders_rows
+        if args.clickstream_rows is not None:
+            rows[CLICKSTREAM_FILE] = args.clickstream_rows
+        rows = {name: count for name, count in rows.items() if count > 0}
+        generator.run(rows, args.output_dir, args.bucket, args.prefix, args.endpoint_url, args.compress)
+    except Exception as e:
+        logger.error(f"Generation failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
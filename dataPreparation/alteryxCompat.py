@@ -0,0 +1,184 @@
+"""
+Alteryx Compatibility Helpers
+Shared output conventions so the Python preparation stages write files that
+match the Alteryx Designer Cloud output byte for byte.
+"""
+
+import csv
+from pathlib import Path
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+
+# Alteryx writes every field quoted with Windows line endings
+CSV_OUTPUT_OPTIONS = {
+    'index': False,
+    'quoting': csv.QUOTE_ALL,
+    'lineterminator': '\r\n',
+}
+
+ALTERYX_DATE_FORMAT = '%m/%d/%Y %H:%M'
+
+
+class AlteryxCsvWriter:
+    """Append string-typed frames to a CSV in the Alteryx layout.
+
+    Uses the pyarrow CSV writer when pyarrow is installed (an order of
+    magnitude faster than DataFrame.to_csv) and falls back to pandas.
+    With include_header=False only rows are written (for file parts that
+    are concatenated after a header). With append=True rows are added to
+    the end of an existing file, whose header is already written.
+    """
+
+    def __init__(self, path, header, include_header=True, append=False):
+        self.path = path
+        self.header = list(header)
+        self.rows = 0
+        self.append = append
+        self._file = None
+        self._wrote_header = append or not include_header
+
+    def __enter__(self):
+        self._file = open(self.path, 'ab' if self.append else 'wb')
+        return self
+
+    def __exit__(self, *exc):
+        if not self._wrote_header:
+            self.write(pd.DataFrame({column: pd.Series(dtype=str) for column in self.header}))
+        self._file.close()
+
+    def write(self, frame):
+        include_header = not self._wrote_header
+        if pa is not None:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            options = pa_csv.WriteOptions(
+                include_header=include_header,
+                quoting_style='all_valid',
+                eol='\r\n'
+            )
+            pa_csv.write_csv(table, self._file, options)
+        else:
+            text = frame.to_csv(None, header=include_header, **CSV_OUTPUT_OPTIONS)
+            self._file.write(text.encode('utf-8'))
+        self._wrote_header = True
+        self.rows += len(frame)
+
+
+class PartitionedWriter:
+    """Route rows to one file per partition under Hive-style key=value
+    directories, e.g. orderYear=2018/orderMonth=1/<filename>.
+
+    writer_factory(path, append) must return a context-managed writer with
+    a write(frame) method (AlteryxCsvWriter or a Parquet equivalent).
+
+    At most max_open partition files are open at once, so a log spanning
+    years of daily partitions stays under the file descriptor limit: the
+    least recently written one is closed, and reopened later through
+    writer_factory(path, append=True). Writers that cannot append (Parquet)
+    need max_open=None, which keeps every partition open.
+    """
+
+    NULL_PARTITION = 'unknown'
+    DEFAULT_MAX_OPEN = 64
+
+    def __init__(self, root, filename, partition_columns, writer_factory, max_open=DEFAULT_MAX_OPEN):
+        self.root = Path(root)
+        self.filename = filename
+        self.partition_columns = list(partition_columns)
+        self.writer_factory = writer_factory
+        self.max_open = max_open
+        self.rows = 0
+        self._writers = OrderedDict()  # Open writers, least recently written first
+        self._paths = {}  # Every partition file written, in first-write order
+
+    def __enter__(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, *exc):
+        while self._writers:
+            _, writer = self._writers.popitem(last=False)
+            writer.__exit__(*exc)
+
+    @property
+    def paths(self):
+        return list(self._paths)
+
+    def _writer_for(self, values):
+        directory = self.root.joinpath(*(
+            f"{column}={value or self.NULL_PARTITION}"
+            for column, value in zip(self.partition_columns, values)
+        ))
+        path = directory / self.filename
+        if path in self._writers:
+            self._writers.move_to_end(path)
+            return self._writers[path]
+
+        if self.max_open is not None and len(self._writers) >= self.max_open:
+            _, writer = self._writers.popitem(last=False)
+            writer.__exit__(None, None, None)
+        append = path in self._paths
+        if not append:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._paths[path] = None
+        self._writers[path] = self.writer_factory(path, append).__enter__()
+        return self._writers[path]
+
+    def write(self, frame):
+        for values, part in frame.groupby(self.partition_columns, sort=False):
+            values = values if isinstance(values, tuple) else (values,)
+            self._writer_for(values).write(part)
+        self.rows += len(frame)
+
+
+def read_chunks(path, chunk_size, usecols=None):
+    """Read a CSV as raw strings in fixed-size chunks (no type inference)"""
+    return pd.read_csv(
+        path,
+        dtype=str,
+        keep_default_na=False,
+        usecols=usecols,
+        chunksize=chunk_size
+    )
+
+
+def cleanse(chunk):
+    """Data Cleansing Tool: trim leading/trailing whitespace on every column"""
+    for column in chunk.columns:
+        chunk[column] = chunk[column].str.strip()
+    return chunk
+
+
+def parse_distinct(values, date_format=ALTERYX_DATE_FORMAT):
+    """Parse each distinct timestamp string once.
+
+    Returns (codes, parsed) where parsed is a DatetimeIndex over the distinct
+    values and codes maps every input row back to its position in parsed.
+    """
+    codes, uniques = pd.factorize(values, sort=False)
+    parsed = pd.DatetimeIndex(pd.to_datetime(uniques, format=date_format, errors='coerce'))
+    return codes, parsed
+
+
+def int_strings(values):
+    """Format integer-valued floats/ints as strings, empty for missing"""
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, '', dtype=object)
+    mask = ~np.isnan(values)
+    out[mask] = values[mask].astype(np.int64).astype(str)
+    return out
+
+
+def with_missing(values, mask):
+    """Blank out values where mask is set (Alteryx writes nulls as empty)"""
+    values = np.asarray(values, dtype=object)
+    values[mask] = ''
+    return values
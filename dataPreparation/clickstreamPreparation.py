@@ -0,0 +1,212 @@
+"""
+Clickstream Data Preparation
+Streaming replacement for the Alteryx clickstream workflow:
+tokenized_access_logs.csv → clickstreamDataPreparation.csv
+"""
+
+import time
+import logging
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from alteryxCompat import (
+    AlteryxCsvWriter,
+    PartitionedWriter,
+    read_chunks,
+    cleanse,
+    parse_distinct,
+    int_strings,
+    with_missing,
+)
+from urlParsing import UrlParser, load_catalog
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+class ClickstreamPreparation:
+    """Derive the 15 clickstream enrichment fields chunk by chunk"""
+
+    SOURCE_COLUMNS = ["Product", "Category", "Date", "Month", "Hour", "Department", "ip", "url"]
+    # Header as written by the Alteryx workflow (including its duplicated
+    # eventDayOfWeek label) so downstream files stay byte-identical
+    OUTPUT_HEADER = SOURCE_COLUMNS + [
+        "eventYear",
+        "eventMonth",
+        "eventQuarter",
+        "eventDayOfWeekeventDayOfWeek",
+        "eventHourOfDay",
+        "isCartAdd",
+        "eventType",
+        "sessionDate",
+        "pageType",
+        "sessionID",
+        "isWeekend",
+        "timeOfDay",
+        # Integer keys resolved from the parsed URL (orders dataset ids)
+        "departmentId",
+        "categoryId",
+        "productId",
+    ]
+    PARTITION_COLUMNS = ["sessionDate"]
+    OUTPUT_FILENAME = "clickstreamDataPreparation.csv"
+    DEFAULT_CHUNK_SIZE = 200_000
+
+    def __init__(self, chunk_size=None, catalog=None):
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        # Memoized across chunks, so each distinct URL is parsed once per run
+        self.url_parser = UrlParser(catalog)
+
+    @staticmethod
+    def _time_of_day(hours):
+        """Morning: 6-12, Afternoon: 12-18, Evening: 18-22, Night: 22-6"""
+        return np.select(
+            [(hours >= 6) & (hours < 12), (hours >= 12) & (hours < 18), (hours >= 18) & (hours < 22)],
+            ['Morning', 'Afternoon', 'Evening'],
+            default='Night'
+        ).astype(object)
+
+    def _date_fields(self, dates):
+        """Date-derived fields, computed once per distinct timestamp"""
+        codes, parsed = parse_distinct(dates)
+        missing = np.asarray(parsed.isna())
+        hours = np.asarray(parsed.hour, dtype=float)
+        weekend = np.asarray(parsed.dayofweek, dtype=float) >= 5
+
+        fields = {
+            'eventYear': int_strings(parsed.year),
+            'eventMonth': int_strings(parsed.month),
+            'eventQuarter': with_missing('Q' + int_strings(parsed.quarter), missing),
+            'eventDayOfWeekeventDayOfWeek': with_missing(parsed.day_name().to_numpy(dtype=object), missing),
+            'eventHourOfDay': int_strings(hours),
+            'sessionDate': with_missing(parsed.strftime('%Y-%m-%d').to_numpy(dtype=object), missing),
+            'isWeekend': with_missing(np.where(weekend, 'Yes', 'No').astype(object), missing),
+            'timeOfDay': with_missing(self._time_of_day(hours), missing),
+        }
+        return {name: values[codes] for name, values in fields.items()}
+
+    def _url_fields(self, urls):
+        """URL-derived fields: each distinct URL is split into its
+        department/category/product path once and cached for the run"""
+        return self.url_parser.fields(urls)
+
+    def transform(self, chunk):
+        """Return the 20-column enriched frame for one chunk of raw events"""
+        chunk = cleanse(chunk[self.SOURCE_COLUMNS].copy())
+
+        derived = self._date_fields(chunk['Date'].to_numpy(dtype=object))
+        derived.update(self._url_fields(chunk['url'].to_numpy(dtype=object)))
+
+        ips = chunk['ip'].to_numpy(dtype=object)
+        session_dates = derived['sessionDate']
+        derived['sessionID'] = with_missing(ips + '_' + session_dates, session_dates == '')
+
+        output = chunk.copy()
+        for name in self.OUTPUT_HEADER[len(self.SOURCE_COLUMNS):]:
+            output[name] = derived[name]
+        return output[self.OUTPUT_HEADER]
+
+    def run(self, source_path, output_path, partitioned=False):
+        """Stream source_path through the transform into output_path.
+
+        With partitioned=True, output_path is a directory and rows are split
+        into one file per sessionDate (sessionDate=YYYY-MM-DD/...).
+        """
+        source_path = Path(source_path)
+        output_path = Path(output_path)
+
+        if partitioned:
+            writer = PartitionedWriter(
+                output_path,
+                self.OUTPUT_FILENAME,
+                self.PARTITION_COLUMNS,
+                lambda path, append: AlteryxCsvWriter(path, self.OUTPUT_HEADER, append=append)
+            )
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            writer = AlteryxCsvWriter(output_path, self.OUTPUT_HEADER)
+
+        start = time.perf_counter()
+        chunks = 0
+        with writer:
+            for chunk in read_chunks(source_path, self.chunk_size):
+                writer.write(self.transform(chunk))
+                chunks += 1
+
+        elapsed = time.perf_counter() - start
+        return {
+            'rows': writer.rows,
+            'chunks': chunks,
+            'urls': len(self.url_parser),
+            'unresolved_urls': self.url_parser.unresolved,
+            'files': len(writer.paths) if partitioned else 1,
+            'seconds': round(elapsed, 3),
+            'output': str(output_path),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Prepare clickstream events (replaces the Alteryx clickstream workflow)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python clickstreamPreparation.py                                   # localData → localData/processed
+  python clickstreamPreparation.py -s logs.csv -o out.csv            # Custom paths
+  python clickstreamPreparation.py --chunk-size 50000                # Smaller memory footprint
+  python clickstreamPreparation.py --partitioned                     # One file per sessionDate
+  python clickstreamPreparation.py --orders raw/DataCoSupplyChainDataset.csv   # Catalog for the id columns
+        """
+    )
+    parser.add_argument(
+        '-s', '--source',
+        type=str,
+        default='localData/tokenized_access_logs.csv',
+        help='Raw access log CSV (default: localData/tokenized_access_logs.csv)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default=None,
+        help='Processed CSV destination (a directory with --partitioned)'
+    )
+    parser.add_argument(
+        '--orders',
+        type=str,
+        default='localData/DataCoSupplyChainDataset.csv',
+        help='Raw orders CSV the URL names are resolved against '
+             '(default: localData/DataCoSupplyChainDataset.csv; ids are left empty without it)'
+    )
+    parser.add_argument(
+        '--partitioned',
+        action='store_true',
+        help='Write sessionDate=YYYY-MM-DD/ partition files instead of one CSV'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=ClickstreamPreparation.DEFAULT_CHUNK_SIZE,
+        help=f'Rows per chunk (default: {ClickstreamPreparation.DEFAULT_CHUNK_SIZE:,})'
+    )
+
+    args = parser.parse_args()
+    output = args.output or (
+        'localData/processed/clickstreamDataPreparation'
+        if args.partitioned else
+        f'localData/processed/clickstreamDataPreparation/{ClickstreamPreparation.OUTPUT_FILENAME}'
+    )
+
+    engine = ClickstreamPreparation(chunk_size=args.chunk_size, catalog=load_catalog(args.orders))
+    result = engine.run(args.source, output, args.partitioned)
+    logger.info(
+        f"Prepared: {result['output']} ({result['rows']:,} rows, {result['files']} files in {result['seconds']}s)"
+    )
+    logger.info(f"URLs: {result['urls']:,} distinct, {result['unresolved_urls']:,} with a product not in the catalog")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
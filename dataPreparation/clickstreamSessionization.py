@@ -0,0 +1,308 @@
+"""
+Clickstream Sessionization
+Assigns inactivity-timeout sessions to the raw access log and writes one row
+per session: tokenized_access_logs.csv → clickstreamSessions.csv
+
+Pass 1 parses byte ranges of the log in a process pool and hash-partitions
+the events by ip into bucket files; pass 2 sessionizes each bucket in the
+pool. Every visitor's events land in one bucket, so buckets are independent
+and both passes scale with the number of workers.
+"""
+
+import io
+import os
+import sys
+import time
+import pickle
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from alteryxCompat import AlteryxCsvWriter, cleanse, parse_distinct, int_strings
+from urlParsing import UrlParser
+
+# Quote-aware byte ranges of whole rows, shared with the pre-load validator
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'snowflakeIngestion'))
+from dataValidator import plan_blocks  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+SESSION_TIMESTAMP_FORMAT = '%m/%d/%Y %H:%M'
+
+
+def partition_range(path, start, end, header, bucket_root, buckets):
+    """Parse one byte range and append its events to the per-ip-hash bucket
+    files of this worker process; returns (events, events without a date)"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    chunk = pd.read_csv(
+        io.BytesIO(data),
+        names=header,
+        header=None,
+        usecols=['Product', 'Date', 'ip', 'url'],
+        dtype=str,
+        keep_default_na=False
+    )
+    chunk = cleanse(chunk)
+
+    codes, parsed = parse_distinct(chunk['Date'].to_numpy(dtype=object))
+    minutes = parsed.to_numpy().astype('datetime64[m]').astype(np.int64)[codes]
+    dated = ~np.asarray(parsed.isna())[codes]
+
+    # Cart adds as in clickstreamPreparation.py, splitting each distinct URL once
+    url_codes, urls = pd.factorize(chunk['url'].to_numpy(dtype=object), sort=False)
+    cart = np.fromiter((UrlParser.split(url)[1] for url in urls), dtype=bool, count=len(urls))[url_codes]
+
+    ips = chunk['ip'].to_numpy(dtype=object)
+    events = pd.DataFrame({
+        'ip': ips,
+        'minute': minutes,
+        'cart': cart,
+        'product': pd.util.hash_array(chunk['Product'].to_numpy(dtype=object)),
+    })[dated]
+    bucket_of = pd.util.hash_array(events['ip'].to_numpy(dtype=object)) % buckets
+
+    # One append-only file per (bucket, worker process), so workers never share a file
+    for bucket, part in events.groupby(bucket_of, sort=False):
+        bucket_dir = Path(bucket_root) / f"bucket={bucket:04d}"
+        bucket_dir.mkdir(exist_ok=True)
+        with open(bucket_dir / f"worker-{os.getpid()}.pkl", 'ab') as f:
+            pickle.dump(part, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return len(chunk), int((~dated).sum())
+
+
+def _read_bucket(bucket_dir):
+    frames = []
+    for path in sorted(Path(bucket_dir).glob('worker-*.pkl')):
+        with open(path, 'rb') as f:
+            while True:
+                try:
+                    frames.append(pickle.load(f))
+                except EOFError:
+                    break
+    return pd.concat(frames, ignore_index=True)
+
+
+def format_minutes(minutes, date_format):
+    """Format minutes since the epoch, each distinct value once"""
+    uniques, inverse = np.unique(minutes, return_inverse=True)
+    formatted = pd.DatetimeIndex(uniques.astype('datetime64[m]')).strftime(date_format)
+    return formatted.to_numpy(dtype=object)[inverse]
+
+
+def sessionize(events, gap_minutes):
+    """Session rows for a frame of (ip, minute, cart, product) events.
+
+    A session is a run of one ip's events with no gap longer than
+    gap_minutes. sessionId is <ip>_<YYYY-MM-DD>_<n>, n numbering the ip's
+    sessions that start on that day.
+    """
+    ip_codes, ips = pd.factorize(events['ip'].to_numpy(dtype=object), sort=True)
+    minutes = events['minute'].to_numpy(dtype=np.int64)
+    order = np.lexsort((minutes, ip_codes))
+    ip_codes = ip_codes[order]
+    minutes = minutes[order]
+    cart = events['cart'].to_numpy(dtype=bool)[order]
+    products = events['product'].to_numpy(dtype=np.uint64)[order]
+
+    new_session = np.ones(len(minutes), dtype=bool)
+    new_session[1:] = (ip_codes[1:] != ip_codes[:-1]) | (np.diff(minutes) > gap_minutes)
+    starts = np.flatnonzero(new_session)
+    session = np.cumsum(new_session) - 1
+
+    event_count = np.diff(np.append(starts, len(minutes)))
+    cart_adds = np.add.reduceat(cart.astype(np.int64), starts)
+    first = minutes[starts]
+    last = np.maximum.reduceat(minutes, starts)
+
+    # Distinct products: count (session, product) changes in sorted order
+    by_product = np.lexsort((products, session))
+    product_sorted = products[by_product]
+    session_sorted = session[by_product]
+    new_product = np.ones(len(minutes), dtype=bool)
+    new_product[1:] = (session_sorted[1:] != session_sorted[:-1]) | (product_sorted[1:] != product_sorted[:-1])
+    distinct_products = np.bincount(session_sorted[new_product], minlength=len(starts))
+
+    session_ips = ip_codes[starts]
+    start_days = first // 1440
+    new_day = np.ones(len(starts), dtype=bool)
+    new_day[1:] = (session_ips[1:] != session_ips[:-1]) | (start_days[1:] != start_days[:-1])
+    day_starts = np.flatnonzero(new_day)
+    ordinal = np.arange(len(starts)) - day_starts[np.cumsum(new_day) - 1] + 1
+
+    session_dates = format_minutes(start_days * 1440, '%Y-%m-%d')
+    ip_values = np.asarray(ips, dtype=object)[session_ips]
+    return pd.DataFrame({
+        'sessionId': ip_values + '_' + session_dates + '_' + int_strings(ordinal),
+        'ip': ip_values,
+        'sessionDate': session_dates,
+        'sessionStart': format_minutes(first, SESSION_TIMESTAMP_FORMAT),
+        'sessionEnd': format_minutes(last, SESSION_TIMESTAMP_FORMAT),
+        'durationMinutes': int_strings(last - first),
+        'eventCount': int_strings(event_count),
+        'pageViews': int_strings(event_count - cart_adds),
+        'cartAdds': int_strings(cart_adds),
+        'distinctProducts': int_strings(distinct_products),
+        'isConverted': np.where(cart_adds > 0, '1', '0').astype(object),
+    })
+
+
+def sessionize_bucket(bucket_dir, part_path, gap_minutes):
+    """Sessionize one bucket into a headerless CSV part; returns sessions written"""
+    sessions = sessionize(_read_bucket(bucket_dir), gap_minutes)
+    # The parent writes the one header and appends the parts after it
+    with AlteryxCsvWriter(part_path, ClickstreamSessionization.OUTPUT_HEADER, include_header=False) as writer:
+        writer.write(sessions)
+    return len(sessions)
+
+
+class ClickstreamSessionization:
+    """Inactivity-timeout sessions and per-session aggregates for the access log"""
+
+    OUTPUT_HEADER = [
+        "sessionId",
+        "ip",
+        "sessionDate",
+        "sessionStart",
+        "sessionEnd",
+        "durationMinutes",
+        "eventCount",
+        "pageViews",
+        "cartAdds",
+        "distinctProducts",
+        "isConverted",
+    ]
+    OUTPUT_FILENAME = "clickstreamSessions.csv"
+    DEFAULT_GAP_MINUTES = 30
+    DEFAULT_BLOCK_MB = 16
+    # Buckets per worker: more, smaller buckets keep pass 2 balanced
+    BUCKETS_PER_WORKER = 4
+
+    def __init__(self, gap_minutes=None, workers=None, block_mb=None, buckets=None):
+        self.gap_minutes = gap_minutes or self.DEFAULT_GAP_MINUTES
+        self.workers = workers or os.cpu_count() or 1
+        self.block_bytes = int((block_mb or self.DEFAULT_BLOCK_MB) * 1024 * 1024)
+        self.buckets = buckets or self.workers * self.BUCKETS_PER_WORKER
+
+    def run(self, source_path, output_path, temp_dir=None):
+        """Sessionize source_path into output_path (one row per session)"""
+        source_path = Path(source_path)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(source_path, 'r', encoding='utf-8', newline='') as f:
+            header = [name.strip() for name in f.readline().rstrip('\r\n').split(',')]
+
+        workdir = Path(tempfile.mkdtemp(prefix='sessionization_', dir=temp_dir))
+        start = time.perf_counter()
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                # Ranges end on newlines outside quotes, so quoted fields
+                # holding line breaks are never split between workers
+                ranges = list(plan_blocks(source_path, self.block_bytes))
+                partitioned = [
+                    executor.submit(partition_range, str(source_path), range_start, range_end,
+                                    header, str(workdir), self.buckets)
+                    for range_start, range_end in ranges
+                ]
+                events = undated = 0
+                for future in partitioned:
+                    rows, invalid = future.result()
+                    events += rows
+                    undated += invalid
+                partition_seconds = time.perf_counter() - start
+
+                bucket_dirs = sorted(workdir.glob('bucket=*'))
+                parts = [workdir / f"{bucket_dir.name}.csv" for bucket_dir in bucket_dirs]
+                sessionized = [
+                    executor.submit(sessionize_bucket, str(bucket_dir), str(part), self.gap_minutes)
+                    for bucket_dir, part in zip(bucket_dirs, parts)
+                ]
+                sessions = sum(future.result() for future in sessionized)
+
+            with AlteryxCsvWriter(output_path, self.OUTPUT_HEADER):
+                pass  # Header only
+            with open(output_path, 'ab') as output:
+                for part in parts:
+                    with open(part, 'rb') as f:
+                        shutil.copyfileobj(f, output)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        elapsed = time.perf_counter() - start
+        return {
+            'events': events,
+            'undated': undated,
+            'sessions': sessions,
+            'ranges': len(ranges),
+            'buckets': len(parts),
+            'workers': self.workers,
+            'partition_seconds': round(partition_seconds, 3),
+            'seconds': round(elapsed, 3),
+            'output': str(output_path),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Sessionize clickstream events by inactivity timeout and write per-session aggregates',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python clickstreamSessionization.py                              # localData → localData/processed
+  python clickstreamSessionization.py --gap-minutes 15             # Shorter inactivity timeout
+  python clickstreamSessionization.py --workers 8 --block-mb 64    # Large logs on 8 cores
+  python clickstreamSessionization.py -s logs.csv -o sessions.csv  # Custom paths
+        """
+    )
+    parser.add_argument(
+        '-s', '--source',
+        type=str,
+        default='localData/tokenized_access_logs.csv',
+        help='Raw access log CSV (default: localData/tokenized_access_logs.csv)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default=f'localData/processed/clickstreamSessions/{ClickstreamSessionization.OUTPUT_FILENAME}',
+        help='Session CSV destination'
+    )
+    parser.add_argument(
+        '--gap-minutes',
+        type=int,
+        default=ClickstreamSessionization.DEFAULT_GAP_MINUTES,
+        help=f'Inactivity that ends a session (default: {ClickstreamSessionization.DEFAULT_GAP_MINUTES})'
+    )
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument(
+        '--block-mb',
+        type=float,
+        default=ClickstreamSessionization.DEFAULT_BLOCK_MB,
+        help=f'Bytes of log parsed per task (default: {ClickstreamSessionization.DEFAULT_BLOCK_MB} MB)'
+    )
+    parser.add_argument('--buckets', type=int, default=None, help='ip hash buckets (default: 4 per worker)')
+    parser.add_argument('--temp-dir', type=str, default=None, help='Directory for the bucket files (default: system temp)')
+
+    args = parser.parse_args()
+
+    engine = ClickstreamSessionization(args.gap_minutes, args.workers, args.block_mb, args.buckets)
+    result = engine.run(args.source, args.output, args.temp_dir)
+    logger.info(
+        f"Sessionized: {result['output']} ({result['sessions']:,} sessions from {result['events']:,} events "
+        f"in {result['seconds']}s, {result['events'] / max(result['seconds'], 1e-9):,.0f} events/s "
+        f"on {result['workers']} workers)"
+    )
+    if result['undated']:
+        logger.info(f"Skipped: {result['undated']:,} events without a parseable Date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Preparation Benchmark
+Measures supply chain preparation throughput on a synthetically scaled copy
+of the orders dataset, for CSV and Parquet output.
+"""
+
+import csv
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+from alteryxCompat import ALTERYX_DATE_FORMAT
+from supplyChainPreparation import SupplyChainPreparation
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+FULL_DATASET = Path('localData/DataCoSupplyChainDataset.csv')
+REFERENCE_SAMPLE = Path(__file__).resolve().parent.parent / 'rawData (reference only)' / 'DataCoSupplyChainDataset.csv'
+
+
+def build_scaled_copy(source_path, destination, scale):
+    """Write source_path's rows `scale` times over into destination"""
+    with open(source_path, 'r', encoding='utf-8', newline='') as src:
+        header = src.readline()
+        body = src.read()
+    if body and not body.endswith('\n'):
+        body += '\n'
+
+    with open(destination, 'w', encoding='utf-8', newline='') as out:
+        out.write(header)
+        for _ in range(scale):
+            out.write(body)
+
+    return body.count('\n') * scale
+
+
+def row_by_row(source_path, output_path):
+    """Formula-per-row baseline in the style of the Alteryx workflow (one
+    DateTimeParse per derived date field)"""
+    with open(source_path, 'r', encoding='utf-8', newline='') as src, \
+            open(output_path, 'w', encoding='utf-8', newline='') as out:
+        reader = csv.DictReader(src)
+        writer = csv.writer(out, quoting=csv.QUOTE_ALL, lineterminator='\r\n')
+        writer.writerow(SupplyChainPreparation.OUTPUT_HEADER)
+        for row in reader:
+            row = {key: value.strip() for key, value in row.items()}
+            sales = float(row['Sales per customer'] or 0)
+            margin = float(row['Benefit per order'] or 0) / sales * 100 if sales else None
+            delay = int(row['Days for shipping (real)']) - int(row['Days for shipment (scheduled)'])
+            order_date = row['order date (DateOrders)']
+            row['profitMarginPct'] = '' if margin is None else f'{margin:.15g}'
+            row['profitCategory'] = next(
+                (label for threshold, label in SupplyChainPreparation.PROFIT_TIERS
+                 if margin is not None and margin > threshold),
+                'Loss'
+            )
+            row['deliveryDelay'] = str(delay)
+            row['orderYear'] = str(datetime.strptime(order_date, ALTERYX_DATE_FORMAT).year)
+            row['orderMonth'] = str(datetime.strptime(order_date, ALTERYX_DATE_FORMAT).month)
+            row['orderQuarter'] = f"Q{(datetime.strptime(order_date, ALTERYX_DATE_FORMAT).month - 1) // 3 + 1}"
+            row['orderDayOfWeek'] = datetime.strptime(order_date, ALTERYX_DATE_FORMAT).strftime('%A')
+            row['orderHour'] = str(datetime.strptime(order_date, ALTERYX_DATE_FORMAT).hour)
+            row['isLate'] = '1' if delay > 0 else '0'
+            writer.writerow([row.get(header, '') for header in SupplyChainPreparation.OUTPUT_HEADER])
+
+
+def run_benchmark(source_path, scale, chunk_size, baseline=False):
+    """Scale the source, run each output mode and return per-mode results"""
+    workdir = Path(tempfile.mkdtemp(prefix='preparationBenchmark_'))
+    try:
+        scaled = workdir / 'DataCoSupplyChainDataset.csv'
+        rows = build_scaled_copy(source_path, scaled, scale)
+        input_bytes = scaled.stat().st_size
+        engine = SupplyChainPreparation(chunk_size=chunk_size)
+
+        results = []
+        for output_format in SupplyChainPreparation.FORMATS:
+            result = engine.run(scaled, workdir / f'output.{output_format}', output_format)
+            results.append({'mode': f'vectorized {output_format}', **result})
+
+        if baseline:
+            output = workdir / 'baseline.csv'
+            start = time.perf_counter()
+            row_by_row(scaled, output)
+            results.append({
+                'mode': 'row-by-row csv',
+                'rows': rows,
+                'seconds': round(time.perf_counter() - start, 3),
+                'bytes': output.stat().st_size,
+            })
+
+        for result in results:
+            seconds = max(result['seconds'], 1e-9)
+            result['rows_per_second'] = int(rows / seconds)
+            result['input_mb_per_second'] = round(input_bytes / 1e6 / seconds, 1)
+            result['size_vs_input'] = round(result['bytes'] / input_bytes, 3)
+        return {'rows': rows, 'input_bytes': input_bytes, 'results': results}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark supply chain preparation throughput on a scaled dataset',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python preparationBenchmark.py                      # 100x copy of the dataset
+  python preparationBenchmark.py --scale 1000         # Larger copy
+  python preparationBenchmark.py --baseline           # Include row-by-row baseline
+        """
+    )
+    parser.add_argument(
+        '-s', '--source',
+        type=str,
+        default=None,
+        help='Raw orders CSV to scale (default: localData copy if present, else the reference sample)'
+    )
+    parser.add_argument('--scale', type=int, default=100, help='Copies of the source rows (default: 100)')
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=SupplyChainPreparation.DEFAULT_CHUNK_SIZE,
+        help=f'Rows per chunk (default: {SupplyChainPreparation.DEFAULT_CHUNK_SIZE:,})'
+    )
+    parser.add_argument('--baseline', action='store_true', help='Also time a row-by-row implementation')
+
+    args = parser.parse_args()
+    source = Path(args.source) if args.source else (FULL_DATASET if FULL_DATASET.exists() else REFERENCE_SAMPLE)
+
+    report = run_benchmark(source, args.scale, args.chunk_size, args.baseline)
+    logger.info(f"Source: {source} x{args.scale} → {report['rows']:,} rows ({report['input_bytes'] / 1e6:,.1f} MB)")
+    for result in report['results']:
+        logger.info(
+            f"  {result['mode']:<18} {result['seconds']:>8.2f}s  "
+            f"{result['rows_per_second']:>10,} rows/s  "
+            f"{result['input_mb_per_second']:>7} MB/s  "
+            f"size {result['bytes'] / 1e6:,.1f} MB ({result['size_vs_input']}x input)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
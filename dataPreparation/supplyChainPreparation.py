@@ -0,0 +1,391 @@
+"""
+Supply Chain Data Preparation
+Vectorized replacement for the Alteryx supply chain workflow:
+DataCoSupplyChainDataset.csv → processed DataCoSupplyChainDataset (CSV or Parquet)
+"""
+
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from alteryxCompat import (
+    ALTERYX_DATE_FORMAT,
+    AlteryxCsvWriter,
+    PartitionedWriter,
+    read_chunks,
+    cleanse,
+    parse_distinct,
+    int_strings,
+    with_missing,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'snowflakeIngestion'))
+from tableSchemas import ORDERS_COLUMNS  # noqa: E402
+from schemaInference import header_columns  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+
+# CSV header of the processed orders file, in output order. The table
+# columns and their types come from snowflakeIngestion (schemaInference maps
+# each header to its column, tableSchemas.ORDERS_COLUMNS types it)
+ORDERS_HEADER = [
+    "Type",
+    "Days for shipping (real)",
+    "Days for shipment (scheduled)",
+    "Benefit per order",
+    "Sales per customer",
+    "Delivery Status",
+    "Late_delivery_risk",
+    "Category Id",
+    "Category Name",
+    "Customer City",
+    "Customer Country",
+    "Customer Fname",
+    "Customer Id",
+    "Customer Lname",
+    "Customer Segment",
+    "Customer State",
+    "Customer Street",
+    "Customer Zipcode",
+    "Department Id",
+    "Department Name",
+    "Latitude",
+    "Longitude",
+    "Market",
+    "Order City",
+    "Order Country",
+    "Order Customer Id",
+    "order date (DateOrders)",
+    "Order Id",
+    "Order Item Cardprod Id",
+    "Order Item Discount",
+    "Order Item Discount Rate",
+    "Order Item Id",
+    "Order Item Product Price",
+    "Order Item Profit Ratio",
+    "Order Item Quantity",
+    "Sales",
+    "Order Item Total",
+    "Order Profit Per Order",
+    "Order Region",
+    "Order State",
+    "Order Status",
+    "Order Zipcode",
+    "Product Card Id",
+    "Product Category Id",
+    "Product Image",
+    "Product Name",
+    "Product Price",
+    "shipping date (DateOrders)",
+    "Shipping Mode",
+    "profitMarginPct",
+    "profitCategory",
+    "deliveryDelay",
+    "orderYear",
+    "orderMonth",
+    "orderQuarter",
+    "orderDayOfWeek",
+    "orderHour",
+    "isLate",
+]
+
+# Fields computed by SupplyChainPreparation; every other field is copied from the source
+DERIVED_HEADER = [
+    "profitMarginPct", "profitCategory", "deliveryDelay", "orderYear", "orderMonth",
+    "orderQuarter", "orderDayOfWeek", "orderHour", "isLate",
+]
+
+
+def _column_kind(column_type):
+    column_type = column_type.upper()
+    if column_type in ('INT', 'INTEGER', 'BIGINT', 'NUMBER'):
+        return 'int'
+    if column_type in ('FLOAT', 'DOUBLE', 'REAL'):
+        return 'float'
+    if column_type.startswith('TIMESTAMP'):
+        return 'timestamp'
+    return 'string'
+
+
+def orders_layout():
+    """[(CSV header, table column, kind)] for the processed orders file.
+
+    Raises ValueError when ORDERS_HEADER no longer maps onto
+    tableSchemas.ORDERS_COLUMNS, so the two cannot drift apart silently.
+    """
+    columns = header_columns('dataCoSupplyChainOrders', tuple(ORDERS_HEADER))
+    expected = [name for name, _ in ORDERS_COLUMNS]
+    actual = [name for name, _ in columns]
+    if actual != expected:
+        missing = [name for name in expected if name not in actual]
+        extra = [name for name in actual if name not in expected]
+        detail = f"missing {missing}, unexpected {extra}" if missing or extra else "columns out of order"
+        raise ValueError(f"ORDERS_HEADER does not match tableSchemas.ORDERS_COLUMNS ({detail})")
+    return [(header, column, _column_kind(column_type))
+            for header, (column, column_type) in zip(ORDERS_HEADER, columns)]
+
+
+# Output layout expected by SnowflakeDataLoader._create_orders_table
+ORDERS_LAYOUT = orders_layout()
+
+
+class ParquetChunkWriter:
+    """Append transformed chunks to a Parquet file, one row group per chunk"""
+
+    def __init__(self, path, to_arrow, header):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow not installed: pip install pyarrow")
+        self._pq = pq
+        self.path = path
+        self.to_arrow = to_arrow
+        self.header = list(header)
+        self.rows = 0
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._writer is None:
+            empty = pd.DataFrame({header: pd.Series(dtype=str) for header in self.header})
+            self._pq.write_table(self.to_arrow(empty), str(self.path))
+        else:
+            self._writer.close()
+
+    def write(self, frame):
+        table = self.to_arrow(frame)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(str(self.path), table.schema, compression='snappy')
+        # One row group per chunk keeps memory bounded on both sides
+        self._writer.write_table(table)
+        self.rows += len(frame)
+
+
+class SupplyChainPreparation:
+    """Derive the supply chain enrichment fields as whole-column operations"""
+
+    OUTPUT_HEADER = [header for header, _, _ in ORDERS_LAYOUT]
+    DERIVED_COLUMNS = DERIVED_HEADER
+    SOURCE_COLUMNS = [header for header in OUTPUT_HEADER if header not in DERIVED_HEADER]
+    # Numeric source columns Alteryx Auto Column converts to Double, which
+    # drops a trailing ".0" on output (e.g. zipcode 725.0 → 725)
+    NUMERIC_COLUMNS = [
+        header for header, _, kind in ORDERS_LAYOUT
+        if header not in DERIVED_HEADER and kind in ('int', 'float')
+    ] + ["Customer Zipcode", "Order Zipcode"]
+    # Margin tiers (%), checked top-down; anything else is 'Loss'
+    PROFIT_TIERS = [
+        (20, 'Exceptional'),
+        (15, 'Excellent'),
+        (5, 'Acceptable'),
+        (0, 'Marginal'),
+    ]
+    FORMATS = ('csv', 'parquet')
+    PARTITION_COLUMNS = ["orderYear", "orderMonth"]
+    OUTPUT_NAME = "DataCoSupplyChainDataset"
+    DEFAULT_CHUNK_SIZE = 100_000
+
+    def __init__(self, chunk_size=None):
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+
+    @staticmethod
+    def _numbers(column):
+        return pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+
+    def _profit_fields(self, chunk):
+        benefit = self._numbers(chunk['Benefit per order'])
+        sales = self._numbers(chunk['Sales per customer'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            margin = np.where(sales != 0, benefit / sales * 100, np.nan)
+
+        missing = np.isnan(margin)
+        margin_text = np.full(margin.shape, '', dtype=object)
+        margin_text[~missing] = [f'{value:.15g}' for value in margin[~missing]]
+
+        # NaN compares False everywhere, so null margins fall through to 'Loss'
+        category = np.select(
+            [margin > threshold for threshold, _ in self.PROFIT_TIERS],
+            [label for _, label in self.PROFIT_TIERS],
+            default='Loss'
+        ).astype(object)
+        return {'profitMarginPct': margin_text, 'profitCategory': category}
+
+    def _delivery_fields(self, chunk):
+        delay = (
+            self._numbers(chunk['Days for shipping (real)'])
+            - self._numbers(chunk['Days for shipment (scheduled)'])
+        )
+        is_late = with_missing(np.where(delay > 0, '1', '0').astype(object), np.isnan(delay))
+        return {'deliveryDelay': int_strings(delay), 'isLate': is_late}
+
+    @staticmethod
+    def _date_fields(chunk):
+        codes, parsed = parse_distinct(chunk['order date (DateOrders)'].to_numpy(dtype=object))
+        missing = np.asarray(parsed.isna())
+        fields = {
+            'orderYear': int_strings(parsed.year),
+            'orderMonth': int_strings(parsed.month),
+            'orderQuarter': with_missing('Q' + int_strings(parsed.quarter), missing),
+            'orderDayOfWeek': with_missing(parsed.day_name().to_numpy(dtype=object), missing),
+            'orderHour': int_strings(parsed.hour),
+        }
+        return {name: values[codes] for name, values in fields.items()}
+
+    def transform(self, chunk):
+        """Return the 58-column enriched frame for one chunk of raw orders"""
+        chunk = cleanse(chunk[self.SOURCE_COLUMNS].copy())
+        for column in self.NUMERIC_COLUMNS:
+            chunk[column] = chunk[column].str.replace(r'\.0$', '', regex=True)
+
+        derived = self._profit_fields(chunk)
+        derived.update(self._delivery_fields(chunk))
+        derived.update(self._date_fields(chunk))
+
+        for name in self.DERIVED_COLUMNS:
+            chunk[name] = derived[name]
+        return chunk[self.OUTPUT_HEADER]
+
+    @staticmethod
+    def to_arrow(frame):
+        """Typed Arrow table with the Snowflake table column names"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        types = {'int': pa.int64(), 'float': pa.float64()}
+        strings = pa.Table.from_pandas(frame.astype(str), preserve_index=False)
+
+        arrays = []
+        for header, _, kind in ORDERS_LAYOUT:
+            values = strings.column(header).cast(pa.string())
+            # Empty strings are Alteryx nulls
+            values = pc.if_else(pc.equal(values, ''), pa.scalar(None, pa.string()), values)
+            if kind == 'timestamp':
+                values = pc.strptime(values, format=ALTERYX_DATE_FORMAT, unit='us', error_is_null=True)
+            elif kind in types:
+                try:
+                    values = pc.cast(values, types[kind])
+                except pa.ArrowInvalid:
+                    numbers = pd.to_numeric(pd.Series(values.to_pylist(), dtype=object), errors='coerce')
+                    values = pa.array(numbers.astype('Int64') if kind == 'int' else numbers, type=types[kind])
+            arrays.append(values)
+        return pa.Table.from_arrays(arrays, names=[column for _, column, _ in ORDERS_LAYOUT])
+
+    def _writer(self, path, output_format, append=False):
+        if output_format == 'parquet':
+            return ParquetChunkWriter(path, self.to_arrow, self.OUTPUT_HEADER)
+        return AlteryxCsvWriter(path, self.OUTPUT_HEADER, append=append)
+
+    def run(self, source_path, output_path, output_format='csv', partitioned=False):
+        """Stream source_path through the transform into output_path.
+
+        With partitioned=True, output_path is a directory and rows are split
+        into one file per order month (orderYear=YYYY/orderMonth=M/...).
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"output_format must be one of {self.FORMATS}")
+
+        output_path = Path(output_path)
+        if partitioned:
+            writer = PartitionedWriter(
+                output_path,
+                f"{self.OUTPUT_NAME}.{output_format}",
+                self.PARTITION_COLUMNS,
+                lambda path, append: self._writer(path, output_format, append),
+                # Parquet files cannot be reopened for appending; monthly
+                # partitions keep the number of open files small anyway
+                max_open=None if output_format == 'parquet' else PartitionedWriter.DEFAULT_MAX_OPEN
+            )
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            writer = self._writer(output_path, output_format)
+
+        start = time.perf_counter()
+        chunks = 0
+        with writer:
+            for chunk in read_chunks(Path(source_path), self.chunk_size):
+                writer.write(self.transform(chunk))
+                chunks += 1
+        elapsed = time.perf_counter() - start
+
+        paths = writer.paths if partitioned else [output_path]
+        return {
+            'rows': writer.rows,
+            'chunks': chunks,
+            'files': len(paths),
+            'seconds': round(elapsed, 3),
+            'bytes': sum(path.stat().st_size for path in paths),
+            'output': str(output_path),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Prepare supply chain orders (replaces the Alteryx supply chain workflow)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python supplyChainPreparation.py                          # CSV to localData/processed
+  python supplyChainPreparation.py --format parquet         # Typed Parquet (camelCase columns)
+  python supplyChainPreparation.py -s raw.csv -o out.csv    # Custom paths
+  python supplyChainPreparation.py --partitioned            # One file per order month
+        """
+    )
+    parser.add_argument(
+        '-s', '--source',
+        type=str,
+        default='localData/DataCoSupplyChainDataset.csv',
+        help='Raw orders CSV (default: localData/DataCoSupplyChainDataset.csv)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default=None,
+        help='Destination file, or directory with --partitioned '
+             '(default: localData/processed/DataCoSupplyChainDataset/DataCoSupplyChainDataset.<format>)'
+    )
+    parser.add_argument(
+        '--partitioned',
+        action='store_true',
+        help='Write orderYear=YYYY/orderMonth=M/ partition files instead of one file'
+    )
+    parser.add_argument(
+        '-f', '--format',
+        choices=SupplyChainPreparation.FORMATS,
+        default='csv',
+        help='Output format (default: csv)'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=SupplyChainPreparation.DEFAULT_CHUNK_SIZE,
+        help=f'Rows per chunk (default: {SupplyChainPreparation.DEFAULT_CHUNK_SIZE:,})'
+    )
+
+    args = parser.parse_args()
+    output = args.output or (
+        "localData/processed/DataCoSupplyChainDataset"
+        if args.partitioned else
+        f"localData/processed/DataCoSupplyChainDataset/DataCoSupplyChainDataset.{args.format}"
+    )
+
+    result = SupplyChainPreparation(chunk_size=args.chunk_size).run(
+        args.source, output, args.format, args.partitioned
+    )
+    logger.info(
+        f"Prepared: {result['output']} ({result['rows']:,} rows, {result['files']} files, "
+        f"{result['bytes']:,} bytes in {result['seconds']}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+URL Parsing
+Splits clickstream URLs (/department/<d>/category/<c>/product/<p>[/add_to_cart])
+once per distinct URL and resolves the decoded names to the integer
+department, category and product ids of the orders dataset, so downstream
+joins are on ints instead of free-text names.
+"""
+
+import sys
+import logging
+from pathlib import Path
+from urllib.parse import unquote
+
+import numpy as np
+import pandas as pd
+
+from alteryxCompat import read_chunks
+
+logger = logging.getLogger(__name__)
+
+# Path keys followed by a name segment, from the broadest to the narrowest
+NAME_KEYS = ('department', 'category', 'product')
+CART_SUFFIX = 'add_to_cart'
+PAGE_TYPES = {
+    'product': 'Product Page',
+    'category': 'Category Page',
+    'department': 'Department Page',
+}
+
+
+def _key(name):
+    """Interned lookup key: names match case-insensitively ('fan shop' = 'Fan Shop')"""
+    return sys.intern(' '.join(name.split()).lower())
+
+
+class ProductCatalog:
+    """Interned name → id dictionaries for departments, categories and products.
+
+    Built from the orders dataset, whose Department Id, Category Id and
+    Product Card Id are the keys of dimProducts. A name that maps to several
+    ids keeps the smallest.
+    """
+
+    SOURCE_COLUMNS = {
+        'department': ('Department Name', 'Department Id'),
+        'category': ('Category Name', 'Category Id'),
+        'product': ('Product Name', 'Product Card Id'),
+    }
+
+    def __init__(self, ids=None):
+        self.ids = ids or {kind: {} for kind in NAME_KEYS}
+
+    @classmethod
+    def from_orders(cls, path, chunk_size=200_000):
+        """Read only the name/id columns of the orders CSV"""
+        catalog = cls()
+        usecols = [column for pair in cls.SOURCE_COLUMNS.values() for column in pair]
+        for chunk in read_chunks(path, chunk_size, usecols=usecols):
+            for kind, (name_column, id_column) in cls.SOURCE_COLUMNS.items():
+                pairs = chunk[[name_column, id_column]].drop_duplicates()
+                ids = catalog.ids[kind]
+                for name, value in zip(pairs[name_column], pairs[id_column]):
+                    value = value.strip()
+                    if not value:
+                        continue
+                    value = int(float(value))
+                    key = _key(name)
+                    if key and (key not in ids or value < ids[key]):
+                        ids[key] = value
+        return catalog
+
+    def resolve(self, kind, name):
+        """Id for a decoded name, or None"""
+        if name is None:
+            return None
+        return self.ids[kind].get(_key(name))
+
+    def __len__(self):
+        return sum(len(ids) for ids in self.ids.values())
+
+
+class UrlParser:
+    """Memoized URL → parsed fields, shared across chunks.
+
+    Each distinct URL is split and decoded once per run. pageType follows
+    the narrowest name key in the path. isCartAdd is set by the
+    /add_to_cart suffix, or by a path segment mentioning 'cart' in a URL
+    without department/category/product names.
+    """
+
+    FIELDS = ('isCartAdd', 'eventType', 'pageType', 'departmentId', 'categoryId', 'productId')
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog or ProductCatalog()
+        self._parsed = {}
+        self.unresolved = 0
+
+    @staticmethod
+    def split(url):
+        """{'department': name, 'category': name, 'product': name} (decoded) and the cart flag.
+
+        Names may contain unescaped slashes ('indoor/outdoor games'), so a
+        name runs up to the next narrower key or the /add_to_cart suffix.
+        """
+        segments = url.split('?', 1)[0].split('/')
+        cart = segments[-1].lower() == CART_SUFFIX
+        if cart:
+            segments = segments[:-1]
+
+        keys = []
+        for index, segment in enumerate(segments):
+            segment = segment.lower()
+            if segment in NAME_KEYS and (not keys or NAME_KEYS.index(segment) > NAME_KEYS.index(keys[-1][1])):
+                keys.append((index, segment))
+        if not keys:
+            return {}, cart or any('cart' in segment.lower() for segment in segments)
+
+        names = {}
+        for (index, key), (end, _) in zip(keys, keys[1:] + [(len(segments), None)]):
+            name = unquote('/'.join(segments[index + 1:end])).strip()
+            if name:
+                names[key] = name
+        return names, cart
+
+    def parse(self, url):
+        """Output fields for one URL (strings, '' for no id)"""
+        parsed = self._parsed.get(url)
+        if parsed is not None:
+            return parsed
+
+        names, cart = self.split(url)
+        page_type = next((PAGE_TYPES[key] for key in reversed(NAME_KEYS) if key in names), 'Other')
+        ids = [self.catalog.resolve(key, names.get(key)) for key in NAME_KEYS]
+        if 'product' in names and ids[2] is None:
+            self.unresolved += 1
+        parsed = (
+            '1' if cart else '0',
+            'Cart Add' if cart else 'Page View',
+            page_type,
+            *('' if value is None else str(value) for value in ids),
+        )
+        self._parsed[url] = parsed
+        return parsed
+
+    def fields(self, urls):
+        """{field: values} for an array of URLs, parsing each distinct URL at most once"""
+        codes, uniques = pd.factorize(urls, sort=False)
+        parsed = np.empty((len(uniques), len(self.FIELDS)), dtype=object)
+        for row, url in enumerate(uniques):
+            parsed[row] = self.parse(url)
+        return {name: parsed[:, column][codes] for column, name in enumerate(self.FIELDS)}
+
+    def __len__(self):
+        return len(self._parsed)
+
+
+def load_catalog(orders_path):
+    """ProductCatalog from the orders CSV, or an empty one (ids left blank) when it is missing"""
+    if orders_path and Path(orders_path).exists():
+        catalog = ProductCatalog.from_orders(orders_path)
+        logger.info(f"Catalog: {len(catalog.ids['product']):,} products from {orders_path}")
+        return catalog
+    logger.info(f"Catalog: {orders_path} not found, departmentId/categoryId/productId left empty")
+    return ProductCatalog()
@@ -0,0 +1,50 @@
+-- Analysis: micro-partitions and bytes scanned by dashboard queries, per table and day
+-- Compile with `dbt compile --select dashboardScanStats`, then run the SQL from
+-- target/compiled/ in Snowflake. Compare the days before and after the cluster_by
+-- keys were deployed (pctPartitionsScanned should drop for date-filtered tiles).
+-- Needs access to SNOWFLAKE.ACCOUNT_USAGE (up to ~45 min latency). SELECTs issued by
+-- dbt itself are excluded through their dbtTransformations.* query tags.
+
+{% set tables = [
+    'factOrders', 'factClickstream',
+    'martSalesPerformance', 'martClickstreamConversion',
+    'martOperationalPerformance', 'martCustomerAnalytics',
+] %}
+
+WITH dashboardQueries AS (
+    SELECT
+        query_id,
+        DATE(start_time) AS queryDate,
+        query_text,
+        bytes_scanned,
+        partitions_scanned,
+        partitions_total,
+        total_elapsed_time
+    FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY
+    WHERE query_type = 'SELECT'
+      AND execution_status = 'SUCCESS'
+      AND database_name = '{{ target.database | upper }}'
+      AND COALESCE(query_tag, '') NOT LIKE 'dbtTransformations%'
+      AND start_time >= DATEADD(day, -{{ var('scan_stats_days', 14) }}, CURRENT_TIMESTAMP())
+),
+
+tables AS (
+    {% for table in tables %}
+    SELECT '{{ table }}' AS tableName{% if not loop.last %} UNION ALL{% endif %}
+    {% endfor %}
+)
+
+SELECT
+    t.tableName,
+    q.queryDate,
+    COUNT(*) AS queries,
+    SUM(q.bytes_scanned) AS bytesScanned,
+    SUM(q.partitions_scanned) AS partitionsScanned,
+    SUM(q.partitions_total) AS partitionsTotal,
+    ROUND(SUM(q.partitions_scanned) / NULLIF(SUM(q.partitions_total), 0) * 100, 1) AS pctPartitionsScanned,
+    ROUND(MEDIAN(q.total_elapsed_time) / 1000, 2) AS medianSeconds
+FROM dashboardQueries q
+INNER JOIN tables t
+    ON q.query_text ILIKE '%' || t.tableName || '%'
+GROUP BY 1, 2
+ORDER BY t.tableName, q.queryDate DESC
@@ -0,0 +1,26 @@
+-- Analysis: rows and bytes scanned per run of the incremental facts
+-- Compile with `dbt compile --select incrementalScanStats`, then run the SQL from
+-- target/compiled/ in Snowflake. Needs access to SNOWFLAKE.ACCOUNT_USAGE
+-- (up to ~45 min latency). Statements are matched on the query_tag each fact sets
+-- in its config() block.
+
+SELECT
+    query_tag,
+    DATE_TRUNC('minute', start_time) AS runStartedAt,
+    query_type,
+    COUNT(*) AS statements,
+    SUM(rows_produced) AS rowsProduced,
+    SUM(rows_inserted) AS rowsInserted,
+    SUM(rows_updated) AS rowsUpdated,
+    SUM(rows_deleted) AS rowsDeleted,
+    SUM(bytes_scanned) AS bytesScanned,
+    SUM(partitions_scanned) AS partitionsScanned,
+    SUM(partitions_total) AS partitionsTotal,
+    ROUND(SUM(partitions_scanned) / NULLIF(SUM(partitions_total), 0) * 100, 1) AS pctPartitionsScanned,
+    ROUND(SUM(total_elapsed_time) / 1000, 1) AS elapsedSeconds
+FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY
+WHERE query_tag IN ('dbtTransformations.factOrders', 'dbtTransformations.factClickstream')
+  AND start_time >= DATEADD(day, -{{ var('scan_stats_days', 14) }}, CURRENT_TIMESTAMP())
+  AND execution_status = 'SUCCESS'
+GROUP BY 1, 2, 3
+ORDER BY runStartedAt DESC, query_tag, query_type
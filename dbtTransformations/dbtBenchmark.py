@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+dbt Model Benchmark
+Times every model on the local DuckDB target at several data scales (1x, 10x,
+100x by default) and flags per-model regressions against a saved baseline,
+before they show up as warehouse credits.
+"""
+import sys
+import json
+import shutil
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+from localWarehouse import LocalWarehouse, REFERENCE_DIR
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+PROJECT_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT = PROJECT_DIR / 'target' / 'benchmark' / 'results.json'
+
+PROFILE_TEMPLATE = """
+supply_chain:
+  target: local
+  outputs:
+    local:
+      type: duckdb
+      path: "{path}"
+      threads: {threads}
+"""
+
+
+def dbt_invoke(args):
+    """Run a dbt command in-process; raises if any node failed"""
+    try:
+        from dbt.cli.main import dbtRunner
+    except ImportError:
+        raise ImportError("dbt not installed: pip install dbt-duckdb")
+
+    result = dbtRunner().invoke(args)
+    if not result.success:
+        raise RuntimeError(f"dbt {' '.join(args)} failed: {result.exception or 'see logs/dbt.log'}")
+
+
+def model_timings(run_results_path):
+    """{model or snapshot name: {'seconds', 'rows'}} from a run_results.json"""
+    with open(run_results_path, 'r', encoding='utf-8') as f:
+        run_results = json.load(f)
+    timings = {}
+    for node in run_results['results']:
+        if not node['unique_id'].startswith(('model.', 'snapshot.')):
+            continue
+        timings[node['unique_id'].split('.')[-1]] = {
+            'seconds': round(node['execution_time'], 3),
+            'rows': (node.get('adapter_response') or {}).get('rows_affected'),
+        }
+    return timings
+
+
+def run_scale(scale, source_dir, workdir, threads, incremental=True):
+    """Load the warehouse at one scale, then time a full build and an incremental rerun"""
+    database = workdir / f'SUPPLYCHAINDB_{scale}x.duckdb'
+    profiles_dir = workdir / f'profiles_{scale}x'
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+    (profiles_dir / 'profiles.yml').write_text(
+        PROFILE_TEMPLATE.format(path=database.as_posix(), threads=threads), encoding='utf-8'
+    )
+    rows = LocalWarehouse(database).load(source_dir, scale)
+
+    phases = {'full': ['--full-refresh']}
+    if incremental:
+        phases['incremental'] = []
+
+    report = {'rows': rows, 'phases': {}}
+    for phase, extra in phases.items():
+        target_path = workdir / f'target_{scale}x_{phase}'
+        dbt_invoke([
+            'build',
+            '--exclude-resource-type', 'test',
+            '--quiet',
+            '--project-dir', str(PROJECT_DIR),
+            '--profiles-dir', str(profiles_dir),
+            '--target-path', str(target_path),
+            '--target', 'local',
+            *extra,
+        ])
+        models = model_timings(target_path / 'run_results.json')
+        report['phases'][phase] = {
+            'models': models,
+            'seconds': round(sum(model['seconds'] for model in models.values()), 3),
+        }
+    return report
+
+
+def run_benchmark(scales, source_dir, threads=1, incremental=True):
+    """Benchmark every scale; returns {'scales': {scale: report}}"""
+    workdir = Path(tempfile.mkdtemp(prefix='dbtBenchmark_'))
+    try:
+        return {
+            'source': str(source_dir),
+            'threads': threads,
+            'scales': {
+                str(scale): run_scale(scale, source_dir, workdir, threads, incremental)
+                for scale in scales
+            },
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def find_regressions(results, baseline, threshold, min_seconds):
+    """Models whose time grew by more than threshold (fraction) and min_seconds vs. baseline"""
+    regressions = []
+    for scale, report in results['scales'].items():
+        for phase, timings in report['phases'].items():
+            previous = baseline.get('scales', {}).get(scale, {}).get('phases', {}).get(phase, {})
+            for model, timing in timings['models'].items():
+                before = previous.get('models', {}).get(model, {}).get('seconds')
+                if before is None:
+                    continue
+                growth = timing['seconds'] - before
+                if growth > min_seconds and growth > threshold * before:
+                    regressions.append({
+                        'scale': scale,
+                        'phase': phase,
+                        'model': model,
+                        'before': before,
+                        'after': timing['seconds'],
+                    })
+    return regressions
+
+
+def log_report(results):
+    scales = list(results['scales'])
+    for phase in ('full', 'incremental'):
+        reports = [results['scales'][scale]['phases'].get(phase) for scale in scales]
+        if not all(reports):
+            continue
+        logger.info(f"\n{phase} run (seconds per model)")
+        logger.info(f"  {'model':<34}" + ''.join(f"{scale + 'x':>10}" for scale in scales))
+        for model in sorted(reports[0]['models']):
+            cells = ''.join(f"{report['models'].get(model, {}).get('seconds', 0):>10.2f}" for report in reports)
+            logger.info(f"  {model:<34}{cells}")
+        logger.info(f"  {'total':<34}" + ''.join(f"{report['seconds']:>10.2f}" for report in reports))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Time every dbt model on the local DuckDB target at several data scales',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dbtBenchmark.py                                  # 1x, 10x, 100x of the reference CSVs
+  python dbtBenchmark.py -s ../localData/processed --scales 1 10
+  python dbtBenchmark.py --baseline target/benchmark/results.json   # Flag regressions (exit 1)
+        """
+    )
+    parser.add_argument(
+        '-s', '--source',
+        type=str,
+        default=str(REFERENCE_DIR),
+        help='Directory containing the processed CSVs (default: processedData (reference only))'
+    )
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100], help='Scale factors (default: 1 10 100)')
+    parser.add_argument('--threads', type=int, default=1, help='dbt threads (default: 1, for clean per-model timings)')
+    parser.add_argument('--skip-incremental', action='store_true', help='Only time the full-refresh build')
+    parser.add_argument('-o', '--output', type=str, default=str(DEFAULT_OUTPUT), help='Results JSON path')
+    parser.add_argument('--baseline', type=str, default=None, help='Previous results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown per model (default: 0.25 = 25%%)')
+    parser.add_argument('--min-seconds', type=float, default=0.05, help='Ignore slowdowns below this (default: 0.05s)')
+
+    args = parser.parse_args()
+
+    # Read the baseline first: by default it is the file this run overwrites
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = run_benchmark(args.scales, args.source, args.threads, not args.skip_incremental)
+    for scale, report in results['scales'].items():
+        rows = ', '.join(f"{table} {count:,}" for table, count in report['rows'].items())
+        logger.info(f"{scale}x: {rows}")
+    log_report(results)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    logger.info(f"\nResults: {output}")
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold, args.min_seconds)
+        for item in regressions:
+            logger.info(
+                f"Regression: {item['model']} ({item['scale']}x {item['phase']}) "
+                f"{item['before']:.2f}s → {item['after']:.2f}s"
+            )
+        if regressions:
+            return 1
+        logger.info("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Local DuckDB Warehouse
+Loads the processed CSVs into a DuckDB file laid out like Snowflake
+(<database>.RAWDATA), so the dbt project can run offline with the
+`local` target in profiles.yml.example. Optionally scales the data up by
+replicating rows under fresh ids, for benchmarking.
+"""
+import sys
+import csv
+import time
+import logging
+import argparse
+from pathlib import Path
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# Raw table definitions shared with the Snowflake loader
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'snowflakeIngestion'))
+from tableSchemas import TABLES, strptime_format  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+REFERENCE_DIR = Path(__file__).resolve().parent.parent / 'processedData (reference only)'
+DEFAULT_DATABASE = Path(__file__).resolve().parent / 'SUPPLYCHAINDB.duckdb'
+
+# Per-copy column rewrites when scaling: ids are shifted past the source's
+# maximum so every copy is a new set of orders, customers and visitors
+SCALE_REWRITES = {
+    'dataCoSupplyChainOrders': {
+        'orderId': 'orderId + copy * {orderId}',
+        'orderItemId': 'orderItemId + copy * {orderItemId}',
+        'customerId': 'customerId + copy * {customerId}',
+        'orderCustomerId': 'orderCustomerId + copy * {customerId}',
+    },
+    'clickstreamEvents': {
+        'ip': "ip || '-' || copy",
+        'sessionID': "ip || '-' || copy || substr(sessionID, length(ip) + 1)",
+    },
+    'clickstreamSessions': {
+        'ip': "ip || '-' || copy",
+        'sessionId': "ip || '-' || copy || substr(sessionId, length(ip) + 1)",
+    },
+}
+
+# Snowflake column types (tableSchemas.py) → DuckDB; VARCHAR lengths are dropped
+DUCKDB_TYPES = {
+    'INT': 'INT',
+    'INTEGER': 'INT',
+    'BIGINT': 'BIGINT',
+    'NUMBER': 'BIGINT',
+    'FLOAT': 'DOUBLE',
+    'DOUBLE': 'DOUBLE',
+    'REAL': 'DOUBLE',
+    'DATE': 'DATE',
+    'TIMESTAMP': 'TIMESTAMP',
+    'TIMESTAMP_NTZ': 'TIMESTAMP',
+}
+
+# Created empty when their file is absent (clickstreamSessions is not part of
+# the reference sample)
+OPTIONAL_TABLES = {'clickstreamSessions'}
+
+
+def duckdb_type(column_type):
+    """DuckDB type for a Snowflake column type ('VARCHAR(50)' → 'VARCHAR')"""
+    return DUCKDB_TYPES.get(column_type.upper().split('(')[0].strip(), 'VARCHAR')
+
+
+def duckdb_columns(table):
+    """(column, DuckDB type) pairs of a raw table, in CSV order"""
+    return [(column, duckdb_type(column_type)) for column, column_type in TABLES[table]['columns']]
+
+
+class LocalWarehouse:
+    """Load processed CSVs into DuckDB as <database>.RAWDATA"""
+
+    SCHEMA = 'RAWDATA'
+
+    def __init__(self, database_path=DEFAULT_DATABASE):
+        if duckdb is None:
+            raise ImportError("duckdb not installed: pip install duckdb dbt-duckdb")
+        self.database_path = Path(database_path)
+
+    @staticmethod
+    def _source_files(source_dir, filename):
+        """Every copy of filename under source_dir (single file or partitioned layout)"""
+        source_dir = Path(source_dir)
+        direct = source_dir / filename
+        if direct.exists():
+            return [direct]
+        return sorted(source_dir.rglob(filename))
+
+    @staticmethod
+    def _header_width(path):
+        """Number of fields in a CSV's header line"""
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            return len(next(csv.reader([f.readline()]), []))
+
+    def _load_table(self, con, table, source_dir):
+        spec = TABLES[table]
+        files = self._source_files(source_dir, spec['file'])
+        if not files and table not in OPTIONAL_TABLES:
+            raise FileNotFoundError(f"{spec['file']} not found under {source_dir}")
+
+        table_columns = duckdb_columns(table)
+        ddl = ', '.join(f'"{column}" {column_type}' for column, column_type in table_columns)
+        con.execute(f'CREATE OR REPLACE TABLE {self.SCHEMA}."{table}" ({ddl})')
+        if not files:
+            return 0
+
+        # Columns are mapped by position, as COPY INTO does on Snowflake. Files
+        # written before trailing columns were added fill only the leading ones.
+        by_width = {}
+        for path in files:
+            by_width.setdefault(self._header_width(path), []).append(path)
+        for width, paths in sorted(by_width.items()):
+            present = table_columns[:width]
+            columns = ', '.join(f"'{column}': '{column_type}'" for column, column_type in present)
+            names = ', '.join(f'"{column}"' for column, _ in present)
+            paths = ', '.join(f"'{path.as_posix()}'" for path in paths)
+            con.execute(f"""
+                INSERT INTO {self.SCHEMA}."{table}" ({names})
+                SELECT * FROM read_csv([{paths}],
+                    header = true,
+                    quote = '"',
+                    columns = {{{columns}}},
+                    timestampformat = '{strptime_format(spec['timestamp_format'])}',
+                    dateformat = '{strptime_format(spec['date_format'])}'
+                )
+            """)
+        return con.execute(f'SELECT COUNT(*) FROM {self.SCHEMA}."{table}"').fetchone()[0]
+
+    def _scale_table(self, con, table, scale):
+        """Append scale - 1 copies of the loaded rows under shifted ids"""
+        rewrites = SCALE_REWRITES[table]
+        spans = {}
+        for column in ('orderId', 'orderItemId', 'customerId'):
+            if any(f'{{{column}}}' in expression for expression in rewrites.values()):
+                spans[column] = con.execute(
+                    f'SELECT COALESCE(MAX("{column}"), 0) + 1 FROM {self.SCHEMA}."{table}"'
+                ).fetchone()[0]
+        replace = ', '.join(
+            f'{expression.format(**spans)} AS "{column}"' for column, expression in rewrites.items()
+        )
+        con.execute(f"""
+            INSERT INTO {self.SCHEMA}."{table}"
+            SELECT base.* REPLACE ({replace})
+            FROM (SELECT * FROM {self.SCHEMA}."{table}") base, range(1, {scale}) copies(copy)
+        """)
+        return con.execute(f'SELECT COUNT(*) FROM {self.SCHEMA}."{table}"').fetchone()[0]
+
+    def load(self, source_dir=REFERENCE_DIR, scale=1):
+        """(Re)create the raw tables from source_dir, replicated scale times;
+        returns {table: rows}"""
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        con = duckdb.connect(str(self.database_path))
+        try:
+            con.execute(f"CREATE SCHEMA IF NOT EXISTS {self.SCHEMA}")
+            counts = {}
+            for table in TABLES:
+                counts[table] = self._load_table(con, table, source_dir)
+                if scale > 1:
+                    counts[table] = self._scale_table(con, table, scale)
+            return counts
+        finally:
+            con.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Load processed CSVs into a local DuckDB warehouse for dbt',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python localWarehouse.py                                # Reference CSVs → SUPPLYCHAINDB.duckdb
+  python localWarehouse.py -s ../localData/processed      # Full processed output (single or partitioned)
+  python localWarehouse.py --scale 100                    # 100 copies under fresh order/customer/ip ids
+  dbt build --target local                                # Then run models + tests offline
+        """
+    )
+    parser.add_argument(
+        '-s', '--source',
+        type=str,
+        default=str(REFERENCE_DIR),
+        help='Directory containing the processed CSVs (default: processedData (reference only))'
+    )
+    parser.add_argument(
+        '-d', '--database',
+        type=str,
+        default=str(DEFAULT_DATABASE),
+        help='DuckDB file (default: SUPPLYCHAINDB.duckdb, the path in the local profile)'
+    )
+    parser.add_argument(
+        '--scale',
+        type=int,
+        default=1,
+        help='Replicate the source rows this many times (default: 1)'
+    )
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = LocalWarehouse(args.database).load(args.source, args.scale)
+    for table, rows in counts.items():
+        logger.info(f"Loaded: RAWDATA.{table} ({rows:,} rows)")
+    logger.info(f"Done in {time.perf_counter() - start:.2f}s → {args.database}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
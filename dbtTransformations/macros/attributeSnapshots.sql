@@ -0,0 +1,92 @@
+{#
+    Change detection for the customer and product snapshots in snapshots/.
+    Each snapshot selects the latest-wins attributes per id from rollupOrdersDaily
+    plus attributeHash, one hash of all attributes. The check strategy compares
+    that single column, so a new version is written only when an attribute
+    actually changed.
+#}
+
+{# md5 of the attributes joined with '|' (NULL hashed as an empty string) #}
+{% macro attribute_hash(columns) %}
+    {%- set fields = [] -%}
+    {%- for column in columns -%}
+        {%- do fields.append("COALESCE(CAST(" ~ column ~ " AS " ~ dbt.type_string() ~ "), '')") -%}
+        {%- if not loop.last %}{% do fields.append("'|'") %}{% endif -%}
+    {%- endfor -%}
+    {{ dbt.hash(dbt.concat(fields)) }}
+{%- endmacro %}
+
+{#
+    Snapshot query: one row per id with its latest attributes, attributeHash and
+    attributesFrom, the first order time after which those attributes held without
+    interruption. attributesFrom is the snapshot's updated_at, so dbt_valid_from /
+    dbt_valid_to are business time and facts can be joined point-in-time on orderDate.
+    Once the snapshot exists, only ids with orders from orders_lookback_days before
+    its latest attributesFrom on are re-checked (the others cannot have changed). With --full-refresh every id is
+    re-checked; the history itself is never rebuilt.
+#}
+{% macro latest_attributes(grain, key_column, attributes) %}
+{%- set snapshot_relation = adapter.get_relation(this.database, this.schema, this.identifier) if execute else none -%}
+WITH attributeDays AS (
+    SELECT
+        {{ key_column }},
+        dateKey,
+        firstOrderDate,
+        {% for column in attributes %}
+        {{ column }},
+        {% endfor %}
+        {{ attribute_hash(attributes) }} AS attributeHash
+    FROM {{ ref('rollupOrdersDaily') }}
+    WHERE grain = '{{ grain }}'
+      AND {{ key_column }} IS NOT NULL
+    {% if snapshot_relation is not none and not flags.FULL_REFRESH %}
+      -- High-water mark of the snapshot itself: the rollup already holds the
+      -- new batch, so its MAX(dateKey) would skip the batch's earlier days
+      AND dateKey >= (
+          SELECT {{ date_key(dbt.dateadd('day', -var('orders_lookback_days'), 'MAX(attributesFrom)')) }}
+          FROM {{ snapshot_relation }}
+      )
+    {% endif %}
+),
+
+latestAttributes AS (
+    SELECT
+        {{ key_column }},
+        {% for column in attributes %}
+        {{ latest_by(column, 'dateKey') }} AS {{ column }},
+        {% endfor %}
+        {{ latest_by('attributeHash', 'dateKey') }} AS attributeHash
+    FROM attributeDays
+    GROUP BY {{ key_column }}
+),
+
+lastOtherDay AS (
+    -- Last day with different attributes: the current ones hold after it
+    SELECT
+        d.{{ key_column }},
+        MAX(CASE WHEN d.attributeHash <> l.attributeHash THEN d.dateKey END) AS lastOtherDateKey
+    FROM attributeDays d
+    INNER JOIN latestAttributes l
+        ON d.{{ key_column }} = l.{{ key_column }}
+    GROUP BY d.{{ key_column }}
+),
+
+attributesFrom AS (
+    SELECT
+        d.{{ key_column }},
+        MIN(d.firstOrderDate) AS attributesFrom
+    FROM attributeDays d
+    INNER JOIN lastOtherDay o
+        ON d.{{ key_column }} = o.{{ key_column }}
+    WHERE o.lastOtherDateKey IS NULL
+       OR d.dateKey > o.lastOtherDateKey
+    GROUP BY d.{{ key_column }}
+)
+
+SELECT
+    l.*,
+    f.attributesFrom
+FROM latestAttributes l
+INNER JOIN attributesFrom f
+    ON l.{{ key_column }} = f.{{ key_column }}
+{%- endmacro %}
@@ -0,0 +1,55 @@
+{#
+    Adapter-dispatched replacements for Snowflake-only SQL, so the project also
+    runs on the local DuckDB target (see localWarehouse.py).
+    Snowflake keeps its original expressions via the snowflake__ implementations.
+#}
+
+{% macro month_name(date_expression) %}
+    {{ return(adapter.dispatch('month_name')(date_expression)) }}
+{% endmacro %}
+
+{% macro snowflake__month_name(date_expression) %}TO_CHAR({{ date_expression }}, 'MMMM'){% endmacro %}
+
+{% macro duckdb__month_name(date_expression) %}monthname({{ date_expression }}){% endmacro %}
+
+{% macro default__month_name(date_expression) %}TO_CHAR({{ date_expression }}, 'FMMonth'){% endmacro %}
+
+{# Calendar date of a timestamp (the dateKey used across facts, rollups and dimDates) #}
+{% macro date_key(timestamp_expression) %}
+    {{ return(adapter.dispatch('date_key')(timestamp_expression)) }}
+{% endmacro %}
+
+{% macro snowflake__date_key(timestamp_expression) %}DATE({{ timestamp_expression }}){% endmacro %}
+
+{% macro default__date_key(timestamp_expression) %}CAST({{ timestamp_expression }} AS DATE){% endmacro %}
+
+{# Day of week number, 0 = Sunday (Snowflake default WEEK_START) #}
+{% macro day_of_week(date_expression) %}
+    {{ return(adapter.dispatch('day_of_week')(date_expression)) }}
+{% endmacro %}
+
+{% macro snowflake__day_of_week(date_expression) %}DAYOFWEEK({{ date_expression }}){% endmacro %}
+
+{% macro duckdb__day_of_week(date_expression) %}dayofweek({{ date_expression }}){% endmacro %}
+
+{% macro default__day_of_week(date_expression) %}EXTRACT(DOW FROM {{ date_expression }}){% endmacro %}
+
+{# Day of month, 1-31 #}
+{% macro day_of_month(date_expression) %}
+    {{ return(adapter.dispatch('day_of_month')(date_expression)) }}
+{% endmacro %}
+
+{% macro snowflake__day_of_month(date_expression) %}DAY({{ date_expression }}){% endmacro %}
+
+{% macro default__day_of_month(date_expression) %}EXTRACT(DAY FROM {{ date_expression }}){% endmacro %}
+
+{# Value of `column` on the row with the largest `order_by` (latest-wins attribute); NULL values are kept #}
+{% macro latest_by(column, order_by) %}
+    {{ return(adapter.dispatch('latest_by')(column, order_by)) }}
+{% endmacro %}
+
+{% macro snowflake__latest_by(column, order_by) %}MAX_BY({{ column }}, {{ order_by }}){% endmacro %}
+
+{% macro duckdb__latest_by(column, order_by) %}arg_max_null({{ column }}, {{ order_by }}){% endmacro %}
+
+{% macro default__latest_by(column, order_by) %}MAX_BY({{ column }}, {{ order_by }}){% endmacro %}
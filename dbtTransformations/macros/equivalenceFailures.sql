@@ -0,0 +1,38 @@
+{#
+    Rows where `actual` (a relation) differs from `expected` (a SELECT statement):
+    keys present on only one side, or keys whose compared columns differ.
+    exact_columns must match exactly (NULL-safe); numeric_columns may differ by
+    a relative tolerance, since re-aggregating partial sums changes float rounding.
+    Used by the singular tests in tests/ that pin rebuilt models to their
+    original definitions.
+#}
+{% macro equivalence_failures(expected, actual, key_columns, exact_columns=[], numeric_columns=[], tolerance=0.000001) %}
+WITH expectedRows AS (
+    SELECT *, 1 AS rowPresent FROM ({{ expected }}) expectedQuery
+),
+actualRows AS (
+    SELECT *, 1 AS rowPresent FROM {{ actual }}
+)
+SELECT
+    CASE
+        WHEN e.rowPresent IS NULL THEN 'unexpected row'
+        WHEN a.rowPresent IS NULL THEN 'missing row'
+        ELSE 'value mismatch'
+    END AS failure,
+    {% for column in key_columns %}
+    COALESCE(e.{{ column }}, a.{{ column }}) AS {{ column }}{% if not loop.last %},{% endif %}
+    {% endfor %}
+FROM expectedRows e
+FULL OUTER JOIN actualRows a
+    ON {% for column in key_columns %}e.{{ column }} IS NOT DISTINCT FROM a.{{ column }}{% if not loop.last %}
+    AND {% endif %}{% endfor %}
+WHERE e.rowPresent IS NULL
+   OR a.rowPresent IS NULL
+   {% for column in exact_columns %}
+   OR e.{{ column }} IS DISTINCT FROM a.{{ column }}
+   {% endfor %}
+   {% for column in numeric_columns %}
+   OR (e.{{ column }} IS NULL) <> (a.{{ column }} IS NULL)
+   OR ABS(e.{{ column }} - a.{{ column }}) > {{ tolerance }} * GREATEST(1, ABS(e.{{ column }}))
+   {% endfor %}
+{% endmacro %}
@@ -0,0 +1,51 @@
+{#
+    Pruning-aware table layout for the facts, rollups and marts.
+    A model lists its keys once, in config(cluster_by=cluster_keys([...])):
+    Snowflake clusters the table on them (dbt-snowflake's native cluster_by),
+    other adapters get the same keys as a sort order through layout_order_by(),
+    so DuckDB's per-row-group min/max zonemaps can skip row groups on filters.
+    Keys go from the lowest to the highest cardinality, dateKey first.
+    --vars '{table_layout: false}' builds the tables unclustered (the benchmark's
+    "before").
+#}
+
+{% macro cluster_keys(columns) %}
+    {% if var('table_layout', true) %}
+        {{ return(columns) }}
+    {% endif %}
+    {{ return(none) }}
+{% endmacro %}
+
+{# Trailing ORDER BY for the model's cluster_by keys, where the adapter has no clustering #}
+{% macro layout_order_by() %}
+    {{ return(adapter.dispatch('layout_order_by')()) }}
+{% endmacro %}
+
+{# dbt-snowflake already sorts on cluster_by when it creates the table #}
+{% macro snowflake__layout_order_by() %}{% endmacro %}
+
+{% macro default__layout_order_by() %}
+    {%- set keys = config.get('cluster_by') -%}
+    {%- if keys -%}
+        {%- if keys is string %}{% set keys = [keys] %}{% endif -%}
+ORDER BY {{ keys | join(', ') }}
+    {%- endif -%}
+{% endmacro %}
+
+{#
+    Snowflake search optimization for point lookups on high-cardinality keys
+    (customerId, productId) that clustering on dateKey cannot prune.
+    Enterprise edition only and billed per table, so off unless
+    --vars '{search_optimization: true}'. Used as a post_hook.
+#}
+{% macro search_optimization(columns) %}
+    {{ return(adapter.dispatch('search_optimization')(columns)) }}
+{% endmacro %}
+
+{% macro snowflake__search_optimization(columns) %}
+    {%- if var('search_optimization', false) and columns -%}
+ALTER TABLE {{ this }} ADD SEARCH OPTIMIZATION ON EQUALITY({{ columns | join(', ') }})
+    {%- endif -%}
+{% endmacro %}
+
+{% macro default__search_optimization(columns) %}{% endmacro %}
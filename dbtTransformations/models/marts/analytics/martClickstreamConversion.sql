@@ -1,6 +1,10 @@
 -- Analytics Mart: Clickstream Conversion
 -- Pre-aggregated clickstream metrics by product, time, and event type
 -- Creates a table in martData schema for conversion funnel analysis
+-- Reads the daily partials in rollupClickstreamDaily (already at this mart's grain),
+-- so the build is two dimension joins instead of COUNT(DISTINCT) over every event
+
+{{ config(cluster_by=cluster_keys(['dateKey', 'productId'])) }}
 
 SELECT
     -- Time dimensions
@@ -8,50 +12,36 @@ SELECT
     dd.quarter,
     dd.monthName AS month,
     dd.dateKey,
-    fc.timeOfDay,
-    fc.isWeekend,
+    rc.timeOfDay,
+    rc.isWeekend,
     
     -- Product dimensions
-    fc.product,
+    rc.product,
     dp.productId,
     dp.categoryName,
     dp.departmentName,
     
     -- Event dimensions
-    fc.eventType,
-    fc.pageType,
+    rc.eventType,
+    rc.pageType,
     
     -- Aggregated metrics
-    COUNT(*) AS totalEvents,
-    COUNT(DISTINCT fc.sessionId) AS uniqueSessions,
-    COUNT(DISTINCT fc.product) AS uniqueProducts,
+    rc.totalEvents,
+    rc.uniqueSessions,
+    rc.uniqueProducts,
     
     -- Conversion metrics
-    COUNT(CASE WHEN fc.eventType = 'Page View' THEN 1 END) AS pageViews,
-    COUNT(CASE WHEN fc.eventType = 'Cart Add' THEN 1 END) AS cartAdds,
-    ROUND(COUNT(CASE WHEN fc.eventType = 'Cart Add' THEN 1 END) * 100.0 / 
-          NULLIF(COUNT(CASE WHEN fc.eventType = 'Page View' THEN 1 END), 0), 2) AS conversionRate,
+    rc.pageViews,
+    rc.cartAdds,
+    ROUND(rc.cartAdds * 100.0 / NULLIF(rc.pageViews, 0), 2) AS conversionRate,
     
     -- Session metrics
-    COUNT(DISTINCT CASE WHEN fc.eventType = 'Page View' THEN fc.sessionId END) AS sessionsWithViews,
-    COUNT(DISTINCT CASE WHEN fc.eventType = 'Cart Add' THEN fc.sessionId END) AS sessionsWithCartAdds
+    rc.sessionsWithViews,
+    rc.sessionsWithCartAdds
     
-FROM {{ ref('factClickstream') }} fc
+FROM {{ ref('rollupClickstreamDaily') }} rc
 INNER JOIN {{ ref('dimDates') }} dd
-    ON fc.dateKey = dd.dateKey
+    ON rc.dateKey = dd.dateKey
 LEFT JOIN {{ ref('dimProducts') }} dp
-    ON fc.productId = dp.productId
-GROUP BY 
-    dd.year,
-    dd.quarter,
-    dd.monthName,
-    dd.dateKey,
-    fc.timeOfDay,
-    fc.isWeekend,
-    fc.product,
-    dp.productId,
-    dp.categoryName,
-    dp.departmentName,
-    fc.eventType,
-    fc.pageType
-
+    ON rc.productId = dp.productId
+{{ layout_order_by() }}
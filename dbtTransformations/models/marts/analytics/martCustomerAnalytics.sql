@@ -2,6 +2,8 @@
 -- Pre-aggregated customer behavior and value metrics
 -- Creates a table in martData schema for customer segmentation analysis
 
+{{ config(cluster_by=cluster_keys(['customerId'])) }}
+
 SELECT
     -- Customer dimensions
     dc.customerId,
@@ -31,8 +33,8 @@ SELECT
     -- Calculated metrics
     dc.totalRevenue / NULLIF(dc.totalOrders, 0) AS revenuePerOrder,
     dc.totalProfit / NULLIF(dc.totalRevenue, 0) * 100 AS overallProfitMargin,
-    dc.totalOrders / NULLIF(DATEDIFF('day', dc.firstOrderDate, dc.lastOrderDate), 0) * 30 AS avgOrdersPerMonth
+    dc.totalOrders / NULLIF({{ dbt.datediff("dc.firstOrderDate", "dc.lastOrderDate", 'day') }}, 0) * 30 AS avgOrdersPerMonth
     
 FROM {{ ref('dimCustomers') }} dc
 WHERE dc.totalOrders > 0
-
+{{ layout_order_by() }}
@@ -2,6 +2,8 @@
 -- Pre-aggregated delivery and shipping metrics by status, mode, and geography
 -- Creates a table in martData schema for operational dashboards
 
+{{ config(cluster_by=cluster_keys(['year', 'quarter', 'market'])) }}
+
 SELECT
     -- Time dimensions
     dd.year,
@@ -55,4 +57,4 @@ GROUP BY
     dc.customerState,
     fo.orderRegion,
     fo.market
-
+{{ layout_order_by() }}
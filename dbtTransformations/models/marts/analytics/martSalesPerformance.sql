@@ -2,6 +2,8 @@
 -- Pre-aggregated sales metrics by time period, customer segment, and product category
 -- Creates a table in martData schema for BI dashboards
 
+{{ config(cluster_by=cluster_keys(['dateKey', 'categoryName'])) }}
+
 SELECT
     -- Time dimensions
     dd.year,
@@ -54,4 +56,4 @@ GROUP BY
     dc.customerState,
     dp.categoryName,
     dp.departmentName
-
+{{ layout_order_by() }}
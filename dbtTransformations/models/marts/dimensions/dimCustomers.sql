@@ -1,44 +1,85 @@
 -- Dimension: Customers (combines customer attributes + geography)
--- Creates a table in analyticalData schema
+-- Creates an incremental table in analyticalData schema
 -- One row per customer with aggregated metrics
+-- Metrics re-aggregate the customer rows of rollupOrdersDaily (the single scan of
+-- the order lines shared with dimProducts); attributes are the current version in
+-- customersSnapshot (latest-wins, versioned only when they change).
+-- Incremental runs only rebuild customers with orders in the last orders_lookback_days
+-- before the table's latest order, the only ones whose metrics or attributes can have
+-- changed, and MERGE them on customerId
+
+{{
+    config(
+        materialized='incremental',
+        unique_key='customerId',
+        incremental_strategy=('merge' if target.type == 'snowflake' else 'delete+insert'),
+        on_schema_change='append_new_columns'
+    )
+}}
+
+WITH customerDays AS (
+    SELECT *
+    FROM {{ ref('rollupOrdersDaily') }}
+    WHERE grain = 'customer'
+    {% if is_incremental() %}
+      AND customerId IN (
+          SELECT customerId
+          FROM {{ ref('rollupOrdersDaily') }}
+          WHERE grain = 'customer'
+            AND dateKey >= (
+                SELECT {{ date_key(dbt.dateadd('day', -var('orders_lookback_days'), 'MAX(lastOrderDate)')) }}
+                FROM {{ this }}
+            )
+      )
+    {% endif %}
+),
+
+currentAttributes AS (
+    SELECT *
+    FROM {{ ref('customersSnapshot') }}
+    WHERE dbt_valid_to IS NULL
+)
 
 SELECT
     -- Primary key
-    customerId,
-    
-    -- Customer attributes (consistent per customer - verified)
-    customerSegment,
-    customerCity,
-    customerState,
-    customerCountry,
-    customerZipcode,
-    customerFname,
-    customerLname,
-    customerStreet,
-    
+    cd.customerId,
+
+    -- Customer attributes (current snapshot version)
+    ca.customerSegment,
+    ca.customerCity,
+    ca.customerState,
+    ca.customerCountry,
+    ca.customerZipcode,
+    ca.customerFname,
+    ca.customerLname,
+    ca.customerStreet,
+    ca.dbt_valid_from AS attributesValidFrom,
+
     -- Aggregated metrics
-    COUNT(DISTINCT orderId) AS totalOrders,
-    SUM(revenue) AS totalRevenue,
-    SUM(profit) AS totalProfit,
-    AVG(revenue) AS avgOrderValue,
-    AVG(profitMarginPct) AS avgProfitMargin,
-    MIN(orderDate) AS firstOrderDate,
-    MAX(orderDate) AS lastOrderDate,
-    DATEDIFF('day', MIN(orderDate), MAX(orderDate)) AS customerLifespanDays,
-    
+    SUM(cd.orderCount) AS totalOrders,
+    SUM(cd.revenueSum) AS totalRevenue,
+    SUM(cd.profitSum) AS totalProfit,
+    SUM(cd.revenueSum) / NULLIF(SUM(cd.revenueCount), 0) AS avgOrderValue,
+    SUM(cd.marginSum) / NULLIF(SUM(cd.marginCount), 0) AS avgProfitMargin,
+    MIN(cd.firstOrderDate) AS firstOrderDate,
+    MAX(cd.lastOrderDate) AS lastOrderDate,
+    {{ dbt.datediff("MIN(cd.firstOrderDate)", "MAX(cd.lastOrderDate)", 'day') }} AS customerLifespanDays,
+
     -- Calculated metrics
-    SUM(revenue) / NULLIF(COUNT(DISTINCT orderId), 0) AS revenuePerOrder,
-    SUM(profit) / NULLIF(SUM(revenue), 0) * 100 AS overallProfitMargin
-    
-FROM {{ ref('stgSupplyChainOrders') }}
-GROUP BY 
-    customerId,
-    customerSegment,
-    customerCity,
-    customerState,
-    customerCountry,
-    customerZipcode,
-    customerFname,
-    customerLname,
-    customerStreet
+    SUM(cd.revenueSum) / NULLIF(SUM(cd.orderCount), 0) AS revenuePerOrder,
+    SUM(cd.profitSum) / NULLIF(SUM(cd.revenueSum), 0) * 100 AS overallProfitMargin
 
+FROM customerDays cd
+LEFT JOIN currentAttributes ca
+    ON cd.customerId = ca.customerId
+GROUP BY
+    cd.customerId,
+    ca.customerSegment,
+    ca.customerCity,
+    ca.customerState,
+    ca.customerCountry,
+    ca.customerZipcode,
+    ca.customerFname,
+    ca.customerLname,
+    ca.customerStreet,
+    ca.dbt_valid_from
@@ -0,0 +1,25 @@
+-- Dimension: Customer attribute history (SCD type 2)
+-- Creates a view in analyticalData schema over customersSnapshot
+-- One row per version of a customer's attributes; validFrom / validTo are order
+-- times (validTo NULL for the current version). Point-in-time join from a fact:
+--   ON fo.customerId = h.customerId AND fo.orderDate >= h.validFrom
+--  AND (fo.orderDate < h.validTo OR h.validTo IS NULL)
+-- History starts at the first snapshot; earlier orders match no version
+
+{{ config(materialized='view') }}
+
+SELECT
+    customerId,
+    dbt_scd_id AS customerVersionId,
+    customerSegment,
+    customerCity,
+    customerState,
+    customerCountry,
+    customerZipcode,
+    customerFname,
+    customerLname,
+    customerStreet,
+    dbt_valid_from AS validFrom,
+    dbt_valid_to AS validTo,
+    CASE WHEN dbt_valid_to IS NULL THEN TRUE ELSE FALSE END AS isCurrent
+FROM {{ ref('customersSnapshot') }}
@@ -3,7 +3,7 @@
 -- One row per unique date from order dates
 
 SELECT DISTINCT
-    DATE(orderDate) AS dateKey,
+    {{ date_key('orderDate') }} AS dateKey,
     
     -- Year attributes
     orderYear AS year,
@@ -19,12 +19,12 @@ SELECT DISTINCT
     
     -- Month attributes
     orderMonth AS month,
-    TO_CHAR(DATE(orderDate), 'MMMM') AS monthName,
+    {{ month_name(date_key('orderDate')) }} AS monthName,
     
     -- Day attributes
     orderDayOfWeek AS dayOfWeek,
-    DAYOFWEEK(DATE(orderDate)) AS dayOfWeekNumber,
-    DAY(DATE(orderDate)) AS dayOfMonth,
+    {{ day_of_week(date_key('orderDate')) }} AS dayOfWeekNumber,
+    {{ day_of_month(date_key('orderDate')) }} AS dayOfMonth,
     
     -- Business logic
     CASE 
@@ -1,33 +1,83 @@
 -- Dimension: Products (combines product + category attributes)
--- Creates a table in analyticalData schema
+-- Creates an incremental table in analyticalData schema
 -- One row per product with aggregated metrics
+-- Metrics re-aggregate the product rows of rollupOrdersDaily (the single scan of
+-- the order lines shared with dimCustomers); attributes are the current version in
+-- productsSnapshot (latest-wins, versioned only when they change).
+-- Incremental runs only rebuild products with orders in the last orders_lookback_days
+-- before the table's latest order and MERGE them on productId
+
+{{
+    config(
+        materialized='incremental',
+        unique_key='productId',
+        incremental_strategy=('merge' if target.type == 'snowflake' else 'delete+insert'),
+        on_schema_change='append_new_columns'
+    )
+}}
+
+WITH productDays AS (
+    SELECT *
+    FROM {{ ref('rollupOrdersDaily') }}
+    WHERE grain = 'product'
+    {% if is_incremental() %}
+      AND productId IN (
+          SELECT productId
+          FROM {{ ref('rollupOrdersDaily') }}
+          WHERE grain = 'product'
+            AND dateKey >= (
+                SELECT {{ date_key(dbt.dateadd('day', -var('orders_lookback_days'), 'MAX(lastOrderDate)')) }}
+                FROM {{ this }}
+            )
+      )
+    {% endif %}
+),
+
+currentAttributes AS (
+    SELECT *
+    FROM {{ ref('productsSnapshot') }}
+    WHERE dbt_valid_to IS NULL
+)
 
 SELECT
     -- Primary key
-    productId,
-    
-    -- Product attributes (consistent per product - verified)
-    MAX(productName) AS productName,
-    MAX(productPrice) AS productPrice,
-    MAX(productImage) AS productImage,
-    MAX(categoryName) AS categoryName,
-    MAX(categoryId) AS categoryId,
-    MAX(departmentName) AS departmentName,
-    MAX(departmentId) AS departmentId,
-    MAX(productCategoryId) AS productCategoryId,
-    
+    pd.productId,
+
+    -- Product attributes (current snapshot version)
+    pa.productName,
+    pa.productPrice,
+    pa.productImage,
+    pa.categoryName,
+    pa.categoryId,
+    pa.departmentName,
+    pa.departmentId,
+    pa.productCategoryId,
+    pa.dbt_valid_from AS attributesValidFrom,
+
     -- Aggregated metrics
-    COUNT(DISTINCT orderId) AS totalOrders,
-    SUM(revenue) AS totalSales,
-    SUM(profit) AS totalProfit,
-    AVG(profitMarginPct) AS avgProfitMargin,
-    AVG(orderItemQuantity) AS avgQuantityPerOrder,
-    SUM(orderItemQuantity) AS totalQuantitySold,
-    
+    SUM(pd.orderCount) AS totalOrders,
+    SUM(pd.revenueSum) AS totalSales,
+    SUM(pd.profitSum) AS totalProfit,
+    SUM(pd.marginSum) / NULLIF(SUM(pd.marginCount), 0) AS avgProfitMargin,
+    SUM(pd.quantitySum) / NULLIF(SUM(pd.quantityCount), 0) AS avgQuantityPerOrder,
+    SUM(pd.quantitySum) AS totalQuantitySold,
+    MAX(pd.lastOrderDate) AS lastOrderDate,
+
     -- Calculated metrics
-    SUM(revenue) / NULLIF(COUNT(DISTINCT orderId), 0) AS revenuePerOrder,
-    SUM(profit) / NULLIF(SUM(revenue), 0) * 100 AS overallProfitMargin
-    
-FROM {{ ref('stgSupplyChainOrders') }}
-GROUP BY productId
+    SUM(pd.revenueSum) / NULLIF(SUM(pd.orderCount), 0) AS revenuePerOrder,
+    SUM(pd.profitSum) / NULLIF(SUM(pd.revenueSum), 0) * 100 AS overallProfitMargin
 
+FROM productDays pd
+LEFT JOIN currentAttributes pa
+    ON pd.productId = pa.productId
+GROUP BY
+    pd.productId,
+    pa.productName,
+    pa.productPrice,
+    pa.productImage,
+    pa.categoryName,
+    pa.categoryId,
+    pa.departmentName,
+    pa.departmentId,
+    pa.productCategoryId,
+    pa.dbt_valid_from
@@ -0,0 +1,25 @@
+-- Dimension: Product attribute history (SCD type 2)
+-- Creates a view in analyticalData schema over productsSnapshot
+-- One row per version of a product's attributes; validFrom / validTo are order
+-- times (validTo NULL for the current version). Point-in-time join from a fact:
+--   ON fo.productId = h.productId AND fo.orderDate >= h.validFrom
+--  AND (fo.orderDate < h.validTo OR h.validTo IS NULL)
+-- History starts at the first snapshot; earlier orders match no version
+
+{{ config(materialized='view') }}
+
+SELECT
+    productId,
+    dbt_scd_id AS productVersionId,
+    productName,
+    productPrice,
+    productImage,
+    categoryName,
+    categoryId,
+    departmentName,
+    departmentId,
+    productCategoryId,
+    dbt_valid_from AS validFrom,
+    dbt_valid_to AS validTo,
+    CASE WHEN dbt_valid_to IS NULL THEN TRUE ELSE FALSE END AS isCurrent
+FROM {{ ref('productsSnapshot') }}
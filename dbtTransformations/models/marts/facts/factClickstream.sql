@@ -1,6 +1,21 @@
 -- Fact table: Clickstream Events (one row per event)
--- Creates a table in analyticalData schema
+-- Creates an incremental table in analyticalData schema
 -- Grain: sessionId + product + eventTimestamp
+-- Events have no unique id, so incremental runs replace whole days: every dateKey
+-- from the last clickstream_lookback_days before the table's latest event is
+-- deleted and re-inserted (delete+insert on dateKey)
+
+{{
+    config(
+        materialized='incremental',
+        unique_key='dateKey',
+        incremental_strategy='delete+insert',
+        on_schema_change='append_new_columns',
+        query_tag='dbtTransformations.factClickstream',
+        cluster_by=cluster_keys(['dateKey', 'productId']),
+        post_hook="{{ search_optimization(['productId']) }}"
+    )
+}}
 
 SELECT
     -- Primary key (composite: sessionId + product + eventTimestamp)
@@ -8,9 +23,10 @@ SELECT
     product,
     eventTimestamp,
     
-    -- Foreign keys to dimensions
-    dp.productId,  -- Matched via productName (LEFT JOIN for unmatched products)
-    DATE(eventTimestamp) AS dateKey,
+    -- Foreign keys to dimensions (integer ids resolved from the URL during
+    -- data preparation; NULL for products not in the orders dataset)
+    productId,
+    {{ date_key('eventTimestamp') }} AS dateKey,
     
     -- Event metrics
     eventType,
@@ -21,7 +37,9 @@ SELECT
     
     -- Additional context
     category,
+    categoryId,
     department,
+    departmentId,
     eventYear,
     eventMonth,
     eventQuarter,
@@ -31,10 +49,16 @@ SELECT
     ip,
     url
     
-FROM {{ ref('stgClickstream') }} cs
-LEFT JOIN {{ ref('dimProducts') }} dp
-    ON cs.product = dp.productName
+FROM {{ ref('stgClickstream') }}
 WHERE sessionId IS NOT NULL
   AND eventTimestamp IS NOT NULL
   AND product IS NOT NULL
-
+{% if is_incremental() %}
+  -- High-water mark on eventTimestamp, widened to whole days so each
+  -- replaced dateKey is reloaded completely
+  AND eventTimestamp >= (
+      SELECT {{ dbt.dateadd('day', -var('clickstream_lookback_days'), 'MAX(dateKey)') }}
+      FROM {{ this }}
+  )
+{% endif %}
+{{ layout_order_by() }}
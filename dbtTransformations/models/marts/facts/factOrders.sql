@@ -1,6 +1,20 @@
 -- Fact table: Orders (one row per order-item combination)
--- Creates a table in analyticalData schema
--- Grain: orderId + productId (one order can have multiple products)
+-- Creates an incremental table in analyticalData schema
+-- Grain: orderId + productId (one order can have multiple products), keyed by orderItemId
+-- Incremental runs only read orders from the last orders_lookback_days before the
+-- table's latest orderDate (late arrivals / restated lines) and MERGE them on orderItemId
+
+{{
+    config(
+        materialized='incremental',
+        unique_key='orderItemId',
+        incremental_strategy=('merge' if target.type == 'snowflake' else 'delete+insert'),
+        on_schema_change='append_new_columns',
+        query_tag='dbtTransformations.factOrders',
+        cluster_by=cluster_keys(['dateKey', 'productId', 'customerId']),
+        post_hook="{{ search_optimization(['customerId', 'productId']) }}"
+    )
+}}
 
 SELECT
     -- Primary key (composite: orderId + productId)
@@ -9,7 +23,7 @@ SELECT
     
     -- Foreign keys to dimensions
     customerId,
-    DATE(orderDate) AS dateKey,
+    {{ date_key('orderDate') }} AS dateKey,
     
     -- Financial metrics
     revenue,
@@ -49,4 +63,12 @@ WHERE orderId IS NOT NULL
   AND productId IS NOT NULL
   AND customerId IS NOT NULL
   AND orderDate IS NOT NULL
-
+  AND orderItemId IS NOT NULL
+{% if is_incremental() %}
+  -- High-water mark with a late-arrival lookback window
+  AND orderDate >= (
+      SELECT {{ dbt.dateadd('day', -var('orders_lookback_days'), 'MAX(orderDate)') }}
+      FROM {{ this }}
+  )
+{% endif %}
+{{ layout_order_by() }}
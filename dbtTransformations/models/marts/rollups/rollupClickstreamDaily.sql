@@ -0,0 +1,54 @@
+-- Rollup: Clickstream events per day (exact daily partials)
+-- Creates an incremental table in analyticalData schema
+-- Grain: dateKey + timeOfDay + isWeekend + product + productId + eventType + pageType
+-- sessionId is ip + event date, so a session never spans two days and the distinct
+-- session counts below stay exact when martClickstreamConversion reads them back.
+-- Incremental runs replace the last clickstream_lookback_days days (delete+insert on dateKey)
+
+{{
+    config(
+        materialized='incremental',
+        unique_key='dateKey',
+        incremental_strategy='delete+insert',
+        on_schema_change='append_new_columns',
+        cluster_by=cluster_keys(['dateKey', 'productId'])
+    )
+}}
+
+SELECT
+    -- Grain
+    dateKey,
+    timeOfDay,
+    isWeekend,
+    product,
+    productId,
+    eventType,
+    pageType,
+    
+    -- Event counts
+    COUNT(*) AS totalEvents,
+    COUNT(CASE WHEN eventType = 'Page View' THEN 1 END) AS pageViews,
+    COUNT(CASE WHEN eventType = 'Cart Add' THEN 1 END) AS cartAdds,
+    
+    -- Distinct counts (exact within a day)
+    COUNT(DISTINCT sessionId) AS uniqueSessions,
+    COUNT(DISTINCT product) AS uniqueProducts,
+    COUNT(DISTINCT CASE WHEN eventType = 'Page View' THEN sessionId END) AS sessionsWithViews,
+    COUNT(DISTINCT CASE WHEN eventType = 'Cart Add' THEN sessionId END) AS sessionsWithCartAdds
+    
+FROM {{ ref('factClickstream') }}
+{% if is_incremental() %}
+WHERE dateKey >= (
+    SELECT {{ dbt.dateadd('day', -var('clickstream_lookback_days'), 'MAX(dateKey)') }}
+    FROM {{ this }}
+)
+{% endif %}
+GROUP BY
+    dateKey,
+    timeOfDay,
+    isWeekend,
+    product,
+    productId,
+    eventType,
+    pageType
+{{ layout_order_by() }}
@@ -0,0 +1,67 @@
+-- Rollup: Orders per customer and per product per day (exact daily partials)
+-- Creates an incremental table in analyticalData schema
+-- Grain: dateKey + grain ('customer' → customerId, 'product' → productId)
+-- One scan of stgSupplyChainOrders feeds both dimCustomers and dimProducts:
+-- GROUPING SETS aggregates the same rows per (dateKey, customerId) and per
+-- (dateKey, productId), grouping on integer ids only. Attributes are latest-wins:
+-- the value on the day's highest orderItemId.
+-- Every line of an order shares one orderDate and one customer, so summing the
+-- daily orderCount gives the exact COUNT(DISTINCT orderId) per customer or product.
+-- Averages are stored as sum + count so they can be re-aggregated.
+-- Incremental runs replace the last orders_lookback_days days (delete+insert on dateKey)
+
+{{
+    config(
+        materialized='incremental',
+        unique_key='dateKey',
+        incremental_strategy='delete+insert',
+        on_schema_change='append_new_columns',
+        cluster_by=cluster_keys(['dateKey', 'grain'])
+    )
+}}
+
+{% set customer_attributes = ['customerSegment', 'customerCity', 'customerState', 'customerCountry',
+                              'customerZipcode', 'customerFname', 'customerLname', 'customerStreet'] %}
+{% set product_attributes = ['productName', 'productPrice', 'productImage', 'categoryName', 'categoryId',
+                             'departmentName', 'departmentId', 'productCategoryId'] %}
+
+SELECT
+    -- Grain
+    {{ date_key('orderDate') }} AS dateKey,
+    CASE WHEN GROUPING(productId) = 1 THEN 'customer' ELSE 'product' END AS grain,
+    customerId,
+    productId,
+
+    -- Latest-wins attributes (NULL on the other grain's rows)
+    {% for column in customer_attributes %}
+    CASE WHEN GROUPING(productId) = 1 THEN {{ latest_by(column, 'orderItemId') }} END AS {{ column }},
+    {% endfor %}
+    {% for column in product_attributes %}
+    CASE WHEN GROUPING(customerId) = 1 THEN {{ latest_by(column, 'orderItemId') }} END AS {{ column }},
+    {% endfor %}
+
+    -- Additive partials
+    COUNT(DISTINCT orderId) AS orderCount,
+    COUNT(*) AS orderItems,
+    SUM(revenue) AS revenueSum,
+    COUNT(revenue) AS revenueCount,
+    SUM(profit) AS profitSum,
+    SUM(profitMarginPct) AS marginSum,
+    COUNT(profitMarginPct) AS marginCount,
+    SUM(orderItemQuantity) AS quantitySum,
+    COUNT(orderItemQuantity) AS quantityCount,
+    MIN(orderDate) AS firstOrderDate,
+    MAX(orderDate) AS lastOrderDate
+
+FROM {{ ref('stgSupplyChainOrders') }}
+{% if is_incremental() %}
+WHERE orderDate >= (
+    SELECT {{ dbt.dateadd('day', -var('orders_lookback_days'), 'MAX(dateKey)') }}
+    FROM {{ this }}
+)
+{% endif %}
+GROUP BY GROUPING SETS (
+    ({{ date_key('orderDate') }}, customerId),
+    ({{ date_key('orderDate') }}, productId)
+)
+{{ layout_order_by() }}
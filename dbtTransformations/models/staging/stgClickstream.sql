@@ -8,6 +8,9 @@ SELECT
     product,
     category,
     department,
+    productId,
+    categoryId,
+    departmentId,
     
     -- Dates and time
     date AS eventTimestamp,
@@ -0,0 +1,28 @@
+-- Staging model: Clean and standardize precomputed clickstream sessions
+-- Creates a view in analyticalData schema
+-- One row per inactivity-timeout session (dataPreparation/clickstreamSessionization.py),
+-- so session-level metrics need no COUNT(DISTINCT) over the events
+-- Event rows (stgClickstream) keep the day-based sessionId; join them on ip and
+-- eventTimestamp BETWEEN sessionStart AND sessionEnd to get their timeout session
+
+SELECT
+    -- Identifiers
+    sessionId,
+    ip,
+    
+    -- Dates and time
+    sessionDate,
+    sessionStart,
+    sessionEnd,
+    durationMinutes,
+    
+    -- Session metrics
+    eventCount,
+    pageViews,
+    cartAdds,
+    distinctProducts,
+    isConverted
+    
+FROM {{ source('raw', 'clickstreamSessions') }}
+WHERE sessionId IS NOT NULL
+  AND sessionStart IS NOT NULL
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Dashboard Query Benchmark
+Builds the project on the local DuckDB target twice, without and with the
+cluster_by table layout (the table_layout var), and runs representative
+dashboard queries over the facts and marts on both. Reports rows scanned
+(DuckDB skips whole 122,880-row groups whose min/max zonemap misses the
+filter, the local stand-in for Snowflake's partitions scanned) and latency.
+"""
+import sys
+import json
+import shutil
+import logging
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+from localWarehouse import LocalWarehouse, REFERENCE_DIR
+from dbtBenchmark import PROFILE_TEMPLATE, PROJECT_DIR, dbt_invoke
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT = PROJECT_DIR / 'target' / 'benchmark' / 'queries.json'
+ANALYTICAL_SCHEMA = 'main_analyticalData'
+MART_SCHEMA = 'main_martData'
+
+# Dashboard tiles: date-range trends, drill-downs to one day, and lookups of
+# one customer or product. {a} / {m} are the analytical and mart schemas;
+# the other parameters are picked from the built data (see query_parameters).
+DASHBOARD_QUERIES = {
+    'salesTrendLast30Days': """
+        SELECT dateKey, SUM(totalRevenue) AS revenue, SUM(totalProfit) AS profit
+        FROM {m}.martSalesPerformance
+        WHERE dateKey BETWEEN DATE '{orders_to}' - INTERVAL 30 DAY AND DATE '{orders_to}'
+        GROUP BY dateKey ORDER BY dateKey
+    """,
+    'categoryRevenueLastQuarter': """
+        SELECT categoryName, SUM(totalRevenue) AS revenue, SUM(totalOrders) AS orders
+        FROM {m}.martSalesPerformance
+        WHERE dateKey >= DATE '{orders_to}' - INTERVAL 90 DAY
+        GROUP BY categoryName ORDER BY revenue DESC
+    """,
+    'ordersForOneDay': """
+        SELECT orderId, customerId, productId, revenue, deliveryStatus
+        FROM {a}.factOrders
+        WHERE dateKey = DATE '{orders_to}'
+    """,
+    'productDailySales': """
+        SELECT dateKey, SUM(revenue) AS revenue, SUM(quantity) AS units
+        FROM {a}.factOrders
+        WHERE productId = {product_id}
+          AND dateKey BETWEEN DATE '{orders_to}' - INTERVAL 30 DAY AND DATE '{orders_to}'
+        GROUP BY dateKey ORDER BY dateKey
+    """,
+    'customerOrderHistory': """
+        SELECT orderId, orderDate, revenue, profit
+        FROM {a}.factOrders
+        WHERE customerId = {customer_id}
+        ORDER BY orderDate
+    """,
+    'customerProfile': """
+        SELECT * FROM {m}.martCustomerAnalytics WHERE customerId = {customer_id}
+    """,
+    'operationalLastQuarter': """
+        SELECT market, shippingMode, SUM(lateDeliveries) AS late, SUM(totalDeliveries) AS deliveries
+        FROM {m}.martOperationalPerformance
+        WHERE year = {orders_year} AND quarter = {orders_quarter}
+        GROUP BY market, shippingMode
+    """,
+    'conversionLast7Days': """
+        SELECT productId, SUM(cartAdds) AS cartAdds, SUM(pageViews) AS pageViews
+        FROM {m}.martClickstreamConversion
+        WHERE dateKey BETWEEN DATE '{clicks_to}' - INTERVAL 7 DAY AND DATE '{clicks_to}'
+        GROUP BY productId
+    """,
+    'clickstreamForOneDay': """
+        SELECT sessionId, product, eventType, eventTimestamp
+        FROM {a}.factClickstream
+        WHERE dateKey = DATE '{clicks_to}'
+    """,
+}
+
+PROFILING_SETTINGS = json.dumps({'OPERATOR_ROWS_SCANNED': 'true', 'LATENCY': 'true', 'OPERATOR_TYPE': 'true'})
+
+
+def query_parameters(con):
+    """Latest order/event dates, the busiest product and a mid-range customer"""
+    orders_to = con.execute(f"SELECT MAX(dateKey) FROM {ANALYTICAL_SCHEMA}.factOrders").fetchone()[0]
+    clicks_to = con.execute(f"SELECT MAX(dateKey) FROM {ANALYTICAL_SCHEMA}.factClickstream").fetchone()[0]
+    product_id = con.execute(
+        f"SELECT productId FROM {ANALYTICAL_SCHEMA}.factOrders GROUP BY productId ORDER BY COUNT(*) DESC, productId LIMIT 1"
+    ).fetchone()[0]
+    customer_id = con.execute(f"SELECT MEDIAN(customerId)::BIGINT FROM {ANALYTICAL_SCHEMA}.factOrders").fetchone()[0]
+    return {
+        'orders_to': orders_to,
+        'orders_year': orders_to.year if orders_to else 'NULL',
+        'orders_quarter': f"'Q{(orders_to.month - 1) // 3 + 1}'" if orders_to else 'NULL',
+        'clicks_to': clicks_to or orders_to,
+        'product_id': product_id if product_id is not None else 'NULL',
+        'customer_id': customer_id if customer_id is not None else 'NULL',
+    }
+
+
+def _rows_scanned(node):
+    own = node.get('operator_rows_scanned', 0) if node.get('operator_type') == 'TABLE_SCAN' else 0
+    return own + sum(_rows_scanned(child) for child in node.get('children', []))
+
+
+def run_queries(database, workdir, repeat, parameters=None):
+    """{query: {'rowsScanned', 'milliseconds'}} on one built database; parameters default to its own data"""
+    if duckdb is None:
+        raise ImportError("duckdb not installed: pip install dbt-duckdb")
+
+    con = duckdb.connect(str(database))
+    try:
+        parameters = parameters or query_parameters(con)
+        profile_path = workdir / 'profile.json'
+        con.execute("PRAGMA enable_profiling='json'")
+        con.execute(f"PRAGMA profiling_output='{profile_path.as_posix()}'")
+        con.execute(f"SET custom_profiling_settings='{PROFILING_SETTINGS}'")
+
+        results = {}
+        for name, template in DASHBOARD_QUERIES.items():
+            sql = template.format(a=ANALYTICAL_SCHEMA, m=MART_SCHEMA, **parameters)
+            latencies = []
+            for _ in range(repeat):
+                con.execute(sql).fetchall()
+                with open(profile_path, 'r', encoding='utf-8') as f:
+                    profile = json.load(f)
+                latencies.append(profile['latency'])
+            results[name] = {
+                'rowsScanned': _rows_scanned(profile),
+                'milliseconds': round(statistics.median(latencies) * 1000, 2),
+            }
+        return results, parameters
+    finally:
+        con.close()
+
+
+def build(source_dir, scale, workdir, layout, threads):
+    """Load and build one warehouse with table_layout on or off; returns its path"""
+    name = 'layout' if layout else 'noLayout'
+    database = workdir / f'SUPPLYCHAINDB_{name}.duckdb'
+    profiles_dir = workdir / f'profiles_{name}'
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+    (profiles_dir / 'profiles.yml').write_text(
+        PROFILE_TEMPLATE.format(path=database.as_posix(), threads=threads), encoding='utf-8'
+    )
+    LocalWarehouse(database).load(source_dir, scale)
+    dbt_invoke([
+        'build',
+        '--exclude-resource-type', 'test',
+        '--quiet',
+        '--project-dir', str(PROJECT_DIR),
+        '--profiles-dir', str(profiles_dir),
+        '--target-path', str(workdir / f'target_{name}'),
+        '--target', 'local',
+        '--full-refresh',
+        '--vars', json.dumps({'table_layout': layout}),
+    ])
+    return database
+
+
+def run_benchmark(source_dir, scale, repeat=5, threads=1):
+    """Build both layouts and run every dashboard query on each with the same parameters"""
+    workdir = Path(tempfile.mkdtemp(prefix='queryBenchmark_'))
+    try:
+        before_db = build(source_dir, scale, workdir, False, threads)
+        after_db = build(source_dir, scale, workdir, True, threads)
+        before, parameters = run_queries(before_db, workdir, repeat)
+        after, _ = run_queries(after_db, workdir, repeat, parameters)
+        return {
+            'source': str(source_dir),
+            'scale': scale,
+            'parameters': {key: str(value) for key, value in parameters.items()},
+            'queries': {name: {'before': before[name], 'after': after[name]} for name in DASHBOARD_QUERIES},
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def log_report(results):
+    logger.info(f"\n{'query':<28}{'rows scanned before':>20}{'after':>14}{'pruned':>8}{'ms before':>11}{'after':>8}")
+    for name, result in results['queries'].items():
+        before, after = result['before'], result['after']
+        pruned = 1 - after['rowsScanned'] / before['rowsScanned'] if before['rowsScanned'] else 0
+        logger.info(
+            f"{name:<28}{before['rowsScanned']:>20,}{after['rowsScanned']:>14,}{pruned:>8.0%}"
+            f"{before['milliseconds']:>11.1f}{after['milliseconds']:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rows scanned and latency of dashboard queries, without and with the cluster_by layout',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python queryBenchmark.py                                  # Reference CSVs at 100x
+  python queryBenchmark.py -s ../localData/processed --scale 10
+  python queryBenchmark.py --repeat 20 -o /tmp/queries.json
+        """
+    )
+    parser.add_argument(
+        '-s', '--source',
+        type=str,
+        default=str(REFERENCE_DIR),
+        help='Directory containing the processed CSVs (default: processedData (reference only))'
+    )
+    parser.add_argument('--scale', type=int, default=100,
+                        help='Scale factor; pruning only shows once tables span several row groups (default: 100)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per query, median latency reported (default: 5)')
+    parser.add_argument('--threads', type=int, default=1, help='dbt threads for the builds (default: 1)')
+    parser.add_argument('-o', '--output', type=str, default=str(DEFAULT_OUTPUT), help='Results JSON path')
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.source, args.scale, args.repeat, args.threads)
+    log_report(results)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    logger.info(f"\nResults: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+-- Snapshot: customer attributes (SCD type 2)
+-- One version per change of a customer's segment, name or address, detected by
+-- comparing attributeHash (check strategy). dbt_valid_from / dbt_valid_to are the
+-- order times the attributes took effect and were replaced (updated_at = attributesFrom).
+-- Feeds dimCustomers (current version) and dimCustomersHistory (every version)
+
+{% snapshot customersSnapshot %}
+
+{{
+    config(
+        unique_key='customerId',
+        strategy='check',
+        check_cols=['attributeHash'],
+        updated_at='attributesFrom'
+    )
+}}
+
+{{ latest_attributes('customer', 'customerId', [
+    'customerSegment', 'customerCity', 'customerState', 'customerCountry',
+    'customerZipcode', 'customerFname', 'customerLname', 'customerStreet',
+]) }}
+
+{% endsnapshot %}
@@ -0,0 +1,23 @@
+-- Snapshot: product attributes (SCD type 2)
+-- One version per change of a product's name, price, image or category, detected
+-- by comparing attributeHash (check strategy). dbt_valid_from / dbt_valid_to are the
+-- order times the attributes took effect and were replaced (updated_at = attributesFrom).
+-- Feeds dimProducts (current version) and dimProductsHistory (every version)
+
+{% snapshot productsSnapshot %}
+
+{{
+    config(
+        unique_key='productId',
+        strategy='check',
+        check_cols=['attributeHash'],
+        updated_at='attributesFrom'
+    )
+}}
+
+{{ latest_attributes('product', 'productId', [
+    'productName', 'productPrice', 'productImage', 'categoryName', 'categoryId',
+    'departmentName', 'departmentId', 'productCategoryId',
+]) }}
+
+{% endsnapshot %}
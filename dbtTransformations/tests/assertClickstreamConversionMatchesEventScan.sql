@@ -0,0 +1,55 @@
+-- Equivalence test: martClickstreamConversion (rebuilt from rollupClickstreamDaily)
+-- must match the original COUNT(DISTINCT sessionId) aggregation over factClickstream
+-- Returns one row per mismatching mart row; passes when empty
+
+{% set expected %}
+SELECT
+    dd.year,
+    dd.quarter,
+    dd.monthName AS month,
+    dd.dateKey,
+    fc.timeOfDay,
+    fc.isWeekend,
+    fc.product,
+    dp.productId,
+    dp.categoryName,
+    dp.departmentName,
+    fc.eventType,
+    fc.pageType,
+    COUNT(*) AS totalEvents,
+    COUNT(DISTINCT fc.sessionId) AS uniqueSessions,
+    COUNT(DISTINCT fc.product) AS uniqueProducts,
+    COUNT(CASE WHEN fc.eventType = 'Page View' THEN 1 END) AS pageViews,
+    COUNT(CASE WHEN fc.eventType = 'Cart Add' THEN 1 END) AS cartAdds,
+    ROUND(COUNT(CASE WHEN fc.eventType = 'Cart Add' THEN 1 END) * 100.0 /
+          NULLIF(COUNT(CASE WHEN fc.eventType = 'Page View' THEN 1 END), 0), 2) AS conversionRate,
+    COUNT(DISTINCT CASE WHEN fc.eventType = 'Page View' THEN fc.sessionId END) AS sessionsWithViews,
+    COUNT(DISTINCT CASE WHEN fc.eventType = 'Cart Add' THEN fc.sessionId END) AS sessionsWithCartAdds
+FROM {{ ref('factClickstream') }} fc
+INNER JOIN {{ ref('dimDates') }} dd
+    ON fc.dateKey = dd.dateKey
+LEFT JOIN {{ ref('dimProducts') }} dp
+    ON fc.productId = dp.productId
+GROUP BY
+    dd.year,
+    dd.quarter,
+    dd.monthName,
+    dd.dateKey,
+    fc.timeOfDay,
+    fc.isWeekend,
+    fc.product,
+    dp.productId,
+    dp.categoryName,
+    dp.departmentName,
+    fc.eventType,
+    fc.pageType
+{% endset %}
+
+{{ equivalence_failures(
+    expected,
+    ref('martClickstreamConversion'),
+    key_columns=['dateKey', 'timeOfDay', 'isWeekend', 'product', 'productId', 'eventType', 'pageType'],
+    exact_columns=['year', 'quarter', 'month', 'categoryName', 'departmentName', 'totalEvents',
+                   'uniqueSessions', 'uniqueProducts', 'pageViews', 'cartAdds', 'conversionRate',
+                   'sessionsWithViews', 'sessionsWithCartAdds']
+) }}
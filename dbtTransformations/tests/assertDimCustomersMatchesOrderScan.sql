@@ -0,0 +1,50 @@
+-- Equivalence test: dimCustomers (rebuilt from rollupOrdersDaily) must match
+-- the original full scan of stgSupplyChainOrders with COUNT(DISTINCT orderId),
+-- one row per customerId with the attributes of the customer's latest order line
+-- (latest order day, then highest orderItemId)
+-- Returns one row per mismatching customer; passes when empty
+
+{% set expected %}
+WITH orderLines AS (
+    SELECT
+        *,
+        ROW_NUMBER() OVER (
+            PARTITION BY customerId
+            ORDER BY {{ date_key('orderDate') }} DESC NULLS LAST, orderItemId DESC NULLS LAST
+        ) AS lineRank
+    FROM {{ ref('stgSupplyChainOrders') }}
+)
+SELECT
+    customerId,
+    MAX(CASE WHEN lineRank = 1 THEN customerSegment END) AS customerSegment,
+    MAX(CASE WHEN lineRank = 1 THEN customerCity END) AS customerCity,
+    MAX(CASE WHEN lineRank = 1 THEN customerState END) AS customerState,
+    MAX(CASE WHEN lineRank = 1 THEN customerCountry END) AS customerCountry,
+    MAX(CASE WHEN lineRank = 1 THEN customerZipcode END) AS customerZipcode,
+    MAX(CASE WHEN lineRank = 1 THEN customerFname END) AS customerFname,
+    MAX(CASE WHEN lineRank = 1 THEN customerLname END) AS customerLname,
+    MAX(CASE WHEN lineRank = 1 THEN customerStreet END) AS customerStreet,
+    COUNT(DISTINCT orderId) AS totalOrders,
+    SUM(revenue) AS totalRevenue,
+    SUM(profit) AS totalProfit,
+    AVG(revenue) AS avgOrderValue,
+    AVG(profitMarginPct) AS avgProfitMargin,
+    MIN(orderDate) AS firstOrderDate,
+    MAX(orderDate) AS lastOrderDate,
+    {{ dbt.datediff("MIN(orderDate)", "MAX(orderDate)", 'day') }} AS customerLifespanDays,
+    SUM(revenue) / NULLIF(COUNT(DISTINCT orderId), 0) AS revenuePerOrder,
+    SUM(profit) / NULLIF(SUM(revenue), 0) * 100 AS overallProfitMargin
+FROM orderLines
+GROUP BY customerId
+{% endset %}
+
+{{ equivalence_failures(
+    expected,
+    ref('dimCustomers'),
+    key_columns=['customerId'],
+    exact_columns=['customerSegment', 'customerCity', 'customerState', 'customerCountry', 'customerZipcode',
+                   'customerFname', 'customerLname', 'customerStreet',
+                   'totalOrders', 'firstOrderDate', 'lastOrderDate', 'customerLifespanDays'],
+    numeric_columns=['totalRevenue', 'totalProfit', 'avgOrderValue', 'avgProfitMargin',
+                     'revenuePerOrder', 'overallProfitMargin']
+) }}
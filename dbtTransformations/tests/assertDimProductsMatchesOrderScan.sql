@@ -0,0 +1,47 @@
+-- Equivalence test: dimProducts (rebuilt from rollupOrdersDaily) must match
+-- the original full scan of stgSupplyChainOrders with COUNT(DISTINCT orderId),
+-- with the attributes of the product's latest order line (latest order day, then
+-- highest orderItemId)
+-- Returns one row per mismatching product; passes when empty
+
+{% set expected %}
+WITH orderLines AS (
+    SELECT
+        *,
+        ROW_NUMBER() OVER (
+            PARTITION BY productId
+            ORDER BY {{ date_key('orderDate') }} DESC NULLS LAST, orderItemId DESC NULLS LAST
+        ) AS lineRank
+    FROM {{ ref('stgSupplyChainOrders') }}
+)
+SELECT
+    productId,
+    MAX(CASE WHEN lineRank = 1 THEN productName END) AS productName,
+    MAX(CASE WHEN lineRank = 1 THEN productPrice END) AS productPrice,
+    MAX(CASE WHEN lineRank = 1 THEN productImage END) AS productImage,
+    MAX(CASE WHEN lineRank = 1 THEN categoryName END) AS categoryName,
+    MAX(CASE WHEN lineRank = 1 THEN categoryId END) AS categoryId,
+    MAX(CASE WHEN lineRank = 1 THEN departmentName END) AS departmentName,
+    MAX(CASE WHEN lineRank = 1 THEN departmentId END) AS departmentId,
+    MAX(CASE WHEN lineRank = 1 THEN productCategoryId END) AS productCategoryId,
+    COUNT(DISTINCT orderId) AS totalOrders,
+    SUM(revenue) AS totalSales,
+    SUM(profit) AS totalProfit,
+    AVG(profitMarginPct) AS avgProfitMargin,
+    AVG(orderItemQuantity) AS avgQuantityPerOrder,
+    SUM(orderItemQuantity) AS totalQuantitySold,
+    SUM(revenue) / NULLIF(COUNT(DISTINCT orderId), 0) AS revenuePerOrder,
+    SUM(profit) / NULLIF(SUM(revenue), 0) * 100 AS overallProfitMargin
+FROM orderLines
+GROUP BY productId
+{% endset %}
+
+{{ equivalence_failures(
+    expected,
+    ref('dimProducts'),
+    key_columns=['productId'],
+    exact_columns=['productName', 'productPrice', 'productImage', 'categoryName', 'categoryId',
+                   'departmentName', 'departmentId', 'productCategoryId', 'totalOrders', 'totalQuantitySold'],
+    numeric_columns=['totalSales', 'totalProfit', 'avgProfitMargin', 'avgQuantityPerOrder',
+                     'revenuePerOrder', 'overallProfitMargin']
+) }}
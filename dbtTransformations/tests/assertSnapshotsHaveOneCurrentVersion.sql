@@ -0,0 +1,16 @@
+-- Snapshot integrity: every customer and product has exactly one current version,
+-- and versions never end before they start
+-- Returns one row per offending id; passes when empty
+
+{% for snapshot, key_column in [('customersSnapshot', 'customerId'), ('productsSnapshot', 'productId')] %}
+SELECT
+    '{{ snapshot }}' AS snapshotName,
+    {{ key_column }} AS entityId,
+    SUM(CASE WHEN dbt_valid_to IS NULL THEN 1 ELSE 0 END) AS currentVersions,
+    SUM(CASE WHEN dbt_valid_to < dbt_valid_from THEN 1 ELSE 0 END) AS invertedVersions
+FROM {{ ref(snapshot) }}
+GROUP BY {{ key_column }}
+HAVING SUM(CASE WHEN dbt_valid_to IS NULL THEN 1 ELSE 0 END) <> 1
+    OR SUM(CASE WHEN dbt_valid_to < dbt_valid_from THEN 1 ELSE 0 END) > 0
+{% if not loop.last %}UNION ALL{% endif %}
+{% endfor %}
@@ -0,0 +1,198 @@
+"""
+Stage Metrics
+Per-stage wall time, bytes moved and rows for one pipeline run, shared by
+the fetcher and the loader. A run is written as one JSON document and,
+optionally, as an OpenMetrics text file for a node-exporter textfile
+collector or a Pushgateway.
+"""
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import threading
+import traceback
+from datetime import datetime, timezone
+from contextlib import contextmanager
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+
+
+class Stage:
+    """One stage of a run; set bytes/rows/files (or extra fields) inside the with-block"""
+
+    def __init__(self, name, labels=None):
+        self.name = name
+        self.labels = dict(labels or {})
+        self.started_at = _now()
+        self.seconds = None
+        self.bytes = None
+        self.rows = None
+        self.files = None
+        self.status = 'ok'
+        self.error = None
+        self.extra = {}
+
+    def add(self, bytes=0, rows=0):
+        """Accumulate bytes/rows (e.g. once per COPY batch)"""
+        if bytes:
+            self.bytes = (self.bytes or 0) + bytes
+        if rows:
+            self.rows = (self.rows or 0) + rows
+
+    def to_dict(self):
+        record = {
+            'stage': self.name,
+            **self.labels,
+            'started_at': self.started_at,
+            'seconds': self.seconds,
+            'status': self.status,
+        }
+        rate_seconds = max(self.seconds or 0, 1e-6)
+        if self.bytes is not None:
+            record['bytes'] = self.bytes
+            record['bytes_per_second'] = round(self.bytes / rate_seconds, 1)
+        if self.rows is not None:
+            record['rows'] = self.rows
+            record['rows_per_second'] = round(self.rows / rate_seconds, 1)
+        if self.error:
+            record['error'] = self.error
+        record.update(self.extra)
+        if self.files is not None:
+            record['files'] = self.files
+        return record
+
+
+class StageMetrics:
+    """Stages recorded during one run of a pipeline (thread-safe)"""
+
+    def __init__(self, pipeline, run_id=None):
+        self.pipeline = pipeline
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.started_at = _now()
+        self.stages = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name, **labels):
+        """Time a stage; an exception marks it failed (with the error) and propagates"""
+        stage = Stage(name, labels)
+        start = time.perf_counter()
+        try:
+            yield stage
+        except BaseException as e:
+            stage.status = 'error'
+            stage.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            stage.seconds = round(time.perf_counter() - start, 3)
+            with self._lock:
+                self.stages.append(stage)
+
+    def failed_stage(self):
+        """Name of the first stage that raised, or None"""
+        with self._lock:
+            return next((stage.name for stage in self.stages if stage.status == 'error'), None)
+
+    def timings(self):
+        """{stage: seconds}"""
+        with self._lock:
+            return {stage.name: stage.seconds for stage in self.stages}
+
+    def to_dict(self, error=None):
+        with self._lock:
+            stages = [stage.to_dict() for stage in self.stages]
+        failed = error is not None or any(stage['status'] == 'error' for stage in stages)
+        document = {
+            'pipeline': self.pipeline,
+            'run_id': self.run_id,
+            'started_at': self.started_at,
+            'seconds': round(time.perf_counter() - self._start, 3),
+            'status': 'error' if failed else 'ok',
+            'stages': stages,
+        }
+        if error is not None:
+            document['error'] = {
+                'type': type(error).__name__,
+                'message': str(error),
+                'traceback': ''.join(traceback.format_exception(type(error), error, error.__traceback__)),
+            }
+        return document
+
+    def write(self, json_path=None, openmetrics_path=None, error=None):
+        write_metrics(self.to_dict(error), json_path, openmetrics_path)
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _metric_name(pipeline):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', pipeline)
+
+
+METRICS = (
+    ('stage_seconds', 'gauge', 'Wall-clock seconds of the stage', 'seconds'),
+    ('stage_bytes', 'gauge', 'Bytes moved by the stage', 'bytes'),
+    ('stage_rows', 'gauge', 'Rows processed by the stage', 'rows'),
+    ('stage_rows_per_second', 'gauge', 'Rows per second of the stage', 'rows_per_second'),
+    ('stage_success', 'gauge', '1 when the stage completed, 0 when it raised', None),
+)
+
+
+def to_openmetrics(document):
+    """OpenMetrics exposition of a StageMetrics.to_dict() document"""
+    prefix = _metric_name(document['pipeline'])
+    lines = []
+    for suffix, kind, help_text, field in METRICS:
+        name = f"{prefix}_{suffix}"
+        samples = []
+        for stage in document['stages']:
+            value = (1 if stage['status'] == 'ok' else 0) if field is None else stage.get(field)
+            if value is None:
+                continue
+            # No run_id label, so every run updates the same series
+            labels = {'stage': stage['stage']}
+            if stage.get('table'):
+                labels['table'] = stage['table']
+            label_text = ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+            samples.append(f"{name}{{{label_text}}} {value}")
+        if samples:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+    lines.append(f"# HELP {prefix}_run Run that wrote these metrics")
+    lines.append(f"# TYPE {prefix}_run info")
+    lines.append(f'{prefix}_run_info{{run_id="{_escape(document["run_id"])}",'
+                 f'started_at="{_escape(document["started_at"])}"}} 1')
+    lines.append(f"# HELP {prefix}_run_success 1 when the run completed without error")
+    lines.append(f"# TYPE {prefix}_run_success gauge")
+    lines.append(f"{prefix}_run_success {1 if document['status'] == 'ok' else 0}")
+    lines.append(f"# HELP {prefix}_run_seconds Wall-clock seconds of the run")
+    lines.append(f"# TYPE {prefix}_run_seconds gauge")
+    lines.append(f"{prefix}_run_seconds {document['seconds']}")
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
+
+
+def write_metrics(document, json_path=None, openmetrics_path=None):
+    """Write a to_dict() document as JSON ('-' for stdout) and/or OpenMetrics text"""
+    if json_path == '-':
+        sys.stdout.write(json.dumps(document, indent=2, default=str) + '\n')
+    elif json_path:
+        _write_atomic(json_path, json.dumps(document, indent=2, default=str) + '\n')
+    if openmetrics_path:
+        _write_atomic(openmetrics_path, to_openmetrics(document))
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
@@ -6,302 +6,604 @@ Loads processed data from S3 into Snowflake tables using COPY INTO commands.
 import os
 import sys
 import re
+import json
+import time
+import itertools
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+from tableSchemas import TABLES, column_list, create_table_sql
+from schemaInference import SchemaCache, parse_header
+from snowflakeSession import ConnectionPool, RoundTrips, connection_settings
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'pipelineMetrics'))
+from stageMetrics import StageMetrics, write_metrics  # noqa: E402
 
 try:
     import snowflake.connector
 except ImportError:
-    print("❌ snowflake-connector-python not installed")
-    print("   Install: pip install snowflake-connector-python")
-    sys.exit(1)
+    snowflake = None
+
 
+class LoadManifest:
+    """Local record of the S3 files already loaded into each table.
 
-def to_camel_case(name):
-    """Convert column name to camelCase"""
-    # Remove quotes and spaces, convert to camelCase
-    name = name.strip('"').strip()
-    # Split by spaces and special characters
-    parts = re.split(r'[\s_()]+', name)
-    # First part lowercase, rest capitalize
-    camel = parts[0].lower() + ''.join(word.capitalize() for word in parts[1:] if word)
-    return camel
+    Stored as JSON: {table: {relative_path: {"md5": ..., "size": ..., "loaded_at": ...}}}.
+    The md5 is the value Snowflake's LIST reports for the object, so a
+    re-uploaded partition with new content shows up as changed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._tables = json.load(f)
+        except FileNotFoundError:
+            self._tables = {}
+
+    def files(self, table):
+        with self._lock:
+            return dict(self._tables.get(table, {}))
+
+    def reset(self, table):
+        with self._lock:
+            self._tables[table] = {}
+
+    def record(self, table, files):
+        """Mark {relative_path: {"md5", "size"}} as loaded and persist"""
+        loaded_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self._lock:
+            entries = self._tables.setdefault(table, {})
+            for name, entry in files.items():
+                entries[name] = {**entry, 'loaded_at': loaded_at}
+            # Write-then-rename so a crash never leaves a truncated manifest
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._tables, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
 
 
 class SnowflakeDataLoader:
     """Load data from S3 to Snowflake tables"""
 
-    def __init__(self):
-        self.account = os.getenv('SNOWFLAKE_ACCOUNT')
-        self.user = os.getenv('SNOWFLAKE_USER')
-        self.password = os.getenv('SNOWFLAKE_PASSWORD')
-        self.warehouse = os.getenv('SNOWFLAKE_WAREHOUSE', 'COMPUTE_WH')
+    # Snowflake accepts at most 1,000 names in a COPY ... FILES list
+    COPY_FILES_LIMIT = 1000
+    # Directory value the preparation stages use for rows without a date
+    NULL_PARTITION = 'unknown'
+    # Staged file types: positional CSV, or Parquet from parquetConverter.py
+    # loaded by column name
+    FILE_TYPES = ('csv', 'parquet')
+    # COPY result columns kept per file in the stage metrics
+    COPY_RESULT_FIELDS = ('file', 'status', 'rows_parsed', 'rows_loaded', 'errors_seen',
+                          'first_error', 'first_error_line', 'first_error_column_name')
+
+    def __init__(self, connector=None, max_connections=None, manifest_path=None, full_refresh=False,
+                 file_type=None, schema_cache_path=None):
+        # Password or key-pair credentials (raises ValueError when missing)
+        self.connection_settings = connection_settings()
         self.database = os.getenv('SNOWFLAKE_DATABASE', 'SUPPLYCHAINDB')
         self.schema = os.getenv('SNOWFLAKE_SCHEMA', 'RAWDATA')
         self.storage_integration = os.getenv('SNOWFLAKE_STORAGE_INTEGRATION', 'supplyChainS3Integration')
         self.s3_bucket = os.getenv('S3_BUCKET_NAME', 'dataco-supply-chain-analytics')
         self.s3_prefix = os.getenv('S3_PROCESSED_PREFIX', 'processed/')
+        self.stage = f"{self.database}.{self.schema}.processedStage"
+        self.manifest = LoadManifest(manifest_path or os.getenv('LOAD_MANIFEST_PATH', 'loadManifest.json'))
+        # CSV headers per file fingerprint, so only unseen files have their header read
+        self.schema_cache = SchemaCache(schema_cache_path or os.getenv('LOAD_SCHEMA_CACHE_PATH', 'schemaCache.json'))
+        # Reload every file (TRUNCATE + forced COPY) instead of only new/changed ones
+        self.full_refresh = full_refresh
+        self.file_type = (file_type or os.getenv('LOAD_FILE_TYPE', 'csv')).lower()
+        # Table loads are independent, so each can run on its own connection
+        self.max_connections = max_connections or int(os.getenv('SNOWFLAKE_MAX_CONNECTIONS', '2'))
+        self.connector = connector or (snowflake.connector if snowflake else None)
+        # Per-stage time, bytes and rows of the latest run
+        self.metrics = StageMetrics('dataLoader')
+        self._connection_ids = itertools.count(1)
+        # Opened on the first run and kept until close(), so repeated runs in
+        # one process (small incremental loads) reuse their sessions
+        self._pool = None
+        self.round_trips = RoundTrips()
 
-        if not all([self.account, self.user, self.password]):
-            raise ValueError("SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, SNOWFLAKE_PASSWORD required")
+        if self.connector is None:
+            raise ImportError("snowflake-connector-python not installed: pip install snowflake-connector-python")
+        if self.file_type not in self.FILE_TYPES:
+            raise ValueError(f"LOAD_FILE_TYPE must be one of {', '.join(self.FILE_TYPES)}")
+
+    def _timed(self, stage, **labels):
+        """Record a stage of the current run; yields the Stage for bytes/rows"""
+        return self.metrics.stage(stage, **labels)
+
+    @property
+    def timings(self):
+        """{stage: seconds} of the latest run"""
+        return self.metrics.timings()
 
     def _get_connection(self):
-        """Create Snowflake connection"""
-        return snowflake.connector.connect(
-            user=self.user,
-            password=self.password,
-            account=self.account,
-            warehouse=self.warehouse
-        )
-
-    def _ensure_database_schema(self, conn):
-        """Create database and schema if they don't exist"""
-        cursor = conn.cursor()
+        """Create Snowflake connection (password or key-pair auth, kept alive)"""
+        with self._timed(f"connect.{next(self._connection_ids)}"):
+            return self.connector.connect(**self.connection_settings)
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ConnectionPool(self._get_connection, self.max_connections, self.round_trips)
+        return self._pool
+
+    def close(self):
+        """Close the pooled connections"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _ensure_database_schema(self, session):
+        """Create database, schema and the external stage over the processed
+        prefix (so partitions can be listed) in one request"""
         try:
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database}")
-            cursor.execute(f"USE DATABASE {self.database}")
-            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema}")
-            cursor.execute(f"USE SCHEMA {self.schema}")
+            session.execute_batch([
+                f"CREATE DATABASE IF NOT EXISTS {self.database}",
+                f"USE DATABASE {self.database}",
+                f"CREATE SCHEMA IF NOT EXISTS {self.schema}",
+                f"USE SCHEMA {self.schema}",
+                f"""
+                CREATE STAGE IF NOT EXISTS {self.stage}
+                URL = 's3://{self.s3_bucket}/{self.s3_prefix}'
+                STORAGE_INTEGRATION = {self.storage_integration}
+                """,
+            ])
         except Exception as e:
             raise RuntimeError(f"Failed to create database/schema: {e}")
-        finally:
-            cursor.close()
 
-    def _create_file_format(self, conn, format_name, date_format, timestamp_format):
-        """Create file format for CSV parsing"""
-        cursor = conn.cursor()
-        try:
-            sql = f"""
+    def _file_format_sql(self, format_name, date_format, timestamp_format):
+        """File format for CSV parsing"""
+        return f"""
             CREATE FILE FORMAT IF NOT EXISTS {format_name}
             TYPE = CSV
             FIELD_OPTIONALLY_ENCLOSED_BY = '"'
             SKIP_HEADER = 1
             DATE_FORMAT = '{date_format}'
-            TIMESTAMP_FORMAT = '{timestamp_format}';
+            TIMESTAMP_FORMAT = '{timestamp_format}'
             """
-            cursor.execute(sql)
-        finally:
-            cursor.close()
 
-    def _create_orders_table(self, conn):
-        """Create supply chain orders table with camelCase columns"""
-        cursor = conn.cursor()
-        sql = f"""
-        CREATE TABLE IF NOT EXISTS {self.database}.{self.schema}.dataCoSupplyChainOrders (
-            type VARCHAR(50),
-            daysForShippingReal INT,
-            daysForShipmentScheduled INT,
-            benefitPerOrder FLOAT,
-            salesPerCustomer FLOAT,
-            deliveryStatus VARCHAR(50),
-            lateDeliveryRisk INT,
-            categoryId INT,
-            categoryName VARCHAR(100),
-            customerCity VARCHAR(100),
-            customerCountry VARCHAR(100),
-            customerFname VARCHAR(100),
-            customerId INT,
-            customerLname VARCHAR(100),
-            customerSegment VARCHAR(50),
-            customerState VARCHAR(100),
-            customerStreet VARCHAR(200),
-            customerZipcode VARCHAR(20),
-            departmentId INT,
-            departmentName VARCHAR(100),
-            latitude FLOAT,
-            longitude FLOAT,
-            market VARCHAR(50),
-            orderCity VARCHAR(100),
-            orderCountry VARCHAR(100),
-            orderCustomerId INT,
-            orderDate TIMESTAMP_NTZ,
-            orderId INT,
-            orderItemCardprodId INT,
-            orderItemDiscount FLOAT,
-            orderItemDiscountRate FLOAT,
-            orderItemId INT,
-            orderItemProductPrice FLOAT,
-            orderItemProfitRatio FLOAT,
-            orderItemQuantity INT,
-            sales FLOAT,
-            orderItemTotal FLOAT,
-            orderProfitPerOrder FLOAT,
-            orderRegion VARCHAR(50),
-            orderState VARCHAR(100),
-            orderStatus VARCHAR(50),
-            orderZipcode VARCHAR(20),
-            productCardId INT,
-            productCategoryId INT,
-            productImage VARCHAR(200),
-            productName VARCHAR(200),
-            productPrice FLOAT,
-            shippingDate TIMESTAMP_NTZ,
-            shippingMode VARCHAR(50),
-            profitMarginPct FLOAT,
-            profitCategory VARCHAR(50),
-            deliveryDelay INT,
-            orderYear INT,
-            orderMonth INT,
-            orderQuarter VARCHAR(10),
-            orderDayOfWeek VARCHAR(20),
-            orderHour INT,
-            isLate INT
-        );
+    def _parquet_file_format_sql(self, format_name):
+        """File format for Parquet (types and column names come from the file)"""
+        return f"""
+            CREATE FILE FORMAT IF NOT EXISTS {format_name}
+            TYPE = PARQUET
+            """
+
+    def _header_file_format_sql(self, format_name):
+        """File format that reads each CSV line as one field (for headers)"""
+        return f"""
+            CREATE FILE FORMAT IF NOT EXISTS {format_name}
+            TYPE = CSV
+            FIELD_DELIMITER = NONE
+            SKIP_HEADER = 0
+            """
+
+    def _create_file_format(self, session, load):
+        """Create the table's file formats in one request"""
+        if self.file_type == 'parquet':
+            session.execute_batch([self._parquet_file_format_sql(load['file_format'])])
+        else:
+            session.execute_batch([
+                self._file_format_sql(load['file_format'], load['date_format'], load['timestamp_format']),
+                self._header_file_format_sql(load['header_format']),
+            ])
+
+    def _read_headers(self, session, table_dir, header_format, names):
+        """{relative_path: header names} from the first line of each staged file"""
+        headers = {}
+        for start in range(0, len(names), self.COPY_FILES_LIMIT):
+            batch = names[start:start + self.COPY_FILES_LIMIT]
+            pattern = '|'.join(re.escape(name) for name in batch).replace("'", "''")
+            cursor = session.execute(f"""
+            SELECT METADATA$FILENAME, $1
+            FROM @{self.stage}/{table_dir} (FILE_FORMAT => '{header_format}', PATTERN => '.*({pattern})')
+            WHERE METADATA$FILE_ROW_NUMBER = 1;
+            """)
+            for filename, line in cursor.fetchall():
+                headers[filename.split(table_dir, 1)[-1]] = parse_header(line)
+        return headers
+
+    def _infer_columns(self, session, table, load, files, pending):
+        """{columns: [relative_path]} for the pending files, grouped by CSV header.
+
+        Headers come from the schema cache by file fingerprint (the LIST md5);
+        unseen files have their first line read from the stage in one query.
         """
-        try:
-            cursor.execute(sql)
-        finally:
-            cursor.close()
+        fingerprints = {name: entry['md5'] or f"{name}:{entry['size']}" for name, entry in files.items()}
+        self.schema_cache.prune(table, fingerprints.values())
+        fingerprints = {name: fingerprints[name] for name in pending}
+        unseen = [
+            name for name in sorted(pending)
+            if not self.schema_cache.known(table, fingerprints[name])
+        ]
+        headers = self._read_headers(session, load['table_dir'], load['header_format'], unseen) if unseen else {}
+        missing = sorted(set(unseen) - set(headers))
+        if missing:
+            raise RuntimeError(f"{table}: no header read for {', '.join(missing[:5])}")
+        return self.schema_cache.columns(table, fingerprints, lambda name: headers[name])
+
+    def _create_table(self, session, table_name, columns=None):
+        """Create a raw table with camelCase columns, then add any columns
+        (e.g. a new derived field in the CSV header) it was not given yet"""
+        columns = list(columns or TABLES[table_name]['columns'])
+        qualified_name = f"{self.database}.{self.schema}.{table_name}"
+        applied = self.schema_cache.applied(table_name)
+        added = [(name, column_type) for name, column_type in columns if name not in applied]
+        statements = [create_table_sql(qualified_name, columns)]
+        if added:
+            # One statement however many columns are new; a no-op for a
+            # table just created with them
+            statements.append(
+                f"ALTER TABLE {qualified_name} ADD COLUMN IF NOT EXISTS "
+                + ', '.join(f"{name} {column_type}" for name, column_type in added)
+            )
+        session.execute_batch(statements)
+        self.schema_cache.record_applied(table_name, applied + [name for name, _ in added])
+
+    def _create_orders_table(self, session, columns=None):
+        """Create supply chain orders table with camelCase columns"""
+        self._create_table(session, "dataCoSupplyChainOrders", columns)
 
-    def _create_clickstream_table(self, conn):
+    def _create_clickstream_table(self, session, columns=None):
         """Create clickstream events table with camelCase columns"""
-        cursor = conn.cursor()
-        sql = f"""
-        CREATE TABLE IF NOT EXISTS {self.database}.{self.schema}.clickstreamEvents (
-            product VARCHAR(200),
-            category VARCHAR(100),
-            date TIMESTAMP_NTZ,
-            month VARCHAR(10),
-            hour INT,
-            department VARCHAR(100),
-            ip VARCHAR(50),
-            url VARCHAR(500),
-            eventYear INT,
-            eventMonth INT,
-            eventQuarter VARCHAR(10),
-            eventDayOfWeek VARCHAR(20),
-            eventHourOfDay INT,
-            isCartAdd VARCHAR(10),
-            eventType VARCHAR(50),
-            sessionDate DATE,
-            pageType VARCHAR(50),
-            sessionID VARCHAR(200),
-            isWeekend VARCHAR(10),
-            timeOfDay VARCHAR(20)
-        );
+        self._create_table(session, "clickstreamEvents", columns)
+
+    def _create_sessions_table(self, session, columns=None):
+        """Create clickstream sessions table (one row per inactivity-timeout session)"""
+        self._create_table(session, "clickstreamSessions", columns)
+
+    def _list_files(self, session, table_dir, extension):
+        """{relative_path: {"md5", "size"}} for every data file under table_dir"""
+        cursor = session.execute(f"LIST @{self.stage}/{table_dir}")
+        # LIST returns: name, size, md5, last_modified
+        columns = [col[0].lower() for col in (cursor.description or [])] or ['name', 'size', 'md5']
+        marker = f"/{self.s3_prefix}{table_dir}"
+        files = {}
+        for row in cursor.fetchall():
+            entry = dict(zip(columns, row))
+            name = entry['name']
+            if not name.endswith(extension) or marker not in name:
+                continue
+            files[name.split(marker, 1)[1]] = {'md5': entry.get('md5'), 'size': entry.get('size')}
+        return files
+
+    def _plan_partitions(self, table, files):
+        """Split listed files into (new, changed, unchanged) against the manifest"""
+        if self.full_refresh:
+            return sorted(files), [], []
+        loaded = self.manifest.files(table)
+        new, changed, unchanged = [], [], []
+        for name in sorted(files):
+            previous = loaded.get(name)
+            if previous is None:
+                new.append(name)
+            elif previous.get('md5') != files[name]['md5']:
+                changed.append(name)
+            else:
+                unchanged.append(name)
+        return new, changed, unchanged
+
+    def _partition_predicate(self, relative_path):
+        """WHERE clause for the rows a partition file holds.
+
+        orderYear=2018/orderMonth=1/x.csv → orderYear = '2018' AND orderMonth = '1'.
+        A file outside any key=value directory (the monolithic layout) owns
+        the whole table.
         """
-        try:
-            cursor.execute(sql)
-        finally:
-            cursor.close()
-
-    def _load_from_s3(self, conn, table_name, s3_file, file_format_name):
-        """Load data from S3 into Snowflake table with column mapping"""
-        cursor = conn.cursor()
-        
-        # Use COPY INTO with explicit column mapping
-        # Snowflake maps CSV columns by position to table columns
-        if table_name == "dataCoSupplyChainOrders":
-            sql = f"""
-            COPY INTO {self.database}.{self.schema}.{table_name}
-            (type, daysForShippingReal, daysForShipmentScheduled, benefitPerOrder, salesPerCustomer,
-             deliveryStatus, lateDeliveryRisk, categoryId, categoryName, customerCity, customerCountry,
-             customerFname, customerId, customerLname, customerSegment, customerState, customerStreet,
-             customerZipcode, departmentId, departmentName, latitude, longitude, market, orderCity,
-             orderCountry, orderCustomerId, orderDate, orderId, orderItemCardprodId, orderItemDiscount,
-             orderItemDiscountRate, orderItemId, orderItemProductPrice, orderItemProfitRatio,
-             orderItemQuantity, sales, orderItemTotal, orderProfitPerOrder, orderRegion, orderState,
-             orderStatus, orderZipcode, productCardId, productCategoryId, productImage, productName,
-             productPrice, shippingDate, shippingMode, profitMarginPct, profitCategory, deliveryDelay,
-             orderYear, orderMonth, orderQuarter, orderDayOfWeek, orderHour, isLate)
-            FROM 's3://{self.s3_bucket}/{self.s3_prefix}{s3_file}'
-            STORAGE_INTEGRATION = {self.storage_integration}
-            FILE_FORMAT = {file_format_name}
-            ON_ERROR = 'CONTINUE';
-            """
-        else:  # clickstreamEvents
-            sql = f"""
+        clauses = []
+        for part in relative_path.split('/')[:-1]:
+            if '=' not in part:
+                continue
+            column, value = part.split('=', 1)
+            if value == self.NULL_PARTITION:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = '{value.replace(chr(39), chr(39) * 2)}'")
+        return ' AND '.join(clauses) or 'TRUE'
+
+    def _delete_partitions(self, session, table_name, files):
+        """Remove the rows of partitions that are about to be reloaded (one request)"""
+        session.execute_batch([
+            f"DELETE FROM {self.database}.{self.schema}.{table_name} WHERE {self._partition_predicate(name)}"
+            for name in files
+        ])
+
+    def _truncate_table(self, session, table_name):
+        session.execute(f"TRUNCATE TABLE IF EXISTS {self.database}.{self.schema}.{table_name}")
+
+    def _load_from_s3(self, session, table_name, table_dir, file_format_name, files, force=False, columns=None):
+        """COPY the listed files from the stage into the table with column mapping.
+
+        columns are the files' CSV columns in order (default: the declared
+        table columns). Returns (rows loaded, names of files that failed to
+        load, COPY's per-file results).
+        """
+        if self.file_type == 'parquet':
+            # Parquet columns are matched to table columns by name, so
+            # column order in the file does not matter
+            columns = ""
+            match_by_name = "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE"
+        else:
+            # Snowflake maps CSV columns by position to the explicit column list
+            columns = f"({column_list(columns or TABLES[table_name]['columns'])})"
+            match_by_name = ""
+
+        rows_loaded = 0
+        failed = []
+        file_results = []
+        for start in range(0, len(files), self.COPY_FILES_LIMIT):
+            batch = files[start:start + self.COPY_FILES_LIMIT]
+            file_list = ', '.join(f"'{name}'" for name in batch)
+            cursor = session.execute(f"""
             COPY INTO {self.database}.{self.schema}.{table_name}
-            (product, category, date, month, hour, department, ip, url, eventYear, eventMonth,
-             eventQuarter, eventDayOfWeek, eventHourOfDay, isCartAdd, eventType, sessionDate,
-             pageType, sessionID, isWeekend, timeOfDay)
-            FROM 's3://{self.s3_bucket}/{self.s3_prefix}{s3_file}'
-            STORAGE_INTEGRATION = {self.storage_integration}
+            {columns}
+            FROM @{self.stage}/{table_dir}
+            FILES = ({file_list})
             FILE_FORMAT = {file_format_name}
-            ON_ERROR = 'CONTINUE';
-            """
-        
-        try:
-            cursor.execute(sql)
+            {match_by_name}
+            ON_ERROR = 'CONTINUE'
+            FORCE = {'TRUE' if force else 'FALSE'};
+            """)
             results = cursor.fetchall()
-            rows_loaded = sum(
-                int(row[1]) for row in results
-                if len(row) > 1 and row[1] and str(row[1]).isdigit()
-            )
-            return rows_loaded
-        finally:
-            cursor.close()
+            # COPY returns one row per file: file, status, rows_parsed, rows_loaded, ...
+            columns_out = [col[0].lower() for col in (cursor.description or [])]
+            index = columns_out.index('rows_loaded') if 'rows_loaded' in columns_out else 3
+            status = columns_out.index('status') if 'status' in columns_out else 1
+            for row in results:
+                if len(row) > index and row[index] is not None and str(row[index]).isdigit():
+                    rows_loaded += int(row[index])
+                if len(row) > status and row[status] == 'LOAD_FAILED':
+                    failed.extend(name for name in batch if str(row[0]).endswith(name))
+                if columns_out:
+                    file_results.append({
+                        key: value for key, value in zip(columns_out, row) if key in self.COPY_RESULT_FIELDS
+                    })
+        return rows_loaded, failed, file_results
 
-    def _get_row_count(self, conn, table_name):
+    def _get_row_count(self, session, table_name):
         """Get row count for a table"""
-        cursor = conn.cursor()
-        try:
-            cursor.execute(f"SELECT COUNT(*) FROM {self.database}.{self.schema}.{table_name}")
-            return cursor.fetchone()[0]
-        finally:
-            cursor.close()
+        return session.execute(f"SELECT COUNT(*) FROM {self.database}.{self.schema}.{table_name}").fetchone()[0]
 
-    def run(self):
-        """Execute complete data loading process"""
-        conn = None
-        try:
-            conn = self._get_connection()
-            self._ensure_database_schema(conn)
-
-            self._create_file_format(
-                conn,
-                f"{self.database}.{self.schema}.csv_format",
-                "MM/DD/YYYY HH24:MI",
-                "MM/DD/YYYY HH24:MI"
-            )
-            self._create_file_format(
-                conn,
-                f"{self.database}.{self.schema}.csv_format_clickstream",
-                "YYYY-MM-DD",
-                "MM/DD/YYYY HH24:MI"
-            )
+    def _table_loads(self):
+        """Independent per-table load pipelines (file format → list → schema → table → COPY → count)"""
+        prefix = f"{self.database}.{self.schema}"
+        parquet = self.file_type == 'parquet'
+        return [
+            {
+                'table': "dataCoSupplyChainOrders",
+                'result_key': "orders",
+                'file_format': f"{prefix}.parquet_format" if parquet else f"{prefix}.csv_format",
+                'header_format': f"{prefix}.csv_header_format",
+                'date_format': TABLES["dataCoSupplyChainOrders"]['date_format'],
+                'timestamp_format': TABLES["dataCoSupplyChainOrders"]['timestamp_format'],
+                'create_table': self._create_orders_table,
+                'table_dir': TABLES["dataCoSupplyChainOrders"]['table_dir'],
+                'extension': f".{self.file_type}",
+            },
+            {
+                'table': "clickstreamEvents",
+                'result_key': "clickstream",
+                'file_format': f"{prefix}.parquet_format" if parquet else f"{prefix}.csv_format_clickstream",
+                'header_format': f"{prefix}.csv_header_format",
+                'date_format': TABLES["clickstreamEvents"]['date_format'],
+                'timestamp_format': TABLES["clickstreamEvents"]['timestamp_format'],
+                'create_table': self._create_clickstream_table,
+                'table_dir': TABLES["clickstreamEvents"]['table_dir'],
+                'extension': f".{self.file_type}",
+            },
+            {
+                'table': "clickstreamSessions",
+                'result_key': "sessions",
+                # Same date/timestamp formats as the events, so the format is shared
+                'file_format': f"{prefix}.parquet_format" if parquet else f"{prefix}.csv_format_clickstream",
+                'header_format': f"{prefix}.csv_header_format",
+                'date_format': TABLES["clickstreamSessions"]['date_format'],
+                'timestamp_format': TABLES["clickstreamSessions"]['timestamp_format'],
+                'create_table': self._create_sessions_table,
+                'table_dir': TABLES["clickstreamSessions"]['table_dir'],
+                'extension': f".{self.file_type}",
+            },
+        ]
 
-            self._create_orders_table(conn)
-            self._create_clickstream_table(conn)
+    def _load_table(self, pool, load):
+        """Run one table's pipeline on a pooled connection, loading only the
+        partitions that are new or changed since the manifest was written"""
+        table = load['table']
+        with pool.session() as session:
+            with self._timed(f"{table}.file_format", table=table):
+                self._create_file_format(session, load)
+            with self._timed(f"{table}.list", table=table) as stage:
+                files = self._list_files(session, load['table_dir'], load['extension'])
+                stage.extra['objects'] = len(files)
+            new, changed, unchanged = self._plan_partitions(table, files)
 
-            orders_rows = self._load_from_s3(
-                conn,
-                "dataCoSupplyChainOrders",
-                "DataCoSupplyChainDataset/DataCoSupplyChainDataset.csv",
-                f"{self.database}.{self.schema}.csv_format"
-            )
+            # CSV columns are mapped by position, so they come from each file's
+            # header; Parquet is matched by name against the declared columns
+            pending = set(new + changed)
+            if self.file_type == 'parquet':
+                groups = {tuple(TABLES[table]['columns']): sorted(pending)}
+            else:
+                with self._timed(f"{table}.schema", table=table) as stage:
+                    reads = self.schema_cache.reads
+                    groups = self._infer_columns(session, table, load, files, pending)
+                    stage.extra['headers_read'] = self.schema_cache.reads - reads
+            columns = list(dict.fromkeys(column for group in groups for column in group))
+            with self._timed(f"{table}.create_table", table=table) as stage:
+                load['create_table'](session, columns or None)
+                stage.extra['columns'] = len(columns)
 
-            clickstream_rows = self._load_from_s3(
-                conn,
-                "clickstreamEvents",
-                "clickstreamDataPreparation/clickstreamDataPreparation.csv",
-                f"{self.database}.{self.schema}.csv_format_clickstream"
-            )
+            loaded = 0
+            failed = []
+            file_results = []
+            if self.full_refresh:
+                with self._timed(f"{table}.truncate", table=table):
+                    self._truncate_table(session, table)
+                self.manifest.reset(table)
+            if changed:
+                with self._timed(f"{table}.delete", table=table) as stage:
+                    self._delete_partitions(session, table, changed)
+                    stage.extra['partitions'] = len(changed)
+            with self._timed(f"{table}.copy", table=table) as stage:
+                # New files go through Snowflake's load metadata as a second
+                # guard against duplicates; changed files must be forced
+                for group_columns, group in groups.items():
+                    members = set(group)
+                    for names, force in ((new, self.full_refresh), (changed, True)):
+                        names = [name for name in names if name in members]
+                        if names:
+                            rows, errors, results = self._load_from_s3(
+                                session, table, load['table_dir'], load['file_format'], names, force,
+                                list(group_columns)
+                            )
+                            loaded += rows
+                            failed += errors
+                            file_results += results
+                            stage.add(bytes=sum(int(files[name]['size'] or 0) for name in names), rows=rows)
+                stage.extra['failed'] = len(failed)
+                stage.files = file_results
+            self.manifest.record(table, {
+                name: files[name] for name in new + changed if name not in failed
+            })
+            self.schema_cache.save()
+            with self._timed(f"{table}.count", table=table) as stage:
+                total = self._get_row_count(session, table)
+                stage.extra['table_rows'] = total
+        partitions = {'new': len(new), 'changed': len(changed), 'unchanged': len(unchanged), 'failed': len(failed)}
+        # Files COPY did not load completely, with Snowflake's first error
+        rejected = [result for result in file_results if result.get('status') not in ('LOADED', None)]
+        return loaded, total, partitions, rejected
 
-            orders_count = self._get_row_count(conn, "dataCoSupplyChainOrders")
-            clickstream_count = self._get_row_count(conn, "clickstreamEvents")
+    def run(self):
+        """Execute complete data loading process.
 
-            return {
-                'orders_loaded': orders_rows,
-                'clickstream_loaded': clickstream_rows,
-                'orders_total': orders_count,
-                'clickstream_total': clickstream_count,
-                'success': True
-            }
+        Connections stay open for the next run until close() is called.
+        """
+        self.metrics = StageMetrics('dataLoader')
+        self.round_trips = RoundTrips()
+        pool = self._get_pool()
+        pool.round_trips = self.round_trips
+        start = time.perf_counter()
+        result = {}
+        errors = {}
+        try:
+            # Database/schema DDL must finish before any table pipeline starts
+            with pool.session() as session:
+                with self._timed("schema"):
+                    self._ensure_database_schema(session)
 
+            # A failing table does not stop the others; every failure is reported
+            loads = self._table_loads()
+            with ThreadPoolExecutor(max_workers=min(len(loads), self.max_connections)) as executor:
+                futures = {load['result_key']: executor.submit(self._load_table, pool, load) for load in loads}
+                for key, future in futures.items():
+                    try:
+                        loaded, total, partitions, rejected = future.result()
+                    except Exception as e:
+                        errors[key] = e
+                        continue
+                    result[f"{key}_loaded"] = loaded
+                    result[f"{key}_total"] = total
+                    result[f"{key}_partitions"] = partitions
+                    result[f"{key}_rejected"] = rejected
+            if errors:
+                raise next(iter(errors.values()))
         except Exception as e:
-            return {'success': False, 'error': str(e)}
-        finally:
-            if conn:
-                conn.close()
+            errors = errors or {'schema': e}
+            result.update({
+                'success': False,
+                'error': '; '.join(f"{key}: {type(error).__name__}: {error}" for key, error in errors.items()),
+                'errors': {key: f"{type(error).__name__}: {error}" for key, error in errors.items()},
+                'failed_stage': self.metrics.failed_stage(),
+            })
+            error = e
+        else:
+            result['success'] = True
+            error = None
+
+        timings = self.timings
+        timings['total'] = round(time.perf_counter() - start, 3)
+        result['timings'] = timings
+        result['round_trips'] = self.round_trips.report()
+        result['metrics'] = {**self.metrics.to_dict(error), 'round_trips': result['round_trips']}
+        return result
 
 
 if __name__ == "__main__":
-    loader = SnowflakeDataLoader()
-    result = loader.run()
-    
-    if result.get('success'):
-        print(f"✅ Orders: {result['orders_loaded']:,} loaded, {result['orders_total']:,} total")
-        print(f"✅ Clickstream: {result['clickstream_loaded']:,} loaded, {result['clickstream_total']:,} total")
-        sys.exit(0)
-    else:
-        print(f"❌ Error: {result.get('error', 'Unknown error')}")
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Load processed S3 data into Snowflake',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dataLoader.py                  # COPY only new/changed partitions
+  python dataLoader.py --full-refresh   # Truncate tables and reload every file
+  python dataLoader.py --file-type parquet --full-refresh   # Switch to Parquet (MATCH_BY_COLUMN_NAME)
+  python dataLoader.py --metrics-json metrics/load.json --metrics-openmetrics metrics/load.prom
+        """
+    )
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='Truncate the tables and reload every file, rebuilding the manifest'
+    )
+    parser.add_argument(
+        '--file-type',
+        choices=SnowflakeDataLoader.FILE_TYPES,
+        default=None,
+        help='Staged file type to load (default: LOAD_FILE_TYPE or csv)'
+    )
+    parser.add_argument(
+        '--metrics-json',
+        type=str,
+        default=os.getenv('LOAD_METRICS_JSON'),
+        metavar='PATH',
+        help='Write per-stage time, bytes, rows and COPY file results as JSON (- for stdout)'
+    )
+    parser.add_argument(
+        '--metrics-openmetrics',
+        type=str,
+        default=os.getenv('LOAD_METRICS_OPENMETRICS'),
+        metavar='PATH',
+        help='Also write the stage metrics as an OpenMetrics text file'
+    )
+    args = parser.parse_args()
+
+    if snowflake is None:
+        print("❌ snowflake-connector-python not installed")
+        print("   Install: pip install snowflake-connector-python")
+        sys.exit(1)
+
+    loader = SnowflakeDataLoader(full_refresh=args.full_refresh, file_type=args.file_type)
+    try:
+        result = loader.run()
+    finally:
+        loader.close()
+    write_metrics(result['metrics'], args.metrics_json, args.metrics_openmetrics)
+
+    for key, label in (('orders', 'Orders'), ('clickstream', 'Clickstream'), ('sessions', 'Sessions')):
+        if f"{key}_partitions" not in result:
+            continue
+        partitions = result[f"{key}_partitions"]
+        print(f"✅ {label}: {result[f'{key}_loaded']:,} loaded, {result[f'{key}_total']:,} total "
+              f"({partitions['new']} new, {partitions['changed']} changed, "
+              f"{partitions['unchanged']} unchanged files)")
+        if partitions['failed']:
+            print(f"⚠️  {label}: {partitions['failed']} files failed to load (retried next run)")
+        for rejected in result[f"{key}_rejected"][:10]:
+            print(f"   ⚠️  {rejected.get('file')}: {rejected.get('status')}, "
+                  f"{rejected.get('errors_seen')} errors, first: {rejected.get('first_error')}")
+    for stage, seconds in result['timings'].items():
+        print(f"   ⏱  {stage}: {seconds:.2f}s")
+    trips = result['round_trips']
+    print(f"   🔁 round trips: {trips['total']} ({trips['connects']} connects, "
+          f"{trips['statements']} requests, {trips['batched']} statements batched)")
+
+    if not result.get('success'):
+        print(f"❌ Error in {result.get('failed_stage') or 'run'}: {result.get('error', 'Unknown error')}")
         sys.exit(1)
+    sys.exit(0)
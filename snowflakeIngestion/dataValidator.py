@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Pre-load Data Validator
+Checks processed CSVs row by row against the RAWDATA table schemas before
+COPY INTO, so rows Snowflake would drop under ON_ERROR = 'CONTINUE' are
+reported and quarantined instead of vanishing silently.
+"""
+import os
+import re
+import csv
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+from tableSchemas import TABLES, strptime_format
+from schemaInference import local_columns
+
+INTEGER_PATTERN = r'^[+-]?\d+$'
+FLOAT_PATTERN = r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$|(?i)^[+-]?(nan|inf|infinity)$'
+
+
+def column_rules(table, columns=None):
+    """[(column, kind, argument)] for every column of a table, in file order
+    (columns as read from a file's header; default: the declared columns)"""
+    spec = TABLES[table]
+    rules = []
+    for name, column_type in columns or spec['columns']:
+        column_type = column_type.upper()
+        if column_type.startswith('VARCHAR'):
+            length = re.search(r'\((\d+)\)', column_type)
+            rules.append((name, 'varchar', int(length.group(1)) if length else None))
+        elif column_type in ('INT', 'INTEGER', 'BIGINT', 'NUMBER'):
+            rules.append((name, 'int', None))
+        elif column_type in ('FLOAT', 'DOUBLE', 'REAL'):
+            rules.append((name, 'float', None))
+        elif column_type.startswith('TIMESTAMP'):
+            rules.append((name, 'timestamp', spec['timestamp_format']))
+        elif column_type == 'DATE':
+            rules.append((name, 'date', spec['date_format']))
+        else:
+            rules.append((name, 'varchar', None))
+    return rules
+
+
+def _invalid_values(values, kind, argument):
+    """Boolean array: True where a non-empty value would not cast to the
+    column type, plus the reason. Empty fields load as NULL
+    (EMPTY_FIELD_AS_NULL) and are always valid."""
+    if kind == 'varchar':
+        if argument is None:
+            return None, None
+        invalid = pc.greater(pc.utf8_length(values), argument)
+        reason = f"longer than {argument} characters"
+    elif kind == 'int':
+        invalid = pc.invert(pc.match_substring_regex(values, INTEGER_PATTERN))
+        reason = "not an integer"
+    elif kind == 'float':
+        invalid = pc.invert(pc.match_substring_regex(values, FLOAT_PATTERN))
+        reason = "not a number"
+    else:
+        parsed = pc.strptime(values, format=strptime_format(argument), unit='s', error_is_null=True)
+        invalid = pc.is_null(parsed)
+        reason = f"not a {kind} in format {argument}"
+    return pc.and_(invalid, pc.not_equal(values, '')), reason
+
+
+def validate_block(block, rules):
+    """Validate one block of whole CSV rows (runs in a worker process).
+
+    Returns {'rows', 'rejected': [(row in block, [errors], fields)], 'errors': Counter}
+    with rows numbered from 1.
+    """
+    rejected = {}
+    errors = Counter()
+
+    try:
+        block.decode('utf-8')
+        bad_encoding = False
+    except UnicodeDecodeError:
+        block = block.decode('utf-8', errors='replace').encode('utf-8')
+        bad_encoding = True
+
+    # Rows with the wrong number of fields are skipped by the parser and
+    # reported here with their row number (sequential with use_threads=False)
+    def on_invalid_row(row):
+        fields = next(csv.reader([row.text]), [])
+        reason = f"{row.actual_columns} columns (expected {row.expected_columns})"
+        rejected[row.number] = ([reason], fields)
+        errors[('*', 'column count mismatch')] += 1
+        return 'skip'
+
+    names = [name for name, _, _ in rules]
+    table = pa_csv.read_csv(
+        pa.py_buffer(block),
+        read_options=pa_csv.ReadOptions(column_names=names, use_threads=False),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=on_invalid_row),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False
+        )
+    )
+
+    # Parsed rows skip the invalid ones: map table positions to row numbers
+    total = table.num_rows + len(rejected)
+    row_numbers = np.setdiff1d(np.arange(1, total + 1), np.fromiter(rejected, dtype=np.int64))
+
+    bad_rows = {}
+    if bad_encoding:
+        for name in names:
+            replaced = pc.match_substring(table[name], '\ufffd').to_numpy(zero_copy_only=False)
+            for position in np.flatnonzero(replaced):
+                messages = bad_rows.setdefault(int(position), [])
+                if "invalid UTF-8" not in messages:
+                    messages.append("invalid UTF-8")
+        errors[('*', "invalid UTF-8")] += len(bad_rows)
+
+    for name, kind, argument in rules:
+        invalid, reason = _invalid_values(table[name], kind, argument)
+        if invalid is None or not pc.any(invalid).as_py():
+            continue
+        positions = np.flatnonzero(invalid.to_numpy(zero_copy_only=False))
+        for position in positions:
+            bad_rows.setdefault(int(position), []).append(f"{name}: {reason}")
+        errors[(name, reason)] += len(positions)
+
+    if bad_rows:
+        positions = sorted(bad_rows)
+        values = table.take(positions).to_pylist()
+        for position, row in zip(positions, values):
+            rejected[int(row_numbers[position])] = (list(bad_rows[position]), list(row.values()))
+
+    return {
+        'rows': total,
+        'rejected': [(row, messages, fields) for row, (messages, fields) in sorted(rejected.items())],
+        'errors': errors,
+    }
+
+
+def _row_boundary(data):
+    """Index of the last newline in data that is not inside a quoted field, or -1.
+
+    Blocks always start on a row boundary, so a newline is outside quotes
+    when the number of quote characters before it is even ("" escapes
+    count twice and cancel out).
+    """
+    position = data.rfind(b'\n')
+    while position >= 0:
+        if data.count(b'"', 0, position) % 2 == 0:
+            return position
+        position = data.rfind(b'\n', 0, position)
+    return -1
+
+
+def validate_range(path, start, end, rules):
+    """Read bytes [start, end) of path and validate them (runs in a worker
+    process, so only offsets cross the process boundary)"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return validate_block(f.read(end - start), rules)
+
+
+def plan_blocks(path, block_bytes):
+    """Yield (start, end) byte ranges of whole rows, header skipped"""
+    with open(path, 'rb') as f:
+        f.readline()  # SKIP_HEADER = 1
+        start = f.tell()
+        carry = b''
+        while True:
+            data = f.read(block_bytes)
+            if not data:
+                if carry.strip():
+                    yield start, start + len(carry)
+                return
+            data = carry + data
+            cut = _row_boundary(data)
+            if cut < 0:
+                carry = data
+                continue
+            yield start, start + cut + 1
+            start += cut + 1
+            carry = data[cut + 1:]
+
+
+class DataValidator:
+    """Validate processed CSVs against the raw table schemas in parallel"""
+
+    DEFAULT_BLOCK_MB = 4
+    MAX_SAMPLES = 20
+    REPORT_NAME = "validationReport.json"
+
+    def __init__(self, workers=None, block_mb=None, output_dir="validation"):
+        if pa is None:
+            raise ImportError("pyarrow not installed: pip install pyarrow")
+        self.workers = workers or os.cpu_count() or 1
+        self.block_bytes = int((block_mb or self.DEFAULT_BLOCK_MB) * 1024 * 1024)
+        self.output_dir = Path(output_dir)
+
+    @staticmethod
+    def _source_files(source, filename):
+        """Every copy of filename under source (single file or partitioned layout)"""
+        source = Path(source)
+        if source.is_file():
+            return [source] if source.name == filename else []
+        direct = source / filename
+        if direct.exists():
+            return [direct]
+        return sorted(source.rglob(filename))
+
+    def _validate_table(self, executor, table, files, source):
+        # Fields are checked by position against each file's own header
+        file_rules = {path: column_rules(table, local_columns(path, table)) for path in files}
+        file_names = {path: [name for name, _, _ in rules] for path, rules in file_rules.items()}
+        # Files may carry different headers (e.g. clickstream files without the
+        # id columns), so the quarantine file uses the union in declared order
+        # and each row's fields are placed by name
+        present = {name for names in file_names.values() for name in names}
+        header = [name for name, _ in TABLES[table]['columns'] if name in present]
+        for names in file_names.values():
+            header += [name for name in names if name not in header]
+        report = {
+            'files': len(files),
+            'rows': 0,
+            'rejected': 0,
+            'column_errors': {},
+            'samples': [],
+            'quarantine': None,
+        }
+        errors = Counter()
+        quarantine_path = self.output_dir / f"{table}Quarantine.csv"
+        quarantine_file = None
+        quarantine = None
+        rows_before = Counter()  # Rows already seen per file, to number rows across blocks
+
+        def place(names, fields):
+            by_name = dict(zip(names, fields))
+            # Rows with too many fields keep the extras after the header columns
+            return [by_name.get(name, '') for name in header] + fields[len(names):]
+
+        def collect(relative, names, future):
+            nonlocal quarantine_file, quarantine
+            result = future.result()
+            offset = rows_before[relative]
+            rows_before[relative] += result['rows']
+            report['rows'] += result['rows']
+            errors.update(result['errors'])
+            for row, messages, fields in result['rejected']:
+                report['rejected'] += 1
+                if len(report['samples']) < self.MAX_SAMPLES:
+                    report['samples'].append({'file': relative, 'row': offset + row, 'errors': messages})
+                if quarantine is None:
+                    quarantine_file = open(quarantine_path, 'w', encoding='utf-8', newline='')
+                    quarantine = csv.writer(quarantine_file, quoting=csv.QUOTE_ALL, lineterminator='\r\n')
+                    quarantine.writerow(['_file', '_row', '_errors'] + header)
+                quarantine.writerow([relative, offset + row, '; '.join(messages)] + place(names, fields))
+
+        # Results are collected in submission order (so the quarantine file
+        # follows the source), with at most two blocks per worker in flight
+        pending = deque()
+        in_flight = 2 * self.workers
+        try:
+            for path in files:
+                relative = path.relative_to(source).as_posix() if path != source else path.name
+                for start, end in plan_blocks(path, self.block_bytes):
+                    future = executor.submit(validate_range, str(path), start, end, file_rules[path])
+                    pending.append((relative, file_names[path], future))
+                    if len(pending) >= in_flight:
+                        collect(*pending.popleft())
+            while pending:
+                collect(*pending.popleft())
+        finally:
+            if quarantine_file is not None:
+                quarantine_file.close()
+
+        for (column, reason), count in sorted(errors.items()):
+            report['column_errors'].setdefault(column, {})[reason] = count
+        report['valid'] = report['rows'] - report['rejected']
+        if quarantine is not None:
+            report['quarantine'] = str(quarantine_path)
+        elif quarantine_path.exists():
+            quarantine_path.unlink()  # Stale file from an earlier run
+        return report
+
+    def run(self, source, tables=None):
+        """Validate every table file found under source; writes the report
+        and quarantine files to output_dir and returns the report"""
+        source = Path(source)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        result = {'source': str(source), 'tables': {}}
+        result['workers'] = self.workers
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for table in tables or TABLES:
+                # A single file named explicitly with --table is taken as is
+                if source.is_file() and tables:
+                    files = [source]
+                else:
+                    files = self._source_files(source, TABLES[table]['file'])
+                if files:
+                    result['tables'][table] = self._validate_table(executor, table, files, source)
+
+        elapsed = time.perf_counter() - start
+        rows = sum(report['rows'] for report in result['tables'].values())
+        result['seconds'] = round(elapsed, 3)
+        result['rows_per_second'] = round(rows / elapsed) if elapsed else None
+        with open(self.output_dir / self.REPORT_NAME, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Validate processed CSVs against the Snowflake raw table schemas before loading',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python dataValidator.py -s ../localData/processed           # Both tables, single or partitioned files
+  python dataValidator.py -s orders.csv -t dataCoSupplyChainOrders
+  python dataValidator.py -s ../localData/processed --max-rejects 100   # Tolerate up to 100 bad rows
+        """
+    )
+    parser.add_argument('-s', '--source', type=str, required=True, help='Processed CSV file or directory')
+    parser.add_argument('-t', '--table', choices=list(TABLES), action='append', default=None,
+                        help='Only validate this table (repeatable; default: all found)')
+    parser.add_argument('-o', '--output-dir', type=str, default='validation',
+                        help='Report and quarantine directory (default: validation)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--block-mb', type=float, default=DataValidator.DEFAULT_BLOCK_MB,
+                        help=f'Bytes per work unit in MB (default: {DataValidator.DEFAULT_BLOCK_MB})')
+    parser.add_argument('--max-rejects', type=int, default=0,
+                        help='Exit 1 when more rows than this are rejected (default: 0)')
+
+    args = parser.parse_args()
+
+    validator = DataValidator(workers=args.workers, block_mb=args.block_mb, output_dir=args.output_dir)
+    result = validator.run(args.source, args.table)
+    if not result['tables']:
+        print(f"❌ No table files found under {args.source}")
+        return 1
+
+    rejected = 0
+    for table, report in result['tables'].items():
+        rejected += report['rejected']
+        icon = '✅' if not report['rejected'] else '⚠️ '
+        print(f"{icon} {table}: {report['valid']:,} valid, {report['rejected']:,} rejected "
+              f"of {report['rows']:,} rows ({report['files']} files)")
+        for column, reasons in report['column_errors'].items():
+            for reason, count in reasons.items():
+                print(f"   {column}: {reason} ({count:,})")
+        if report['quarantine']:
+            print(f"   Quarantine: {report['quarantine']}")
+    print(f"   ⏱  {result['seconds']:.2f}s, {result['rows_per_second']:,} rows/s on {result['workers']} workers")
+    print(f"   Report: {Path(args.output_dir) / DataValidator.REPORT_NAME}")
+    return 1 if rejected > args.max_rejects else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
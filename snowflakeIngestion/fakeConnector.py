@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Fake Snowflake Connector
+In-process stand-in for snowflake.connector that simulates connection and
+query latency, so loader orchestration can be exercised and timed without a
+live account. Every request (login, statement or multi-statement batch) is
+counted as one round trip.
+"""
+import os
+import re
+import sys
+import time
+import threading
+
+from tableSchemas import TABLES
+
+
+class FakeCursor:
+    """Cursor that sleeps per statement and returns COPY/LIST/COUNT-shaped results"""
+
+    LIST_COLUMNS = ['name', 'size', 'md5', 'last_modified']
+    COPY_COLUMNS = ['file', 'status', 'rows_parsed', 'rows_loaded', 'error_limit',
+                    'errors_seen', 'first_error', 'first_error_line']
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self._results = []
+
+    def execute(self, sql, *args, num_statements=None, **kwargs):
+        connector = self.connection.connector
+        connector.round_trip()
+        if num_statements:
+            # Multi-statement request: one round trip, statements run in order
+            statements = [statement for statement in sql.split(';\n') if statement.strip()]
+            if len(statements) != num_statements:
+                raise ValueError(f"Expected {num_statements} statements, got {len(statements)}")
+            time.sleep(connector.query_latency)
+            for statement in statements:
+                self._execute(connector, statement, latency=0)
+            return self
+        self._execute(connector, sql, latency=connector.query_latency)
+        return self
+
+    def _execute(self, connector, sql, latency):
+        statement = ' '.join(sql.split()).rstrip(';')
+        connector.record(statement)
+        if connector.fail_on and re.search(connector.fail_on, statement):
+            raise RuntimeError(f"SQL compilation error (simulated): {statement[:60]}")
+
+        keyword = statement.split(' ', 1)[0].upper()
+        self.description = None
+        self._results = []
+        if keyword == 'COPY':
+            self._copy(connector, statement)
+        elif keyword == 'LIST':
+            time.sleep(latency)
+            directory = statement.split('/', 1)[1] if '/' in statement else ''
+            self.description = [(name,) for name in self.LIST_COLUMNS]
+            self._results = [
+                (f"s3://fake/processed/{directory}{name}", 1024, md5, 'Mon, 1 Jan 2024 00:00:00 GMT')
+                for name, md5 in connector.files.get(directory, {}).items()
+            ]
+        elif keyword == 'DELETE':
+            # Every fake partition holds an equal share of the table
+            time.sleep(latency)
+            table = re.search(r'FROM (\S+)', statement).group(1).split('.')[-1]
+            directory = connector.table_dirs.get(table)
+            share = len(connector.files.get(directory, {})) or 1
+            connector.add_rows(table, -(connector.rows_per_copy.get(table, 1000) // share))
+        elif keyword == 'SELECT' and 'METADATA$FILE_ROW_NUMBER = 1' in statement:
+            # Header query: first line of each file matching the PATTERN
+            time.sleep(latency)
+            directory = re.search(r'FROM @\S+?/(\S+/)', statement).group(1)
+            pattern = re.search(r"PATTERN => '\.\*\((.*)\)'", statement).group(1)
+            names = re.sub(r'\\(.)', r'\1', pattern.replace("''", "'")).split('|')
+            self.description = [('METADATA$FILENAME',), ('$1',)]
+            self._results = [
+                (f"{directory}{name}", connector.headers[directory])
+                for name in names if name in connector.files.get(directory, {})
+            ]
+        elif keyword == 'SELECT' and 'COUNT(*)' in statement.upper():
+            time.sleep(latency)
+            table = re.search(r'FROM (\S+)', statement, re.IGNORECASE).group(1).split('.')[-1]
+            self.description = [('COUNT(*)',)]
+            self._results = [(connector.table_rows.get(table, 0),)]
+        elif statement.upper().startswith('DESC STORAGE INTEGRATION'):
+            time.sleep(latency)
+            self.description = [('property',), ('property_type',), ('property_value',), ('property_default',)]
+            self._results = [
+                ('ENABLED', 'Boolean', 'true', 'false'),
+                ('STORAGE_AWS_IAM_USER_ARN', 'String', 'arn:aws:iam::123456789012:user/fake-sf-user', ''),
+                ('STORAGE_AWS_EXTERNAL_ID', 'String', 'FAKE_SFCRole=1_abc=', ''),
+            ]
+        else:
+            time.sleep(latency)
+
+    def _copy(self, connector, statement):
+        """COPY cost and rows scale with the share of the table's files loaded"""
+        table = re.search(r'COPY INTO (\S+)', statement).group(1).split('.')[-1]
+        directory = re.search(r'FROM @\S+?/(\S+/)', statement).group(1)
+        connector.table_dirs[table] = directory
+        files = re.findall(r"'([^']+)'", re.search(r'FILES = \(([^)]*)\)', statement).group(1))
+        available = connector.files.get(directory, {})
+        share = len(files) / max(len(available), 1)
+        time.sleep(connector.copy_latency * share)
+
+        table_rows = connector.rows_per_copy.get(table, 1000)
+        per_file = table_rows // max(len(available), 1)
+        connector.add_rows(table, per_file * len(files))
+        rejected = [name for name in files if name in connector.copy_errors]
+        connector.add_rows(table, -per_file * len(rejected))
+        self.description = [(name,) for name in self.COPY_COLUMNS]
+        self._results = [
+            (f"s3://fake/processed/{directory}{name}", 'LOAD_FAILED', per_file, 0, per_file, 1,
+             connector.copy_errors[name], 1)
+            if name in connector.copy_errors else
+            (f"s3://fake/processed/{directory}{name}", 'LOADED', per_file, per_file, per_file, 0, None, None)
+            for name in files
+        ]
+
+    def fetchall(self):
+        return list(self._results)
+
+    def fetchone(self):
+        return self._results[0] if self._results else None
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, connector):
+        self.connector = connector
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnector:
+    """Drop-in for the snowflake.connector module (only connect() is used).
+
+    files maps a stage directory to {relative_path: md5}; a COPY of every
+    file in a directory takes copy_latency and loads rows_per_copy[table].
+    headers maps a stage directory to the CSV header line of its files
+    (default: the declared table columns). copy_errors maps a file name to
+    the first error COPY reports for it (status LOAD_FAILED), and fail_on is
+    a regex of statements that raise, to exercise error reporting.
+    """
+
+    def __init__(self, connect_latency=0.5, query_latency=0.1, copy_latency=2.0,
+                 rows_per_copy=None, files=None, headers=None, copy_errors=None, fail_on=None):
+        self.connect_latency = connect_latency
+        self.query_latency = query_latency
+        self.copy_latency = copy_latency
+        self.rows_per_copy = rows_per_copy or {}
+        self.files = files or {
+            'DataCoSupplyChainDataset/': {'DataCoSupplyChainDataset.csv': 'orders-v1'},
+            'clickstreamDataPreparation/': {'clickstreamDataPreparation.csv': 'clickstream-v1'},
+            'clickstreamSessions/': {'clickstreamSessions.csv': 'sessions-v1'},
+        }
+        self.headers = headers or {
+            spec['table_dir']: ','.join(f'"{name}"' for name, _ in spec['columns']) for spec in TABLES.values()
+        }
+        self.copy_errors = copy_errors or {}
+        self.fail_on = fail_on
+        self.statements = []
+        self.table_rows = {}
+        self.table_dirs = {}
+        self.connections = 0
+        self.round_trips = 0
+        self.connect_kwargs = []
+        self._lock = threading.Lock()
+
+    def connect(self, **kwargs):
+        time.sleep(self.connect_latency)
+        with self._lock:
+            self.connections += 1
+            self.round_trips += 1
+            self.connect_kwargs.append(kwargs)
+        return FakeConnection(self)
+
+    def record(self, statement):
+        with self._lock:
+            self.statements.append(statement)
+
+    def round_trip(self):
+        with self._lock:
+            self.round_trips += 1
+
+    def reset_counts(self):
+        with self._lock:
+            self.statements.clear()
+            self.connections = 0
+            self.round_trips = 0
+
+    def add_rows(self, table, rows):
+        with self._lock:
+            self.table_rows[table] = self.table_rows.get(table, 0) + rows
+
+
+def partitioned_files():
+    """Stage layout written by the preparation stages with --partitioned"""
+    orders = {
+        f"orderYear={year}/orderMonth={month}/DataCoSupplyChainDataset.csv": f"orders-{year}-{month}-v1"
+        for year in (2015, 2016, 2017) for month in range(1, 13)
+    }
+    clickstream = {
+        f"sessionDate=2017-{month:02d}-{day:02d}/clickstreamDataPreparation.csv": f"clicks-{month}-{day}-v1"
+        for month in range(9, 13) for day in range(1, 29)
+    }
+    # Sessions span midnight, so clickstreamSessionization.py writes one file
+    sessions = {'clickstreamSessions.csv': 'sessions-v1'}
+    return {
+        'DataCoSupplyChainDataset/': orders,
+        'clickstreamDataPreparation/': clickstream,
+        'clickstreamSessions/': sessions,
+    }
+
+
+def print_run(label, result, connector):
+    trips = result['round_trips']
+    if trips['total'] != connector.round_trips:
+        raise AssertionError(f"{label}: loader counted {trips['total']} round trips, "
+                             f"connector saw {connector.round_trips}")
+    print(f"\n{label} ({len(connector.statements)} statements in {trips['total']} round trips: "
+          f"{trips['connects']} connects, {trips['statements']} requests)")
+    for stage, seconds in result['timings'].items():
+        print(f"   ⏱  {stage}: {seconds:.2f}s")
+
+
+def main():
+    """Time the loader sequentially vs. concurrently, then an incremental
+    rerun on the same pooled sessions after one partition changed and one
+    arrived, against the fake connector"""
+    import tempfile
+    from dataLoader import SnowflakeDataLoader
+
+    for name in ('SNOWFLAKE_ACCOUNT', 'SNOWFLAKE_USER', 'SNOWFLAKE_PASSWORD'):
+        os.environ.setdefault(name, 'fake')
+
+    rows = {'dataCoSupplyChainOrders': 180519, 'clickstreamEvents': 469977, 'clickstreamSessions': 305000}
+    runs = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, connections in (('sequential', 1), ('concurrent', 2)):
+            connector = FakeConnector(rows_per_copy=rows, files=partitioned_files())
+            loader = SnowflakeDataLoader(
+                connector=connector,
+                max_connections=connections,
+                manifest_path=os.path.join(workdir, f'{label}.json'),
+                schema_cache_path=os.path.join(workdir, f'{label}Schemas.json')
+            )
+            runs[label] = loader.run()
+            print_run(f"{label} ({connections} connection{'s' if connections > 1 else ''})",
+                      runs[label], connector)
+            if label == 'sequential':
+                loader.close()
+
+        # Next night: one month restated, one new day of clickstream
+        connector.files['DataCoSupplyChainDataset/'][
+            'orderYear=2017/orderMonth=12/DataCoSupplyChainDataset.csv'] = 'orders-2017-12-v2'
+        connector.files['clickstreamDataPreparation/'][
+            'sessionDate=2017-12-29/clickstreamDataPreparation.csv'] = 'clicks-12-29-v1'
+        connector.reset_counts()
+        runs['incremental'] = loader.run()
+        loader.close()
+        print_run("incremental (pooled sessions reused)", runs['incremental'], connector)
+        for key in ('orders', 'clickstream', 'sessions'):
+            print(f"   📦 {key}: {runs['incremental'][f'{key}_partitions']}")
+
+    speedup = runs['sequential']['timings']['total'] / runs['concurrent']['timings']['total']
+    print(f"\n✅ Speed-up: {speedup:.2f}x concurrent, "
+          f"{runs['concurrent']['timings']['total'] / runs['incremental']['timings']['total']:.2f}x incremental")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
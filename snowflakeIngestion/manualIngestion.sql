@@ -113,7 +113,25 @@ CREATE TABLE IF NOT EXISTS SUPPLYCHAINDB.RAWDATA.clickstreamEvents (
     pageType VARCHAR(50),
     sessionID VARCHAR(200),
     isWeekend VARCHAR(10),
-    timeOfDay VARCHAR(20)
+    timeOfDay VARCHAR(20),
+    departmentId INT,
+    categoryId INT,
+    productId INT
+);
+
+-- Create Clickstream Sessions table (dataPreparation/clickstreamSessionization.py)
+CREATE TABLE IF NOT EXISTS SUPPLYCHAINDB.RAWDATA.clickstreamSessions (
+    sessionId VARCHAR(200),
+    ip VARCHAR(50),
+    sessionDate DATE,
+    sessionStart TIMESTAMP_NTZ,
+    sessionEnd TIMESTAMP_NTZ,
+    durationMinutes INT,
+    eventCount INT,
+    pageViews INT,
+    cartAdds INT,
+    distinctProducts INT,
+    isConverted INT
 );
 
 -- Load Supply Chain Orders from S3
@@ -130,6 +148,22 @@ STORAGE_INTEGRATION = supplyChainS3Integration
 FILE_FORMAT = SUPPLYCHAINDB.RAWDATA.csv_format_clickstream
 ON_ERROR = 'CONTINUE';
 
+-- Load Clickstream Sessions from S3 (same date/timestamp formats as the events)
+COPY INTO SUPPLYCHAINDB.RAWDATA.clickstreamSessions
+FROM 's3://dataco-supply-chain-analytics/processed/clickstreamSessions/clickstreamSessions.csv'
+STORAGE_INTEGRATION = supplyChainS3Integration
+FILE_FORMAT = SUPPLYCHAINDB.RAWDATA.csv_format_clickstream
+ON_ERROR = 'CONTINUE';
+
+-- Alternative: Parquet from parquetConverter.py, matched by column name
+-- CREATE FILE FORMAT IF NOT EXISTS SUPPLYCHAINDB.RAWDATA.parquet_format TYPE = PARQUET;
+-- COPY INTO SUPPLYCHAINDB.RAWDATA.dataCoSupplyChainOrders
+-- FROM 's3://dataco-supply-chain-analytics/processed/DataCoSupplyChainDataset/DataCoSupplyChainDataset.parquet'
+-- STORAGE_INTEGRATION = supplyChainS3Integration
+-- FILE_FORMAT = SUPPLYCHAINDB.RAWDATA.parquet_format
+-- MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+-- ON_ERROR = 'CONTINUE';
+
 -- Verify data loaded
 SELECT 
     'Orders' AS table_name,
@@ -139,7 +173,12 @@ UNION ALL
 SELECT 
     'Clickstream' AS table_name,
     COUNT(*) AS row_count
-FROM SUPPLYCHAINDB.RAWDATA.clickstreamEvents;
+FROM SUPPLYCHAINDB.RAWDATA.clickstreamEvents
+UNION ALL
+SELECT 
+    'Sessions' AS table_name,
+    COUNT(*) AS row_count
+FROM SUPPLYCHAINDB.RAWDATA.clickstreamSessions;
 
 -- Sample queries to verify data
 SELECT 
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+CSV → Parquet Converter
+Streams the processed CSVs into typed Parquet whose schema is generated from
+the raw table definitions (tableSchemas.py), so the loader can COPY with
+MATCH_BY_COLUMN_NAME instead of positional CSV mapping.
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+from tableSchemas import TABLES, strptime_format
+from schemaInference import local_columns
+
+
+def arrow_type(column_type):
+    """Arrow type for a Snowflake column type from the DDL"""
+    column_type = column_type.upper()
+    if column_type in ('INT', 'INTEGER', 'BIGINT', 'NUMBER'):
+        return pa.int64()
+    if column_type in ('FLOAT', 'DOUBLE', 'REAL'):
+        return pa.float64()
+    if column_type.startswith('TIMESTAMP'):
+        return pa.timestamp('us')
+    if column_type == 'DATE':
+        return pa.date32()
+    return pa.string()
+
+
+def arrow_schema(table, path=None):
+    """Parquet schema for a raw table: column names and types in file order,
+    from path's CSV header (default: the declared columns)"""
+    columns = local_columns(path, table) if path else TABLES[table]['columns']
+    return pa.schema([(name, arrow_type(column_type)) for name, column_type in columns])
+
+
+class ParquetConverter:
+    """Convert processed CSVs to Parquet one row group at a time"""
+
+    DEFAULT_ROW_GROUP_ROWS = 250_000
+    READ_BLOCK_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, row_group_rows=None, compression='snappy'):
+        if pa is None:
+            raise ImportError("pyarrow not installed: pip install pyarrow")
+        self.row_group_rows = row_group_rows or self.DEFAULT_ROW_GROUP_ROWS
+        self.compression = None if compression == 'none' else compression
+
+    @staticmethod
+    def _source_files(source, filename):
+        """Every copy of filename under source (single file or partitioned layout)"""
+        source = Path(source)
+        direct = source / filename
+        if direct.exists():
+            return [direct]
+        return sorted(source.rglob(filename))
+
+    def _reader(self, path, table):
+        """Streaming CSV reader with the table's types. Timestamps and dates are
+        read as strings and parsed per batch with the file format's pattern."""
+        schema = arrow_schema(table, path)
+        column_types = {
+            field.name: pa.string() if pa.types.is_temporal(field.type) else field.type
+            for field in schema
+        }
+        return pa_csv.open_csv(
+            str(path),
+            read_options=pa_csv.ReadOptions(
+                column_names=schema.names,
+                skip_rows=1,  # SKIP_HEADER = 1
+                block_size=self.READ_BLOCK_BYTES
+            ),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            # Empty fields load as NULL, as with EMPTY_FIELD_AS_NULL on the CSV path
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                null_values=[''],
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=True
+            )
+        )
+
+    def read_typed(self, path, table):
+        """Yield record batches of path with the table's Parquet schema"""
+        schema = arrow_schema(table, path)
+        for batch in self._reader(path, table):
+            yield self._typed_batch(batch, table, schema)
+
+    @staticmethod
+    def _typed_batch(batch, table, schema):
+        spec = TABLES[table]
+        arrays = []
+        for field, values in zip(schema, batch.columns):
+            if pa.types.is_timestamp(field.type):
+                values = pc.strptime(values, format=strptime_format(spec['timestamp_format']), unit='us')
+            elif pa.types.is_date(field.type):
+                values = pc.cast(pc.strptime(values, format=strptime_format(spec['date_format']), unit='s'), pa.date32())
+            arrays.append(values)
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def convert_file(self, source, destination, table):
+        """Convert one CSV; returns {'rows', 'row_groups', 'csv_bytes', 'parquet_bytes', 'seconds'}"""
+        source = Path(source)
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        schema = arrow_schema(table, source)
+
+        start = time.perf_counter()
+        rows = 0
+        pending = []
+        pending_rows = 0
+        try:
+            with pq.ParquetWriter(str(destination), schema, compression=self.compression) as writer:
+                # Batches are buffered up to one row group and written in
+                # exact row_group_rows slices, so memory stays bounded by one
+                # row group regardless of file size
+                for batch in self.read_typed(source, table):
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    if pending_rows >= self.row_group_rows:
+                        buffered = pa.Table.from_batches(pending, schema)
+                        full = pending_rows - pending_rows % self.row_group_rows
+                        writer.write_table(buffered.slice(0, full), row_group_size=self.row_group_rows)
+                        rows += full
+                        pending = buffered.slice(full).to_batches()
+                        pending_rows -= full
+                if pending_rows:
+                    writer.write_table(pa.Table.from_batches(pending, schema), row_group_size=self.row_group_rows)
+                    rows += pending_rows
+        except pa.ArrowInvalid as e:
+            destination.unlink(missing_ok=True)
+            raise ValueError(
+                f"{source}: {e} (run dataValidator.py to find and quarantine the bad rows)"
+            ) from e
+
+        return {
+            'rows': rows,
+            'row_groups': pq.ParquetFile(str(destination)).metadata.num_row_groups,
+            'csv_bytes': source.stat().st_size,
+            'parquet_bytes': destination.stat().st_size,
+            'seconds': round(time.perf_counter() - start, 3),
+        }
+
+    def run(self, source, output, tables=None):
+        """Convert every table file under source into output, mirroring the
+        directory layout (partitions included) with .parquet names"""
+        source = Path(source)
+        output = Path(output)
+        result = {}
+        for table in tables or TABLES:
+            files = self._source_files(source, TABLES[table]['file'])
+            if not files:
+                continue
+            totals = {'files': 0, 'rows': 0, 'row_groups': 0, 'csv_bytes': 0, 'parquet_bytes': 0, 'seconds': 0.0}
+            for path in files:
+                destination = output / path.relative_to(source).with_suffix('.parquet')
+                converted = self.convert_file(path, destination, table)
+                totals['files'] += 1
+                for key in ('rows', 'row_groups', 'csv_bytes', 'parquet_bytes', 'seconds'):
+                    totals[key] += converted[key]
+            totals['seconds'] = round(totals['seconds'], 3)
+            result[table] = totals
+        return result
+
+    def benchmark(self, source, output, tables=None):
+        """Convert, then time a full typed scan of the CSVs (the work every
+        CSV load repeats) against the same scan of the Parquet output"""
+        result = self.run(source, output, tables)
+        source = Path(source)
+        output = Path(output)
+        for table, totals in result.items():
+            csv_seconds = 0.0
+            parquet_seconds = 0.0
+            for path in self._source_files(source, TABLES[table]['file']):
+                start = time.perf_counter()
+                for _ in self.read_typed(path, table):
+                    pass
+                csv_seconds += time.perf_counter() - start
+
+                start = time.perf_counter()
+                parquet_file = pq.ParquetFile(str(output / path.relative_to(source).with_suffix('.parquet')))
+                for _ in parquet_file.iter_batches():
+                    pass
+                parquet_seconds += time.perf_counter() - start
+            totals['csv_scan_seconds'] = round(csv_seconds, 3)
+            totals['parquet_scan_seconds'] = round(parquet_seconds, 3)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Convert processed CSVs to typed Parquet for MATCH_BY_COLUMN_NAME loading',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python parquetConverter.py -s ../localData/processed -o ../localData/parquet
+  python parquetConverter.py -s ../localData/processed -o ../localData/parquet --compression zstd
+  python parquetConverter.py -s ../localData/processed -o /tmp/parquet --benchmark   # Size + throughput vs. CSV
+        """
+    )
+    parser.add_argument('-s', '--source', type=str, required=True, help='Processed CSV directory (single or partitioned)')
+    parser.add_argument('-o', '--output', type=str, required=True, help='Parquet output directory')
+    parser.add_argument('-t', '--table', choices=list(TABLES), action='append', default=None,
+                        help='Only convert this table (repeatable; default: all found)')
+    parser.add_argument('--row-group-rows', type=int, default=ParquetConverter.DEFAULT_ROW_GROUP_ROWS,
+                        help=f'Rows per row group (default: {ParquetConverter.DEFAULT_ROW_GROUP_ROWS:,})')
+    parser.add_argument('--compression', choices=['snappy', 'zstd', 'gzip', 'none'], default='snappy',
+                        help='Parquet compression codec (default: snappy)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Also time a full typed scan of the CSV and the Parquet output')
+
+    args = parser.parse_args()
+
+    converter = ParquetConverter(args.row_group_rows, args.compression)
+    if args.benchmark:
+        result = converter.benchmark(args.source, args.output, args.table)
+    else:
+        result = converter.run(args.source, args.output, args.table)
+    if not result:
+        print(f"❌ No table files found under {args.source}")
+        return 1
+
+    for table, totals in result.items():
+        csv_mb = totals['csv_bytes'] / 1e6
+        parquet_mb = totals['parquet_bytes'] / 1e6
+        print(f"✅ {table}: {totals['rows']:,} rows, {totals['files']} files, {totals['row_groups']} row groups")
+        print(f"   CSV {csv_mb:,.1f} MB → Parquet {parquet_mb:,.1f} MB ({parquet_mb / max(csv_mb, 1e-9):.1%} of CSV)")
+        print(f"   ⏱  convert: {totals['seconds']:.2f}s ({csv_mb / max(totals['seconds'], 1e-9):,.0f} MB/s of CSV)")
+        if 'csv_scan_seconds' in totals:
+            print(f"   ⏱  typed scan: CSV {totals['csv_scan_seconds']:.2f}s, Parquet {totals['parquet_scan_seconds']:.2f}s "
+                  f"({totals['csv_scan_seconds'] / max(totals['parquet_scan_seconds'], 1e-9):.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
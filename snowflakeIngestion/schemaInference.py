@@ -0,0 +1,163 @@
+"""
+Schema Inference
+Derives a raw table's columns from the processed CSV header alone: header
+names are mapped to camelCase table columns and typed from tableSchemas.
+Headers are cached per file fingerprint, so files seen before are never
+re-read, and identical headers across partitions are mapped only once.
+"""
+import io
+import os
+import re
+import csv
+import json
+import threading
+from functools import lru_cache
+
+from tableSchemas import TABLES
+
+# Source headers whose camelCase form is not the table column
+HEADER_OVERRIDES = {
+    'order date (DateOrders)': 'orderDate',
+    'shipping date (DateOrders)': 'shippingDate',
+    # clickstreamPreparation.py keeps Alteryx's doubled label for this field
+    'eventDayOfWeekeventDayOfWeek': 'eventDayOfWeek',
+}
+
+# Type for header columns tableSchemas does not declare (e.g. a new derived field)
+DEFAULT_TYPE = 'VARCHAR'
+
+
+@lru_cache(maxsize=None)
+def to_camel_case(name):
+    """Convert a CSV header name to its camelCase column name.
+
+    'Days for shipping (real)' → 'daysForShippingReal', 'Late_delivery_risk'
+    → 'lateDeliveryRisk'. Names that are already camelCase ('sessionID',
+    'profitMarginPct') keep their inner capitals.
+    """
+    name = name.strip('"').strip()
+    if name in HEADER_OVERRIDES:
+        return HEADER_OVERRIDES[name]
+    parts = [part for part in re.split(r'[\s_()\-/.]+', name) if part]
+    if not parts:
+        raise ValueError(f"Cannot derive a column name from header {name!r}")
+    first = parts[0].lower() if parts[0].isupper() else parts[0][0].lower() + parts[0][1:]
+    return first + ''.join(part[0].upper() + part[1:] for part in parts[1:])
+
+
+def parse_header(line):
+    """Header names from the first line of a CSV (str or bytes)"""
+    if isinstance(line, bytes):
+        line = line.decode('utf-8-sig')
+    return next(csv.reader(io.StringIO(line.lstrip('\ufeff').rstrip('\r\n'))), [])
+
+
+def read_local_header(path):
+    """Header names of a local CSV, reading only its first line"""
+    with open(path, 'rb') as f:
+        return parse_header(f.readline())
+
+
+@lru_cache(maxsize=None)
+def header_columns(table, header):
+    """(column, type) pairs for a header tuple, in file order"""
+    declared = dict(TABLES[table]['columns'])
+    columns = tuple((column, declared.get(column, DEFAULT_TYPE)) for column in map(to_camel_case, header))
+    names = [column for column, _ in columns]
+    duplicates = sorted({column for column in names if names.count(column) > 1})
+    if duplicates:
+        raise ValueError(f"{table}: header maps several fields to {', '.join(duplicates)}")
+    return columns
+
+
+class SchemaCache:
+    """Headers seen per table and file fingerprint, plus the columns each table
+    has been given, persisted as JSON:
+    {table: {"files": {fingerprint: [header names]}, "columns": [names]}}.
+
+    With no path the cache lives in memory only.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.reads = 0
+        self._lock = threading.Lock()
+        self._tables = {}
+        if path:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._tables = json.load(f)
+            except FileNotFoundError:
+                pass
+
+    def _table(self, table):
+        return self._tables.setdefault(table, {'files': {}, 'columns': []})
+
+    def known(self, table, fingerprint):
+        with self._lock:
+            return fingerprint in self._table(table)['files']
+
+    def header(self, table, fingerprint, read):
+        """Header for a file fingerprint, calling read() only on a miss"""
+        with self._lock:
+            known = self._table(table)['files'].get(fingerprint)
+        if known is not None:
+            return tuple(known)
+        header = tuple(read())
+        with self._lock:
+            self._table(table)['files'][fingerprint] = list(header)
+            self.reads += 1
+        return header
+
+    def columns(self, table, files, read):
+        """Group files by inferred columns.
+
+        files maps a name to its fingerprint; read(name) returns the file's
+        header. Returns {columns: [names]} with columns as (column, type) tuples.
+        """
+        groups = {}
+        for name in sorted(files):
+            header = self.header(table, files[name], lambda: read(name))
+            groups.setdefault(header_columns(table, header), []).append(name)
+        return groups
+
+    def applied(self, table):
+        """Columns the table was last created or extended with"""
+        with self._lock:
+            return list(self._table(table)['columns'])
+
+    def record_applied(self, table, columns):
+        with self._lock:
+            self._table(table)['columns'] = list(columns)
+
+    def prune(self, table, fingerprints):
+        """Forget headers of files no longer present"""
+        with self._lock:
+            files = self._table(table)['files']
+            for fingerprint in set(files) - set(fingerprints):
+                del files[fingerprint]
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._tables, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+
+def local_fingerprint(path):
+    """Cheap change marker for a local file (no content read)"""
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}-{stat.st_mtime_ns}"
+
+
+# Headers of local files read in this process
+_local_headers = SchemaCache()
+
+
+def local_columns(path, table):
+    """Columns of a local CSV, from its header (read once per fingerprint)"""
+    header = _local_headers.header(table, local_fingerprint(path), lambda: read_local_header(path))
+    return header_columns(table, header)
@@ -0,0 +1,233 @@
+"""
+Snowflake Session
+Shared connection layer for the loader and the Terraform helper: connection
+settings from the environment (password or key-pair authentication), a
+bounded pool of kept-alive connections, and sessions that reuse one cursor,
+send DDL as multi-statement batches and count round trips.
+"""
+import os
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import snowflake.connector
+except ImportError:
+    snowflake = None
+
+
+def connection_settings(database=None):
+    """connect() keyword arguments from the SNOWFLAKE_* environment variables.
+
+    SNOWFLAKE_PRIVATE_KEY_PATH (with SNOWFLAKE_PRIVATE_KEY_PASSPHRASE for an
+    encrypted key; '~' is expanded) selects key-pair authentication; otherwise
+    SNOWFLAKE_PASSWORD is used. Sessions are kept alive by default
+    (SNOWFLAKE_KEEP_ALIVE=false to disable), so pooled connections survive
+    idle periods between loads.
+    """
+    account = os.getenv('SNOWFLAKE_ACCOUNT')
+    user = os.getenv('SNOWFLAKE_USER')
+    password = os.getenv('SNOWFLAKE_PASSWORD')
+    private_key_path = os.getenv('SNOWFLAKE_PRIVATE_KEY_PATH')
+
+    if not all([account, user]) or not (password or private_key_path):
+        raise ValueError(
+            "SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER and SNOWFLAKE_PASSWORD (or SNOWFLAKE_PRIVATE_KEY_PATH) required"
+        )
+
+    settings = {
+        'account': account,
+        'user': user,
+        'warehouse': os.getenv('SNOWFLAKE_WAREHOUSE', 'COMPUTE_WH'),
+        'client_session_keep_alive': os.getenv('SNOWFLAKE_KEEP_ALIVE', 'true').lower() != 'false',
+    }
+    role = os.getenv('SNOWFLAKE_ROLE')
+    if role:
+        settings['role'] = role
+    if database:
+        settings['database'] = database
+    if private_key_path:
+        # The connector opens the path as is, so expand '~/.ssh/...' here
+        private_key_path = os.path.expanduser(private_key_path)
+        if not os.path.isfile(private_key_path):
+            raise FileNotFoundError(f"SNOWFLAKE_PRIVATE_KEY_PATH: no such file: {private_key_path}")
+        settings['private_key_file'] = private_key_path
+        passphrase = os.getenv('SNOWFLAKE_PRIVATE_KEY_PASSPHRASE')
+        if passphrase:
+            settings['private_key_file_pwd'] = passphrase
+    else:
+        settings['password'] = password
+    return settings
+
+
+class RoundTrips:
+    """Thread-safe count of requests sent to Snowflake (logins and statements)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.statements = 0
+        self.batched = 0
+
+    def add(self, connects=0, statements=0, batched=0):
+        with self._lock:
+            self.connects += connects
+            self.statements += statements
+            self.batched += batched
+
+    def report(self):
+        """{connects, statements, batched, total}: batched statements share the
+        round trip of their batch"""
+        with self._lock:
+            return {
+                'connects': self.connects,
+                'statements': self.statements,
+                'batched': self.batched,
+                'total': self.connects + self.statements,
+            }
+
+
+class Session:
+    """One pooled connection and the cursor every statement on it reuses"""
+
+    def __init__(self, conn, round_trips):
+        self.conn = conn
+        self.round_trips = round_trips
+        self._cursor = None
+
+    @property
+    def cursor(self):
+        if self._cursor is None:
+            self._cursor = self.conn.cursor()
+        return self._cursor
+
+    def execute(self, sql):
+        """Run one statement; returns the cursor for fetchall()/description"""
+        self.round_trips.add(statements=1)
+        return self.cursor.execute(sql)
+
+    def execute_batch(self, statements):
+        """Run statements in order as one multi-statement request.
+
+        Only for statements whose results are not needed (DDL, DELETE): the
+        whole batch is a single round trip and fails on its first error.
+        """
+        statements = [statement.strip().rstrip(';').strip() for statement in statements if statement.strip()]
+        if not statements:
+            return None
+        if len(statements) == 1:
+            return self.execute(statements[0])
+        self.round_trips.add(statements=1, batched=len(statements))
+        return self.cursor.execute(';\n'.join(statements) + ';', num_statements=len(statements))
+
+    def close(self):
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+
+
+class ConnectionPool:
+    """Lazily opened, bounded pool of connections shared across threads.
+
+    Connections are kept between borrowings (and between loader runs while
+    the pool is open); one found closed, e.g. after its session expired, is
+    replaced on checkout. A connect that fails frees its slot again, and a
+    borrower waiting longer than timeout seconds for a connection gets a
+    TimeoutError instead of blocking forever.
+    """
+
+    DEFAULT_TIMEOUT = 600
+
+    def __init__(self, factory, size, round_trips=None, timeout=DEFAULT_TIMEOUT):
+        self._factory = factory
+        self._size = size
+        self._timeout = timeout
+        self.round_trips = round_trips or RoundTrips()
+        self._idle = deque()
+        self._opened = []
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+    def _open(self):
+        conn = self._factory()
+        self.round_trips.add(connects=1)
+        return conn
+
+    @staticmethod
+    def _is_closed(conn):
+        is_closed = getattr(conn, 'is_closed', None)
+        return bool(is_closed()) if callable(is_closed) else False
+
+    def _checkout(self):
+        """An idle connection, or None after reserving a slot for a new one"""
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.popleft()
+                if len(self._opened) < self._size:
+                    self._opened.append(None)
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No Snowflake connection free after {self._timeout}s ({self._size} in use)")
+                self._available.wait(remaining)
+
+    def _replace(self, old):
+        """Open a connection into old's slot (None for a reserved one); on
+        failure the slot is freed so waiting borrowers can open their own"""
+        try:
+            conn = self._open()
+        except BaseException:
+            with self._available:
+                self._opened.remove(old)
+                self._available.notify()
+            raise
+        with self._available:
+            self._opened[self._opened.index(old)] = conn
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, opening a new one while under the size limit"""
+        conn = self._checkout()
+        if conn is None or self._is_closed(conn):
+            conn = self._replace(conn)
+        try:
+            yield conn
+        finally:
+            with self._available:
+                if conn in self._opened:  # Not closed with the pool meanwhile
+                    self._idle.append(conn)
+                    self._available.notify()
+
+    @contextmanager
+    def session(self):
+        """Borrow a connection as a Session (one cursor for all its statements)"""
+        with self.connection() as conn:
+            session = Session(conn, self.round_trips)
+            try:
+                yield session
+            finally:
+                session.close()
+
+    def close(self):
+        with self._available:
+            opened, self._opened = self._opened, []
+            self._idle = deque()
+            self._available.notify_all()
+        for conn in opened:
+            if conn is not None:
+                conn.close()
+
+
+def connect(connector=None, database=None, round_trips=None):
+    """Single Session for one-off scripts; close it with session.conn.close()"""
+    connector = connector or (snowflake.connector if snowflake else None)
+    if connector is None:
+        raise ImportError("snowflake-connector-python not installed: pip install snowflake-connector-python")
+    round_trips = round_trips or RoundTrips()
+    conn = connector.connect(**connection_settings(database))
+    round_trips.add(connects=1)
+    return Session(conn, round_trips)
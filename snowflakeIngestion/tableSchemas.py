@@ -0,0 +1,157 @@
+"""
+Raw Table Schemas
+Column definitions for the RAWDATA tables, in file order. The columns a
+file loads into are read from its CSV header (schemaInference.py); these
+definitions supply their types and the layout when no header is available.
+"""
+
+ORDERS_COLUMNS = [
+    ("type", "VARCHAR(50)"),
+    ("daysForShippingReal", "INT"),
+    ("daysForShipmentScheduled", "INT"),
+    ("benefitPerOrder", "FLOAT"),
+    ("salesPerCustomer", "FLOAT"),
+    ("deliveryStatus", "VARCHAR(50)"),
+    ("lateDeliveryRisk", "INT"),
+    ("categoryId", "INT"),
+    ("categoryName", "VARCHAR(100)"),
+    ("customerCity", "VARCHAR(100)"),
+    ("customerCountry", "VARCHAR(100)"),
+    ("customerFname", "VARCHAR(100)"),
+    ("customerId", "INT"),
+    ("customerLname", "VARCHAR(100)"),
+    ("customerSegment", "VARCHAR(50)"),
+    ("customerState", "VARCHAR(100)"),
+    ("customerStreet", "VARCHAR(200)"),
+    ("customerZipcode", "VARCHAR(20)"),
+    ("departmentId", "INT"),
+    ("departmentName", "VARCHAR(100)"),
+    ("latitude", "FLOAT"),
+    ("longitude", "FLOAT"),
+    ("market", "VARCHAR(50)"),
+    ("orderCity", "VARCHAR(100)"),
+    ("orderCountry", "VARCHAR(100)"),
+    ("orderCustomerId", "INT"),
+    ("orderDate", "TIMESTAMP_NTZ"),
+    ("orderId", "INT"),
+    ("orderItemCardprodId", "INT"),
+    ("orderItemDiscount", "FLOAT"),
+    ("orderItemDiscountRate", "FLOAT"),
+    ("orderItemId", "INT"),
+    ("orderItemProductPrice", "FLOAT"),
+    ("orderItemProfitRatio", "FLOAT"),
+    ("orderItemQuantity", "INT"),
+    ("sales", "FLOAT"),
+    ("orderItemTotal", "FLOAT"),
+    ("orderProfitPerOrder", "FLOAT"),
+    ("orderRegion", "VARCHAR(50)"),
+    ("orderState", "VARCHAR(100)"),
+    ("orderStatus", "VARCHAR(50)"),
+    ("orderZipcode", "VARCHAR(20)"),
+    ("productCardId", "INT"),
+    ("productCategoryId", "INT"),
+    ("productImage", "VARCHAR(200)"),
+    ("productName", "VARCHAR(200)"),
+    ("productPrice", "FLOAT"),
+    ("shippingDate", "TIMESTAMP_NTZ"),
+    ("shippingMode", "VARCHAR(50)"),
+    ("profitMarginPct", "FLOAT"),
+    ("profitCategory", "VARCHAR(50)"),
+    ("deliveryDelay", "INT"),
+    ("orderYear", "INT"),
+    ("orderMonth", "INT"),
+    ("orderQuarter", "VARCHAR(10)"),
+    ("orderDayOfWeek", "VARCHAR(20)"),
+    ("orderHour", "INT"),
+    ("isLate", "INT"),
+]
+
+CLICKSTREAM_COLUMNS = [
+    ("product", "VARCHAR(200)"),
+    ("category", "VARCHAR(100)"),
+    ("date", "TIMESTAMP_NTZ"),
+    ("month", "VARCHAR(10)"),
+    ("hour", "INT"),
+    ("department", "VARCHAR(100)"),
+    ("ip", "VARCHAR(50)"),
+    ("url", "VARCHAR(500)"),
+    ("eventYear", "INT"),
+    ("eventMonth", "INT"),
+    ("eventQuarter", "VARCHAR(10)"),
+    ("eventDayOfWeek", "VARCHAR(20)"),
+    ("eventHourOfDay", "INT"),
+    ("isCartAdd", "VARCHAR(10)"),
+    ("eventType", "VARCHAR(50)"),
+    ("sessionDate", "DATE"),
+    ("pageType", "VARCHAR(50)"),
+    ("sessionID", "VARCHAR(200)"),
+    ("isWeekend", "VARCHAR(10)"),
+    ("timeOfDay", "VARCHAR(20)"),
+    # Resolved from the URL by dataPreparation/urlParsing.py (empty when unmatched)
+    ("departmentId", "INT"),
+    ("categoryId", "INT"),
+    ("productId", "INT"),
+]
+
+SESSIONS_COLUMNS = [
+    ("sessionId", "VARCHAR(200)"),
+    ("ip", "VARCHAR(50)"),
+    ("sessionDate", "DATE"),
+    ("sessionStart", "TIMESTAMP_NTZ"),
+    ("sessionEnd", "TIMESTAMP_NTZ"),
+    ("durationMinutes", "INT"),
+    ("eventCount", "INT"),
+    ("pageViews", "INT"),
+    ("cartAdds", "INT"),
+    ("distinctProducts", "INT"),
+    ("isConverted", "INT"),
+]
+
+# Snowflake format tokens → strptime directives (longest tokens first)
+FORMAT_TOKENS = [('YYYY', '%Y'), ('HH24', '%H'), ('MM', '%m'), ('DD', '%d'), ('MI', '%M'), ('SS', '%S')]
+
+# Per-table load settings: file name and stage directory written by the
+# preparation stages, and the formats the CSV file format parses with
+TABLES = {
+    'dataCoSupplyChainOrders': {
+        'columns': ORDERS_COLUMNS,
+        'file': 'DataCoSupplyChainDataset.csv',
+        'table_dir': 'DataCoSupplyChainDataset/',
+        'date_format': 'MM/DD/YYYY HH24:MI',
+        'timestamp_format': 'MM/DD/YYYY HH24:MI',
+    },
+    'clickstreamEvents': {
+        'columns': CLICKSTREAM_COLUMNS,
+        'file': 'clickstreamDataPreparation.csv',
+        'table_dir': 'clickstreamDataPreparation/',
+        'date_format': 'YYYY-MM-DD',
+        'timestamp_format': 'MM/DD/YYYY HH24:MI',
+    },
+    # Written by dataPreparation/clickstreamSessionization.py
+    'clickstreamSessions': {
+        'columns': SESSIONS_COLUMNS,
+        'file': 'clickstreamSessions.csv',
+        'table_dir': 'clickstreamSessions/',
+        'date_format': 'YYYY-MM-DD',
+        'timestamp_format': 'MM/DD/YYYY HH24:MI',
+    },
+}
+
+
+def column_list(columns):
+    """Comma-separated column names for COPY INTO (...)"""
+    return ', '.join(name for name, _ in columns)
+
+
+def create_table_sql(qualified_name, columns):
+    """CREATE TABLE IF NOT EXISTS statement for the given columns"""
+    body = ',\n    '.join(f"{name} {column_type}" for name, column_type in columns)
+    return f"CREATE TABLE IF NOT EXISTS {qualified_name} (\n    {body}\n);"
+
+
+def strptime_format(snowflake_format):
+    """'MM/DD/YYYY HH24:MI' → '%m/%d/%Y %H:%M'"""
+    result = snowflake_format
+    for token, directive in FORMAT_TOKENS:
+        result = result.replace(token, directive)
+    return result
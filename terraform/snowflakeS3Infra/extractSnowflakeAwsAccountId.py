@@ -5,44 +5,36 @@ Extract Snowflake AWS Account ID from Storage Integration
 Connects to Snowflake and extracts the AWS account ID embedded in the
 storage integration's IAM user ARN. This is useful when documentation
 shows generic account IDs that don't match your actual Snowflake account.
+
+Connects through the shared session layer in snowflakeIngestion/, so the
+same password or key-pair settings as the loader apply.
 """
 import os
 import re
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'snowflakeIngestion'))
+from snowflakeSession import connect, snowflake  # noqa: E402
 
-try:
-    import snowflake.connector
-except ImportError:
-    print("❌ snowflake-connector-python not installed")
-    print("   Install: pip install snowflake-connector-python")
-    sys.exit(1)
 
+def extract_account_id(connector=None):
+    """Extract AWS account ID from Snowflake storage integration IAM user ARN.
 
-def extract_account_id():
-    """Extract AWS account ID from Snowflake storage integration IAM user ARN."""
-    account = os.getenv('SNOWFLAKE_ACCOUNT')
-    user = os.getenv('SNOWFLAKE_USER')
-    password = os.getenv('SNOWFLAKE_PASSWORD')
-    warehouse = os.getenv('SNOWFLAKE_WAREHOUSE', 'COMPUTE_WH')
+    connector defaults to snowflake.connector (fakeConnector.FakeConnector for tests).
+    """
     database = os.getenv('SNOWFLAKE_DATABASE', 'SUPPLYCHAINDB')
     integration = os.getenv('SNOWFLAKE_STORAGE_INTEGRATION', 'supplyChainS3Integration')
 
-    if not all([account, user, password]):
-        print("❌ Required environment variables: SNOWFLAKE_ACCOUNT, SNOWFLAKE_USER, SNOWFLAKE_PASSWORD")
+    if connector is None and snowflake is None:
+        print("❌ snowflake-connector-python not installed")
+        print("   Install: pip install snowflake-connector-python")
         return None
 
+    session = None
     try:
-        conn = snowflake.connector.connect(
-            user=user,
-            password=password,
-            account=account,
-            warehouse=warehouse,
-            database=database
-        )
-        cursor = conn.cursor()
-
-        cursor.execute(f"DESC STORAGE INTEGRATION {integration}")
-        results = cursor.fetchall()
+        session = connect(connector, database=database)
+        results = session.execute(f"DESC STORAGE INTEGRATION {integration}").fetchall()
 
         iam_user_arn = None
         external_id = None
@@ -73,13 +65,17 @@ def extract_account_id():
             print(f"❌ STORAGE_AWS_IAM_USER_ARN not found")
             print(f"   Verify: DESC STORAGE INTEGRATION {integration};")
 
-        cursor.close()
-        conn.close()
-
+    except ValueError as e:
+        print(f"❌ Required environment variables: {e}")
+        return None
     except Exception as e:
         print(f"❌ Error: {e}")
         return None
+    finally:
+        if session is not None:
+            session.close()
+            session.conn.close()
 
 
 if __name__ == "__main__":
-    extract_account_id()
+    sys.exit(0 if extract_account_id() else 1)